@@ -0,0 +1,41 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Add BAI counter table"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d3c9a1e4b27"
+down_revision = "9cb847f41e76"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "inspire_pidstore_bai_counter",
+        sa.Column("prefix", sa.String(length=255), nullable=False),
+        sa.Column("last_number", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("prefix", name=op.f("pk_inspire_pidstore_bai_counter")),
+    )
+    op.execute(
+        r"""
+        INSERT INTO inspire_pidstore_bai_counter (prefix, last_number)
+        SELECT substring(pid_value FROM '^(.*\.)\d+$'),
+            max(substring(pid_value FROM '\.(\d+)$')::integer)
+        FROM pidstore_pid
+        WHERE pid_type = 'bai' AND pid_value ~ '^.*\.\d+$'
+        GROUP BY 1
+        """
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("inspire_pidstore_bai_counter")
@@ -0,0 +1,37 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Add citation_date index to records_citations"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9cb847f41e76"
+down_revision = "41e81f8ee63a"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        "ix_records_citations_cited_id_citation_date",
+        "records_citations",
+        [
+            "cited_id",
+            sa.text("citation_date DESC NULLS LAST"),
+            sa.text("citer_id DESC"),
+        ],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        "ix_records_citations_cited_id_citation_date", table_name="records_citations"
+    )
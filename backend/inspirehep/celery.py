@@ -18,6 +18,7 @@ from psycopg2 import OperationalError as Psycopg2OperationalError
 from sqlalchemy.exc import InvalidRequestError, OperationalError
 
 from inspirehep.factory import create_app
+from inspirehep.redis_client import reset_redis_connection_pools
 
 LOGGER = structlog.getLogger()
 
@@ -75,3 +76,9 @@ def setup_metrics_server(*args, **kwargs):
             port=port,
             host=host,
         )
+
+
+@worker_process_init.connect()
+def reset_redis_connections(*args, **kwargs):
+    """Make sure forked worker processes don't share Redis sockets."""
+    reset_redis_connection_pools()
@@ -213,6 +213,10 @@ DEBUG_TB_INTERCEPT_REDIRECTS = False
 # ========
 PIDSTORE_RECID_FIELD = "control_number"
 PIDSTORE_APP_LOGGER_HANDLERS = False
+#: Number of control numbers each process reserves at once from the sequence.
+PIDSTORE_RECID_BLOCK_SIZE = 10
+#: Timeout (in seconds) of the requests reserving control numbers on legacy.
+LEGACY_PID_PROVIDER_TIMEOUT = 10
 
 # Invenio-App
 # ===========
@@ -274,9 +278,22 @@ EDITOR_LOCK_EXPIRATION_TIME = 2 * 60
 
 SUBJECT_MISSING_VALUE = "Unknown"
 
+# Curation
+#: How long (in seconds) a raw affiliation normalization is cached.
+CURATION_AFFILIATIONS_CACHE_TIMEOUT = 24 * 60 * 60
+#: Maximum number of raw affiliations matched in a single multi search.
+CURATION_AFFILIATIONS_MSEARCH_CHUNK_SIZE = 100
+
 # fulltext
 ES_FULLTEXT_PIPELINE_NAME = "file_content"
 ES_FULLTEXT_MAX_BULK_CHUNK_SIZE = 500 * 1014 * 1024  # 500 MiB
 
 # cache
 CACHE_TYPE = "RedisCache"
+
+# Redis
+#: Maximum number of connections kept by the per-process Redis pool.
+REDIS_CONNECTION_POOL_MAX_CONNECTIONS = 50
+REDIS_SOCKET_TIMEOUT = 10
+REDIS_SOCKET_CONNECT_TIMEOUT = 5
+REDIS_HEALTH_CHECK_INTERVAL = 30
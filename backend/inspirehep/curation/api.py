@@ -4,18 +4,25 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+import orjson
 import structlog
+from flask import current_app
 from inspire_utils.dedupers import dedupe_list
 from inspire_utils.record import get_value
 from inspirehep.curation.utils import (
-    assign_institution,
     collaboration_multi_search_query,
     create_accelerator_experiment_from_collaboration_match,
     enhance_collaboration_data_with_collaboration_match,
     find_collaboration_in_multisearch_response,
     find_unambiguous_affiliation,
-    match_lit_author_affiliation,
+    get_institutions_refs_by_legacy_icn,
+    lit_author_affiliations_multi_search,
 )
+from inspirehep.redis_client import get_redis_client, redis_pipeline
+from inspirehep.utils import chunker, hash_data
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
 
 LOGGER = structlog.getLogger()
 
@@ -66,6 +73,88 @@ def normalize_collaborations(collaborations, wf_id=None):
     }
 
 
+def _get_matched_affiliations_cache_key(raw_affiliation):
+    return f"curation:affiliations:{hash_data(raw_affiliation.encode('utf-8'))}"
+
+
+def match_affiliations(raw_affiliations, workflow_id=None):
+    """Match raw affiliations with the affiliations of curated literature.
+
+    Matches are cached in Redis for ``CURATION_AFFILIATIONS_CACHE_TIMEOUT``
+    seconds, the raw affiliations not found in the cache are matched with
+    multi searches of at most ``CURATION_AFFILIATIONS_MSEARCH_CHUNK_SIZE``
+    queries.
+
+    Args:
+        raw_affiliations (list(str)): raw affiliations to match.
+        workflow_id: id of the workflow requesting the match, for logging.
+
+    Returns:
+        dict: the matched affiliations for each raw affiliation which has an
+        unambiguous match.
+    """
+    raw_affiliations = dedupe_list([raw_aff for raw_aff in raw_affiliations if raw_aff])
+    if not raw_affiliations:
+        return {}
+
+    cached_matches = get_redis_client().mget(
+        [_get_matched_affiliations_cache_key(raw_aff) for raw_aff in raw_affiliations]
+    )
+    matched_affiliations = {}
+    raw_affiliations_to_match = []
+    for raw_aff, cached_match in zip(raw_affiliations, cached_matches, strict=True):
+        if cached_match is None:
+            raw_affiliations_to_match.append(raw_aff)
+        else:
+            matched_affiliations[raw_aff] = orjson.loads(cached_match)
+
+    new_matches = {}
+    for raw_affs_chunk in chunker(
+        raw_affiliations_to_match,
+        current_app.config["CURATION_AFFILIATIONS_MSEARCH_CHUNK_SIZE"],
+    ):
+        search_responses = lit_author_affiliations_multi_search(
+            raw_affs_chunk
+        ).execute()
+        for raw_aff, search_response in zip(
+            raw_affs_chunk, search_responses, strict=True
+        ):
+            matched_author_affiliations = find_unambiguous_affiliation(
+                search_response.hits, workflow_id
+            )
+            if matched_author_affiliations:
+                new_matches[raw_aff] = matched_author_affiliations
+
+    if new_matches:
+        with redis_pipeline(transaction=False) as pipeline:
+            for raw_aff, matched_author_affiliations in new_matches.items():
+                pipeline.set(
+                    _get_matched_affiliations_cache_key(raw_aff),
+                    orjson.dumps(matched_author_affiliations),
+                    ex=current_app.config["CURATION_AFFILIATIONS_CACHE_TIMEOUT"],
+                )
+    LOGGER.info(
+        "Matched raw affiliations",
+        cached=len(matched_affiliations),
+        searched=len(raw_affiliations_to_match),
+        matched=len(new_matches),
+        workflow_id=workflow_id,
+    )
+    matched_affiliations.update(new_matches)
+    return matched_affiliations
+
+
+def invalidate_matched_affiliations(raw_affiliations):
+    """Drop the cached matches of the given raw affiliations."""
+    cache_keys = [
+        _get_matched_affiliations_cache_key(raw_aff)
+        for raw_aff in set(raw_affiliations)
+        if raw_aff
+    ]
+    if cache_keys:
+        get_redis_client().delete(*cache_keys)
+
+
 def normalize_affiliations(authors, workflow_id=None, **kwargs):
     """
     Normalizes author raw affiliations in literature record.
@@ -77,7 +166,15 @@ def normalize_affiliations(authors, workflow_id=None, **kwargs):
         normalized_affiliations: list containing normalized affiliations for each author
         ambiguous_affiliations: not matched (not normalized) affiliations
     """
-    matched_affiliations = {}
+    matched_affiliations = match_affiliations(
+        [
+            raw_aff
+            for author in authors
+            if not author.get("affiliations")
+            for raw_aff in get_value(author, "raw_affiliations.value", [])
+        ],
+        workflow_id,
+    )
     normalized_affiliations = []
     ambiguous_affiliations = []
     for author in authors:
@@ -89,14 +186,6 @@ def normalize_affiliations(authors, workflow_id=None, **kwargs):
         for raw_aff in raw_affs:
             if raw_aff in matched_affiliations:
                 author_affiliations.extend(matched_affiliations[raw_aff])
-                continue
-            matched_author_affiliations_hits = match_lit_author_affiliation(raw_aff)
-            matched_author_affiliations = find_unambiguous_affiliation(
-                matched_author_affiliations_hits, workflow_id
-            )
-            if matched_author_affiliations:
-                matched_affiliations[raw_aff] = matched_author_affiliations
-                author_affiliations.extend(matched_author_affiliations)
             else:
                 ambiguous_affiliations.append(raw_aff)
         normalized_affiliations.append(dedupe_list(author_affiliations))
@@ -109,16 +198,68 @@ def normalize_affiliations(authors, workflow_id=None, **kwargs):
 def assign_institution_reference_to_affiliations(
     author_affiliations, already_matched_affiliations_refs
 ):
-    for affiliation in author_affiliations:
-        if "record" in affiliation:
-            continue
+    """Link affiliations to the institutions with the same legacy ICN.
+
+    The institutions of all the affiliations not in
+    ``already_matched_affiliations_refs`` are resolved with a single search,
+    the mapping is updated with the found references.
+    """
+    affiliations_to_link = [
+        affiliation
+        for affiliation in author_affiliations
+        if "record" not in affiliation
+    ]
+    already_matched_affiliations_refs.update(
+        get_institutions_refs_by_legacy_icn(
+            affiliation["value"]
+            for affiliation in affiliations_to_link
+            if affiliation["value"] not in already_matched_affiliations_refs
+        )
+    )
+    for affiliation in affiliations_to_link:
         if affiliation["value"] in already_matched_affiliations_refs:
             affiliation["record"] = already_matched_affiliations_refs[
                 affiliation["value"]
             ]
-        else:
-            complete_affiliation = assign_institution(affiliation)
-            if complete_affiliation:
-                already_matched_affiliations_refs[complete_affiliation["value"]] = (
-                    complete_affiliation["record"]
-                )
+
+
+def get_records_coreness(control_numbers, pid_type="lit"):
+    """Get coreness, deleted status and collections of records.
+
+    Everything is read from the records JSON in a single query.
+
+    Args:
+        control_numbers (list(int)): control numbers of the records.
+        pid_type (str): pid type of the records.
+
+    Returns:
+        dict: the records info by control number, the control numbers
+        without a record are missing.
+    """
+    if not control_numbers:
+        return {}
+    query = (
+        db.session.query(
+            PersistentIdentifier.pid_value,
+            RecordMetadata.json["core"],
+            RecordMetadata.json["deleted"],
+            RecordMetadata.json["_collections"],
+        )
+        .join(RecordMetadata, RecordMetadata.id == PersistentIdentifier.object_uuid)
+        .filter(
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+            PersistentIdentifier.object_type == "rec",
+            PersistentIdentifier.pid_value.in_(
+                [str(control_number) for control_number in control_numbers]
+            ),
+        )
+    )
+    return {
+        pid_value: {
+            "core": core is True,
+            "deleted": deleted is True,
+            "collections": collections or [],
+        }
+        for pid_value, core, deleted, collections in query
+    }
@@ -215,7 +215,7 @@ def enhance_collaboration_data_with_collaboration_match(
     collaboration["record"] = collaboration_match[0].self.to_dict()
 
 
-def match_lit_author_affiliation(raw_aff):
+def lit_author_affiliation_search(raw_aff):
     query = Q(
         "nested",
         path="authors",
@@ -226,17 +226,27 @@ def match_lit_author_affiliation(raw_aff):
         inner_hits={},
     )
     query_filters = Q("term", _collections="Literature") & Q("term", curated=True)
-    result = (
+    return (
         LiteratureSearch()
         .query(query)
         .filter(query_filters)
         .highlight("authors.raw_affiliations.value", fragment_size=len(raw_aff))
         .source(["control_number"])
-        .params(size=20)
-        .execute()
-        .hits
+        .extra(size=20)
+    )
+
+
+def lit_author_affiliations_multi_search(raw_affs):
+    """Build one multi search matching each of the raw affiliations.
+
+    The responses are in the same order as ``raw_affs``.
+    """
+    multi_search = MultiSearch(
+        index=prefix_index("records-hep"), using=current_search_client
     )
-    return result
+    for raw_aff in raw_affs:
+        multi_search = multi_search.add(lit_author_affiliation_search(raw_aff))
+    return multi_search
 
 
 def clean_up_affiliation_data(affiliations):
@@ -297,9 +307,22 @@ def extract_matched_aff_from_highlight(
             return [aff]
 
 
-def assign_institution(matched_affiliation):
-    query = Q("match", legacy_ICN=matched_affiliation["value"])
-    result = InstitutionsSearch().query(query).params(size=1).execute()
-    if result:
-        matched_affiliation["record"] = result.hits[0].to_dict()["self"]
-        return matched_affiliation
+def get_institutions_refs_by_legacy_icn(legacy_icns):
+    """Resolve institution references with a single search.
+
+    Returns:
+        dict: the reference of an institution for each of the given legacy
+        ICNs which is the ``legacy_ICN`` of an institution.
+    """
+    legacy_icns = list(set(legacy_icns))
+    if not legacy_icns:
+        return {}
+    search = (
+        InstitutionsSearch()
+        .filter("terms", legacy_ICN=legacy_icns)
+        .source(["legacy_ICN", "self"])
+    )
+    institutions_refs = {}
+    for hit in search.scan():
+        institutions_refs.setdefault(hit.legacy_ICN, hit.to_dict()["self"])
+    return institutions_refs
@@ -4,14 +4,16 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
-from flask import Blueprint, abort
+from flask import Blueprint, abort, current_app
 from inspirehep.accounts.decorators import login_required_with_roles
 from inspirehep.accounts.roles import Roles
 from inspirehep.curation.api import (
     assign_institution_reference_to_affiliations,
+    get_records_coreness,
     normalize_affiliations,
     normalize_collaborations,
 )
+from inspirehep.pidstore.api.base import PidStoreBase
 from inspirehep.records.api.literature import LiteratureRecord
 from inspirehep.search.api import JournalsSearch
 from inspirehep.serializers import jsonify
@@ -112,6 +114,30 @@ def affiliations_normalization(args):
     return jsonify(normalized_affiliations)
 
 
+@blueprint.route("/records-coreness", methods=["POST"])
+@login_required_with_roles([Roles.cataloger.value])
+@parser.use_args(
+    {
+        "control_numbers": fields.List(fields.Int, required=True),
+        "endpoint": fields.Str(required=False),
+    },
+    locations=("json",),
+)
+def records_coreness(args):
+    control_numbers = args["control_numbers"]
+    pid_type = PidStoreBase.get_pid_type_from_endpoint(
+        args.get("endpoint", "literature")
+    )
+    if not pid_type:
+        abort(400, f"Unknown endpoint {args['endpoint']}")
+    if len(control_numbers) > current_app.config["MAX_API_RESULTS"]:
+        abort(
+            400,
+            f"Too many control numbers, maximum is {current_app.config['MAX_API_RESULTS']}",
+        )
+    return jsonify(get_records_coreness(control_numbers, pid_type=pid_type))
+
+
 @blueprint.route("/literature/assign-institutions")
 @login_required_with_roles([Roles.cataloger.value])
 @parser.use_args(
@@ -119,14 +145,15 @@ def affiliations_normalization(args):
     locations=("json",),
 )
 def assign_institution(args):
-    affiliations = {}
     authors = args["authors"]
-    for author in authors:
-        author_affiliations = author.get("affiliations", [])
-        if author_affiliations:
-            assign_institution_reference_to_affiliations(
-                author_affiliations, affiliations
-            )
+    assign_institution_reference_to_affiliations(
+        [
+            affiliation
+            for author in authors
+            for affiliation in author.get("affiliations", [])
+        ],
+        {},
+    )
     return jsonify({"authors": authors})
 
 
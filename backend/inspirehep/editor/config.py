@@ -6,3 +6,5 @@
 
 EDITOR_UPLOAD_ALLOWED_EXTENSIONS = {".pdf"}
 GROBID_URL = "http://grobid.test"
+#: How long (in seconds) the JSON-Patch between two revisions is cached.
+EDITOR_REVISION_DIFF_CACHE_TIMEOUT = 7 * 24 * 60 * 60
@@ -1,9 +1,8 @@
 from datetime import datetime
 
 import structlog
-from flask import current_app
 from inspirehep.config import EDITOR_LOCK_EXPIRATION_TIME
-from redis import StrictRedis
+from inspirehep.redis_client import get_redis_client, redis_pipeline
 
 LOGGER = structlog.getLogger()
 
@@ -23,9 +22,7 @@ class EditorSoftLock:
 
     @property
     def redis(self):
-        redis_url = current_app.config.get("CACHE_REDIS_URL")
-        redis = StrictRedis.from_url(redis_url)
-        return redis
+        return get_redis_client()
 
     @property
     def hash_name(self):
@@ -46,29 +43,25 @@ class EditorSoftLock:
         }
 
     def add_lock(self):
-        self.redis.hset(self.hash_name, key=self.key, value=self.message)
-        self.redis.expire(self.hash_name, time=EDITOR_LOCK_EXPIRATION_TIME)
+        with redis_pipeline() as pipeline:
+            pipeline.hset(self.hash_name, key=self.key, value=self.message)
+            pipeline.expire(self.hash_name, time=EDITOR_LOCK_EXPIRATION_TIME)
 
     def remove_lock(self):
         self.redis.hdel(self.hash_name, self.key)
 
     def prepare_editor_lock_api_payload(self):
         payload = {}
+        hash_names = self._get_hash_name_for_edited_record()
+        with redis_pipeline(transaction=False) as pipeline:
+            pipeline.hgetall(hash_names["user"])
+            pipeline.hgetall(hash_names["task"])
+            user_locks, task_locks = pipeline.execute()
         existing_user_locks = ", ".join(
-            [
-                value.decode()
-                for value in self.redis.hgetall(
-                    self._get_hash_name_for_edited_record()["user"]
-                ).values()
-            ]
+            [value.decode() for value in user_locks.values()]
         ).strip(", ")
         existing_task_locks = ", ".join(
-            [
-                value.decode()
-                for value in self.redis.hgetall(
-                    self._get_hash_name_for_edited_record()["task"]
-                ).values()
-            ]
+            [value.decode() for value in task_locks.values()]
         ).strip(", ")
         if existing_user_locks:
             editor_user_lock_msg = (
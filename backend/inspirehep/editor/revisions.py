@@ -0,0 +1,119 @@
+#
+# Copyright (C) 2020 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+import orjson
+import structlog
+from flask import current_app
+from inspirehep.redis_client import get_redis_client
+from invenio_accounts.models import User
+from invenio_db import db
+from invenio_records.models import RecordMetadata
+from jsonpatch import make_patch
+from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy_continuum import transaction_class, version_class
+
+LOGGER = structlog.getLogger()
+
+
+def get_revisions_summary(record_uuid):
+    """Get the revisions of a record without loading their JSON.
+
+    Args:
+        record_uuid (uuid.UUID): the uuid of the record.
+
+    Returns:
+        list(dict): the revisions, most recent first, with ``revision_id``,
+        ``transaction_id``, ``updated`` and ``user_email``.
+    """
+    RecordMetadataVersion = version_class(RecordMetadata)
+    Transaction = transaction_class(RecordMetadata)
+    query = (
+        db.session.query(
+            RecordMetadataVersion.version_id,
+            RecordMetadataVersion.transaction_id,
+            RecordMetadataVersion.updated,
+            User.email,
+        )
+        .outerjoin(Transaction, Transaction.id == RecordMetadataVersion.transaction_id)
+        .outerjoin(User, User.id == Transaction.user_id)
+        .filter(RecordMetadataVersion.id == record_uuid)
+        .order_by(RecordMetadataVersion.version_id.desc())
+    )
+    return [
+        {
+            "updated": updated,
+            "revision_id": version_id - 1,
+            "user_email": user_email or "system",
+            "transaction_id": transaction_id,
+            "rec_uuid": record_uuid,
+        }
+        for version_id, transaction_id, updated, user_email in query
+    ]
+
+
+def _get_revision_patch_cache_key(record_uuid, transaction_id):
+    return f"editor-revision-diff:{record_uuid}:{transaction_id}"
+
+
+def get_revision_patch(record_uuid, transaction_id):
+    """Get the JSON-Patch from the previous revision to the given one.
+
+    Revisions are immutable, so the computed patch is cached in Redis for
+    ``EDITOR_REVISION_DIFF_CACHE_TIMEOUT`` seconds.
+
+    Args:
+        record_uuid (uuid.UUID): the uuid of the record.
+        transaction_id (int): the transaction id of the revision.
+
+    Returns:
+        list(dict): the JSON-Patch operations. For the first revision the patch
+        is computed against an empty record.
+
+    Raises:
+        NoResultFound: if the record has no revision for ``transaction_id``.
+    """
+    redis = get_redis_client()
+    cache_key = _get_revision_patch_cache_key(record_uuid, transaction_id)
+    cached_patch = redis.get(cache_key)
+    if cached_patch is not None:
+        return orjson.loads(cached_patch)
+
+    RecordMetadataVersion = version_class(RecordMetadata)
+    revisions = (
+        RecordMetadataVersion.query.with_entities(
+            RecordMetadataVersion.transaction_id, RecordMetadataVersion.json
+        )
+        .filter(
+            RecordMetadataVersion.id == record_uuid,
+            RecordMetadataVersion.transaction_id <= transaction_id,
+        )
+        .order_by(RecordMetadataVersion.transaction_id.desc())
+        .limit(2)
+        .all()
+    )
+    if not revisions or revisions[0].transaction_id != transaction_id:
+        raise NoResultFound(
+            f"Revision {transaction_id} of record {record_uuid} not found."
+        )
+
+    current_json = revisions[0].json or {}
+    previous_json = {}
+    if len(revisions) > 1:
+        previous_json = revisions[1].json or {}
+    patch = make_patch(previous_json, current_json).patch
+
+    redis.set(
+        cache_key,
+        orjson.dumps(patch),
+        ex=current_app.config["EDITOR_REVISION_DIFF_CACHE_TIMEOUT"],
+    )
+    LOGGER.info(
+        "Computed revision diff",
+        uuid=str(record_uuid),
+        transaction_id=transaction_id,
+        operations=len(patch),
+    )
+    return patch
@@ -27,9 +27,10 @@ from inspirehep.curation.api import (
 from inspirehep.editor.authorlist_utils import authorlist
 from inspirehep.editor.editor_soft_lock import EditorSoftLock
 from inspirehep.editor.errors import EditorGetRevisionError, EditorRevertToRevisionError
+from inspirehep.editor.revisions import get_revision_patch, get_revisions_summary
 from inspirehep.files.proxies import current_s3_instance
 from inspirehep.matcher.api import get_affiliations_from_pdf, match_references
-from inspirehep.matcher.utils import create_journal_dict, map_refextract_to_schema
+from inspirehep.matcher.utils import get_journal_kb, map_refextract_to_schema
 from inspirehep.pidstore.api.base import PidStoreBase
 from inspirehep.records.api.base import InspireRecord
 from inspirehep.serializers import jsonify
@@ -44,7 +45,7 @@ from refextract.extract import (
     extract_references_from_file_url,
     extract_references_from_text,
 )
-from sqlalchemy_continuum import transaction_class, version_class
+from sqlalchemy_continuum import version_class
 
 blueprint = Blueprint("inspirehep_editor", __name__, url_prefix="/editor")
 LOGGER = structlog.getLogger()
@@ -107,7 +108,6 @@ def get_record_and_schema(endpoint, pid_value):
 def get_revisions(endpoint, pid_value):
     """Get revisions of given record"""
     try:
-        Transaction = transaction_class(RecordMetadata)
         pid_type = PidStoreBase.get_pid_type_from_endpoint(endpoint)
         record = InspireRecord.get_record_by_pid_value(
             pid_value, pid_type, original_record=True
@@ -118,27 +118,7 @@ def get_revisions(endpoint, pid_value):
         ):
             return jsonify(message="Unauthorized"), 403
 
-        revisions = []
-        for revision in reversed(record.revisions):
-            transaction_id = revision.model.transaction_id
-            transaction = Transaction.query.filter(
-                Transaction.id == transaction_id
-            ).one_or_none()
-            if transaction:
-                user = transaction.user
-                user_email = user.email if user else "system"
-            else:
-                user_email = "system"
-
-            revisions.append(
-                {
-                    "updated": revision.updated,
-                    "revision_id": revision.revision_id,
-                    "user_email": user_email,
-                    "transaction_id": transaction_id,
-                    "rec_uuid": record.id,
-                }
-            )
+        revisions = get_revisions_summary(record.id)
         return jsonify(revisions)
     except Exception as e:
         raise EditorGetRevisionError from e
@@ -164,6 +144,16 @@ def get_revision(transaction_id, rec_uuid):
         raise EditorGetRevisionError from e
 
 
+@blueprint.route("/revisions/<rec_uuid>/<int:transaction_id>/diff", methods=["GET"])
+@login_required_with_roles([Roles.cataloger.value])
+def get_revision_diff(transaction_id, rec_uuid):
+    """Get the JSON-Patch between the given revision and the previous one"""
+    try:
+        return jsonify(get_revision_patch(rec_uuid, transaction_id))
+    except Exception as e:
+        raise EditorGetRevisionError from e
+
+
 # TODO: change endpoint name
 @blueprint.route("/<endpoint>/<int:pid_value>/rt/tickets/create", methods=["POST"])
 @login_required_with_roles([Roles.cataloger.value])
@@ -233,7 +223,7 @@ def get_rt_queues():
 @login_required_with_roles([Roles.cataloger.value])
 def refextract_text():
     """Run refextract on a piece of text."""
-    journal_kb_data = create_journal_dict()
+    journal_kb_data = get_journal_kb()
     text = request.json["text"]
 
     extracted_references_from_text = extract_references_from_text(text, journal_kb_data)
@@ -253,7 +243,7 @@ def refextract_text():
 @login_required_with_roles([Roles.cataloger.value])
 def refextract_url():
     """Run refextract on a URL."""
-    journal_kb_data = create_journal_dict()
+    journal_kb_data = get_journal_kb()
     url = request.json["url"]
     extracted_references_from_file_url = extract_references_from_file_url(
         url, journal_kb_data
@@ -363,14 +353,16 @@ def authorlist_xml():
     """Normalize affiliations for author xml."""
     try:
         parsed_authors = AuthorXMLParser(request.json["xml"]).parse()
-        affiliations = {}
         for author in parsed_authors:
             author["full_name"] = LatexNodes2Text().latex_to_text(author["full_name"])
-            author_affiliations = author.get("affiliations", [])
-            if author_affiliations:
-                assign_institution_reference_to_affiliations(
-                    author_affiliations, affiliations
-                )
+        assign_institution_reference_to_affiliations(
+            [
+                affiliation
+                for author in parsed_authors
+                for affiliation in author.get("affiliations", [])
+            ],
+            {},
+        )
         return jsonify({"authors": parsed_authors})
     except Exception as err:
         return jsonify(status=400, message=" / ".join(err.args)), 400
@@ -5,7 +5,6 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 import click
-from flask import current_app
 from flask.cli import with_appcontext
 from invenio_db.cli import create as db_create
 from invenio_db.cli import destroy as db_destroy
@@ -13,11 +12,11 @@ from invenio_db.cli import init as db_init
 from invenio_indexer.cli import init_queue, purge_queue
 from invenio_search.cli import destroy as indexer_destroy
 from invenio_search.cli import init as indexer_index
-from redis import StrictRedis
 
 from inspirehep.accounts.fixtures import init_oauth_token, init_users_and_permissions
 from inspirehep.files.cli import create_buckets
 from inspirehep.indexer.cli import put_files_pipeline
+from inspirehep.redis_client import get_redis_client
 
 
 @click.group()
@@ -33,7 +32,7 @@ def setup(ctx, with_fixtures):
     """Help reduce the time of setting up the application."""
     click.secho("Setting up the application. \n", bold=True, fg="green")
 
-    StrictRedis.from_url(current_app.config["CACHE_REDIS_URL"]).flushall()
+    get_redis_client().flushall()
     click.secho("Flushed redis cache. \n", fg="blue")
 
     ctx.invoke(db_destroy)
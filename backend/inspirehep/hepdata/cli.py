@@ -11,12 +11,42 @@ import structlog
 from flask.cli import with_appcontext
 from inspire_utils.record import get_values_for_schema
 from inspirehep.records.api.literature import LiteratureRecord
+from inspirehep.utils import chunker
 from invenio_db import db
+from sqlalchemy.orm.attributes import flag_modified
 
 LOGGER = structlog.getLogger()
 HEPDATA_URL = "https://www.hepdata.net/search/ids"
 
 
+def _assign_hepdata_identifiers(records):
+    """Append the HEPData identifier to the records which don't have one yet.
+
+    Only ``external_system_identifiers`` changes, so the metadata of the records
+    is updated directly instead of going through ``record.update``: there are no
+    PIDs, relations or authors to update, nor anything to push or disambiguate.
+    The change is still versioned and the records are indexed once committed.
+
+    Returns:
+        int: the number of records which were updated.
+    """
+    updated = 0
+    for record in records:
+        record_external_identifiers = record.setdefault(
+            "external_system_identifiers", []
+        )
+        if get_values_for_schema(record_external_identifiers, "HEPDATA"):
+            continue
+        record_external_identifiers.append(
+            {"schema": "HEPDATA", "value": f"ins{record['control_number']}"}
+        )
+        record.model.json = dict(record)
+        flag_modified(record.model, "json")
+        db.session.add(record.model)
+        updated += 1
+    return updated
+
+
 @click.group()
 def hepdata():
     """Commands for disambiguation"""
@@ -33,8 +63,15 @@ def hepdata():
         " day before would be used."
     ),
 )
+@click.option(
+    "-c",
+    "--commit-every",
+    default=100,
+    show_default=True,
+    help="Number of records updated in a single transaction.",
+)
 @with_appcontext
-def harvest(since):
+def harvest(since, commit_every):
     if since:
         try:
             since = datetime.strptime(since, "%Y-%m-%d").date()
@@ -53,16 +90,11 @@ def harvest(since):
         "Collected hepdata ids, assigning them to INSPIRE records.",
         number_of_collected_ids=len(ids),
     )
-    records_to_update = list(
-        LiteratureRecord.get_records_by_pids([("lit", str(recid)) for recid in ids])
-    )
-    for record in records_to_update:
-        record_external_identifiers = record.setdefault(
-            "external_system_identifiers", []
+    updated = 0
+    for chunk in chunker(ids, commit_every):
+        records = LiteratureRecord.get_records_by_pids(
+            [("lit", str(recid)) for recid in chunk], max_batch=commit_every
         )
-        if not get_values_for_schema(record_external_identifiers, "HEPDATA"):
-            record_external_identifiers.append(
-                {"schema": "HEPDATA", "value": f"ins{record['control_number']}"}
-            )
-            record.update(dict(record))
-    db.session.commit()
+        updated += _assign_hepdata_identifiers(records)
+        db.session.commit()
+    LOGGER.info("Assigned hepdata ids to INSPIRE records.", number_of_records=updated)
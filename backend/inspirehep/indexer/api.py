@@ -14,6 +14,7 @@ def get_references_to_update(record):
     uuids_to_reindex = set()
     if isinstance(record, LiteratureRecord):
         uuids_to_reindex |= record.get_linked_papers_if_reference_changed()
+        uuids_to_reindex |= record.get_referencing_papers_if_reference_display_changed()
         uuids_to_reindex |= record.get_linked_datas_if_authors_changed()
         uuids_to_reindex |= record.get_all_connected_records_uuids_of_modified_authors()
         uuids_to_reindex |= (
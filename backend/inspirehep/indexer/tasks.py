@@ -6,6 +6,7 @@
 
 import structlog
 from celery import shared_task
+from inspirehep.curation.api import invalidate_matched_affiliations
 from inspirehep.errors import DB_TASK_EXCEPTIONS, ES_TASK_EXCEPTIONS
 from inspirehep.indexer.api import get_references_to_update
 from inspirehep.indexer.base import InspireRecordIndexer
@@ -69,6 +70,10 @@ def index_record(
     InspireRecordIndexer().index(
         record, record_version=record_version, force_delete=force_delete
     )
+    if record.pid_type == "lit":
+        invalidate_matched_affiliations(
+            record.get_raw_affiliations_with_modified_matches()
+        )
     if skip_indexing_references:
         return
 
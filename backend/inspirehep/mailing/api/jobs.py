@@ -7,7 +7,7 @@
 import structlog
 from flask import current_app, render_template
 from inspire_utils.record import get_value
-from inspirehep.mailing.providers.flask_mail import send_email
+from inspirehep.mailing.providers.flask_mail import send_email, send_emails
 from inspirehep.mailing.providers.mailtrain import mailtrain_subscribe_user_to_list
 from inspirehep.search.api import JobsSearch
 from invenio_oauthclient.models import UserIdentity
@@ -16,13 +16,35 @@ from opensearch_dsl.query import Q
 LOGGER = structlog.getLogger()
 
 
-def get_jobs_from_last_week():
-    """Jobs created the last 7 days."""
+def _get_jobs_from_last_week_search():
     query = Q("range", **{"_created": {"gte": "now-7d/d", "lt": "now/d"}}) & Q(
         "term", status="open"
     )
-    search = JobsSearch().query(query).params(size=10000).sort("-_created")
-    return search.execute().hits
+    return JobsSearch().query(query).sort("-_created", "control_number")
+
+
+def count_jobs_from_last_week():
+    """Number of jobs created the last 7 days."""
+    return _get_jobs_from_last_week_search().count()
+
+
+def get_jobs_from_last_week():
+    """Jobs created the last 7 days.
+
+    The jobs are fetched lazily, ``WEEKLY_JOBS_EMAIL_PAGE_SIZE`` at a time,
+    paginating with ``search_after``.
+
+    Yields:
+        opensearch_dsl.response.Hit: the jobs, newest first.
+    """
+    page_size = current_app.config["WEEKLY_JOBS_EMAIL_PAGE_SIZE"]
+    search = _get_jobs_from_last_week_search().extra(size=page_size)
+    while True:
+        hits = search.execute().hits
+        yield from hits
+        if len(hits) < page_size:
+            return
+        search = search.extra(search_after=list(hits[-1].meta.sort))
 
 
 def get_jobs_weekly_html_content(jobs):
@@ -44,14 +66,15 @@ def get_jobs_deadline_reminder_html_content(job, recipient):
     )
 
 
-def send_job_deadline_reminder(job):
-    """Send an email for the given expired job.
+def get_job_deadline_reminder_email(job):
+    """Get the email to send for the given expired job.
 
     Args:
         job (dict): a job record.
 
     Return:
-        None
+        dict: the keyword arguments of ``send_email``, or None if the job has
+        no recipient.
     """
     recipient = get_job_recipient(job)
 
@@ -60,7 +83,7 @@ def send_job_deadline_reminder(job):
             "Cannot send deadline email: no recipient found",
             recid=job["control_number"],
         )
-        return
+        return None
 
     sender = current_app.config["JOBS_DEADLINE_PASSED_SENDER_EMAIL"]
     cc_addresses = [
@@ -71,14 +94,48 @@ def send_job_deadline_reminder(job):
     subject = f"Expired deadline for your INSPIRE job: {job['position']}"
     content = get_jobs_deadline_reminder_html_content(job, recipient)
 
-    send_email(
-        sender=sender,
-        recipient=recipient,
-        cc=cc_addresses,
-        subject=subject,
-        body=content,
-    )
-    LOGGER.info("Expired job email sent", recid=job.get("control_number"))
+    return {
+        "sender": sender,
+        "recipient": recipient,
+        "cc": cc_addresses,
+        "subject": subject,
+        "body": content,
+    }
+
+
+def send_job_deadline_reminder(job):
+    """Send an email for the given expired job.
+
+    Args:
+        job (dict): a job record.
+
+    Return:
+        None
+    """
+    email = get_job_deadline_reminder_email(job)
+    if email:
+        send_email(**email)
+        LOGGER.info("Expired job email sent", recid=job.get("control_number"))
+
+
+def send_job_deadline_reminders(jobs):
+    """Send the emails for the given expired jobs through a single connection.
+
+    Args:
+        jobs (iterable(dict)): job records.
+
+    Return:
+        None
+    """
+
+    def _get_emails():
+        for job in jobs:
+            email = get_job_deadline_reminder_email(job)
+            if email:
+                yield email
+                LOGGER.info("Expired job email sent", recid=job.get("control_number"))
+
+    send_emails(_get_emails())
 
 
 def get_job_recipient(job):
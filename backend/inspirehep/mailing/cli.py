@@ -8,6 +8,7 @@ import click
 import structlog
 from flask.cli import with_appcontext
 from inspirehep.mailing.api.jobs import (
+    count_jobs_from_last_week,
     get_jobs_from_last_week,
     get_jobs_weekly_html_content,
 )
@@ -32,14 +33,14 @@ def mailing():
 @with_appcontext
 def update_weekly_jobs():
     click.secho("Searching for jobs posted last week")
-    jobs = get_jobs_from_last_week()
-    if not jobs:
+    jobs_count = count_jobs_from_last_week()
+    if not jobs_count:
         click.secho("No jobs found from last week skipping...", fg="red")
         return
 
-    click.secho(f"Found {len(jobs)} job records from last week.", fg="green")
+    click.secho(f"Found {jobs_count} job records from last week.", fg="green")
 
-    content = get_jobs_weekly_html_content(jobs)
+    content = get_jobs_weekly_html_content(get_jobs_from_last_week())
     if not mailtrain_update_weekly_campaign_content(content):
         click.secho("There was a problem with updating Atom Feed")
         exit(1)
@@ -23,3 +23,5 @@ INVENIO_MAIL_SERVER = "localhost"
 
 WEEKLY_JOBS_EMAIL_REDIS_KEY = "jobs_weekly_email"
 WEEKLY_JOBS_EMAIL_TITLE = "INSPIRE Jobs listing"
+WEEKLY_JOBS_EMAIL_PAGE_SIZE = 100
+"""Number of jobs fetched at once when rendering the weekly campaign"""
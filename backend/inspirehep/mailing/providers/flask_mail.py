@@ -12,8 +12,8 @@ from inspirehep.mailing.utils import strip_html_tags
 LOGGER = structlog.getLogger()
 
 
-def send_email(sender, recipient, subject, body, cc=None):
-    msg = Message(
+def _create_message(sender, recipient, subject, body, cc=None):
+    return Message(
         subject,
         sender=sender,
         recipients=[recipient],
@@ -21,6 +21,9 @@ def send_email(sender, recipient, subject, body, cc=None):
         body=strip_html_tags(body),
         cc=cc,
     )
+
+
+def _get_mail_client():
     client = current_app.extensions["mail"]
     if client.suppress:
         LOGGER.warn(
@@ -28,4 +31,21 @@ def send_email(sender, recipient, subject, body, cc=None):
             key="MAIL_SUPPRESS_SEND",
             value=current_app.config.get("MAIL_SUPPRESS_SEND"),
         )
-    client.send(msg)
+    return client
+
+
+def send_email(sender, recipient, subject, body, cc=None):
+    msg = _create_message(sender, recipient, subject, body, cc=cc)
+    _get_mail_client().send(msg)
+
+
+def send_emails(emails):
+    """Send several emails through a single SMTP connection.
+
+    Args:
+        emails (iterable(dict)): the keyword arguments of ``send_email`` for
+            each email to send.
+    """
+    with _get_mail_client().connect() as connection:
+        for email in emails:
+            connection.send(_create_message(**email))
@@ -8,7 +8,7 @@ import datetime
 import requests
 import structlog
 from flask import current_app
-from redis import StrictRedis
+from inspirehep.redis_client import get_redis_client
 
 LOGGER = structlog.getLogger()
 
@@ -56,8 +56,7 @@ def mailtrain_update_weekly_campaign_content(html_content):
     """
     mailtrain_key = current_app.config["WEEKLY_JOBS_EMAIL_REDIS_KEY"]
 
-    redis_url = current_app.config.get("CACHE_REDIS_URL")
-    redis = StrictRedis.from_url(redis_url, decode_responses=True)
+    redis = get_redis_client(decode_responses=True)
     date = datetime.datetime.utcnow().timestamp()
     title = current_app.config.get("WEEKLY_JOBS_EMAIL_TITLE", "INSPIRE Jobs listing")
     data = {"timestamp": date, "title": title, "html": html_content}
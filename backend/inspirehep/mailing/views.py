@@ -12,8 +12,8 @@ from feedgen.feed import FeedGenerator
 from flask import Blueprint, Response, current_app, request
 from inspirehep.mailing.api.jobs import subscribe_to_jobs_weekly_list
 from inspirehep.mailing.loaders import JobsWeeklySubscribeSchema
+from inspirehep.redis_client import get_redis_client
 from inspirehep.serializers import jsonify
-from redis import StrictRedis
 
 LOGGER = structlog.getLogger()
 
@@ -46,10 +46,9 @@ def subscribe_jobs_weekly():
 
 @blueprint.route("/rss/jobs/weekly")
 def get_weekly_jobs_rss():
-    redis_url = current_app.config.get("CACHE_REDIS_URL")
     jobs_weekly_email_key = current_app.config.get("WEEKLY_JOBS_EMAIL_REDIS_KEY")
 
-    redis = StrictRedis.from_url(redis_url)
+    redis = get_redis_client()
 
     raw_email_entry = redis.hgetall(jobs_weekly_email_key)
     title = raw_email_entry[b"title"].decode("UTF-8")
@@ -11,6 +11,9 @@ from inspirehep.matcher.validators import authors_validator
 
 GROBID_URL = "https://grobid.inspirebeta.net"
 
+JOURNAL_KB_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+"""Seconds a version of the journal KB is kept in Redis."""
+
 REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_CONFIG = {
     "algorithm": [
         {
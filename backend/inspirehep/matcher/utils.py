@@ -6,12 +6,17 @@
 
 import re
 
+import orjson
+from flask import current_app
 from inspire_schemas.api import ReferenceBuilder
 from inspire_utils.dedupers import dedupe_list_of_dicts
 from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
+from inspirehep.redis_client import get_redis_client
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier
 from invenio_records.models import RecordMetadata
-from sqlalchemy import cast, not_, type_coerce
+from sqlalchemy import cast, func, not_, type_coerce
 from sqlalchemy.dialects.postgresql import JSONB
 
 RE_PUNCTUATION = re.compile(r"[\.,;'\(\)-]", re.UNICODE)
@@ -112,6 +117,58 @@ def create_journal_dict():
     return title_dict
 
 
+def get_journal_kb_version():
+    """Get the version of the journal KB.
+
+    The version changes whenever a journal record is created, updated or
+    deleted, it's computed from the PIDs of the journals without scanning
+    their JSON.
+    """
+    journals_count, last_updated = (
+        db.session.query(
+            func.count(RecordMetadata.id), func.max(RecordMetadata.updated)
+        )
+        .join(
+            PersistentIdentifier, PersistentIdentifier.object_uuid == RecordMetadata.id
+        )
+        .filter(
+            PersistentIdentifier.pid_type == "jou",
+            PersistentIdentifier.object_type == "rec",
+        )
+        .one()
+    )
+    last_updated = last_updated.isoformat() if last_updated else ""
+    return f"{journals_count}-{last_updated}"
+
+
+def get_journal_kb(version=None):
+    """Get the journal KB built by ``create_journal_dict``.
+
+    The KB is built once per version and kept in Redis for
+    ``JOURNAL_KB_CACHE_TIMEOUT`` seconds.
+
+    Args:
+        version (str): the version of the KB, computed if not given.
+
+    Returns:
+        dict: the journal KB.
+    """
+    version = version or get_journal_kb_version()
+    redis = get_redis_client()
+    cache_key = f"journal-kb:{version}"
+    cached_journal_kb = redis.get(cache_key)
+    if cached_journal_kb is not None:
+        return orjson.loads(cached_journal_kb)
+
+    journal_kb = create_journal_dict()
+    redis.set(
+        cache_key,
+        orjson.dumps(journal_kb),
+        ex=current_app.config["JOURNAL_KB_CACHE_TIMEOUT"],
+    )
+    return journal_kb
+
+
 def normalize_title(raw_title):
     """
     Returns the normalised raw_title. Normalising means removing all non alphanumeric characters,
@@ -1,4 +1,4 @@
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
 from inspirehep.accounts.decorators import login_required_with_roles
 from inspirehep.accounts.roles import Roles
 from inspirehep.matcher.api import (
@@ -6,7 +6,7 @@ from inspirehep.matcher.api import (
     fuzzy_match_literature_data,
     match_references,
 )
-from inspirehep.matcher.utils import create_journal_dict
+from inspirehep.matcher.utils import get_journal_kb, get_journal_kb_version
 from inspirehep.serializers import jsonify
 from webargs import fields
 from webargs.flaskparser import FlaskParser
@@ -25,8 +25,13 @@ def get_linked_refs():
 @blueprint.route("/journal-kb", methods=["GET"])
 @login_required_with_roles([Roles.cataloger.value])
 def get_journal_kb_data():
-    journal_kb_data = create_journal_dict()
-    return jsonify({"journal_kb_data": journal_kb_data})
+    version = get_journal_kb_version()
+    if request.if_none_match.contains(version):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify({"journal_kb_data": get_journal_kb(version)})
+    response.set_etag(version)
+    return response
 
 
 @blueprint.route("/exact-match", methods=["GET"])
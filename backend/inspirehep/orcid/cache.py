@@ -7,10 +7,9 @@
 import hashlib
 import io
 
-import flask
 from flask import current_app as app
 from inspirehep.orcid.converter import OrcidConverter
-from redis import StrictRedis
+from inspirehep.redis_client import get_redis_client
 
 CACHE_PREFIX = None
 
@@ -30,12 +29,7 @@ class OrcidCache:
 
     @property
     def redis(self):
-        redis = getattr(flask.g, "redis_client", None)
-        if redis is None:
-            url = app.config.get("CACHE_REDIS_URL")
-            redis = StrictRedis.from_url(url, decode_responses=True)
-            flask.g.redis_client = redis
-        return redis
+        return get_redis_client(decode_responses=True)
 
     @property
     def _key(self):
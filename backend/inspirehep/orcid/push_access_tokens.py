@@ -6,11 +6,9 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 
-import flask
-from flask import current_app as app
+from inspirehep.redis_client import get_redis_client, redis_pipeline
 from invenio_db import db
 from invenio_oauthclient.models import RemoteAccount, RemoteToken, UserIdentity
-from redis import StrictRedis
 from sqlalchemy import cast
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -71,12 +69,7 @@ class _OrcidInvalidTokensCache:
 
     @property
     def redis(self):
-        redis = getattr(flask.g, "redis_client", None)
-        if redis is None:
-            url = app.config.get("CACHE_REDIS_URL")
-            redis = StrictRedis.from_url(url, decode_responses=True)
-            flask.g.redis_client = redis
-        return redis
+        return get_redis_client(decode_responses=True)
 
     @property
     def _key(self):
@@ -87,9 +80,10 @@ class _OrcidInvalidTokensCache:
 
     def write_invalid_token(self, orcid):
         data = {"orcid": orcid}
-        self.redis.hmset(self._key, data)
-        if CACHE_EXPIRE:
-            self.redis.expire(self._key, CACHE_EXPIRE)
+        with redis_pipeline(decode_responses=True) as pipeline:
+            pipeline.hmset(self._key, data)
+            if CACHE_EXPIRE:
+                pipeline.expire(self._key, CACHE_EXPIRE)
 
     def does_invalid_token_exist(self):
         return bool(self.redis.exists(self._key))
@@ -7,6 +7,7 @@
 import six
 import structlog
 from flask import current_app
+from inspirehep.pidstore.minters.base import mint_external_pids
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier
 
@@ -24,13 +25,23 @@ class PidStoreBase:
     def mint(cls, object_uuid, data):
         LOGGER.info("Minting PIDs", uuid=str(object_uuid))
         for minter in cls.minters:
-            minter.mint(object_uuid, data)
+            if not minter.bulk_minting:
+                minter.mint(object_uuid, data)
+        mint_external_pids(
+            cls._get_bulk_minters(), object_uuid, data, delete_missing=False
+        )
 
     @classmethod
     def update(cls, object_uuid, data):
         LOGGER.info("Updating PIDs", uuid=str(object_uuid))
         for minter in cls.minters:
-            minter.update(object_uuid, data)
+            if not minter.bulk_minting:
+                minter.update(object_uuid, data)
+        mint_external_pids(cls._get_bulk_minters(), object_uuid, data)
+
+    @classmethod
+    def _get_bulk_minters(cls):
+        return [minter for minter in cls.minters if minter.bulk_minting]
 
     @classmethod
     def delete(cls, object_uuid, data):
@@ -11,3 +11,4 @@ from inspirehep.pidstore.minters.base import Minter
 class ArxivMinter(Minter):
     pid_value_path = "arxiv_eprints.value"
     pid_type = "arxiv"
+    bulk_minting = True
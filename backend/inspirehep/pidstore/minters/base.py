@@ -10,8 +10,11 @@ from inspire_utils.record import get_value
 from inspirehep.pidstore.errors import MissingSchema, PIDAlreadyExistsError
 from inspirehep.pidstore.providers.external import InspireExternalIdProvider
 from inspirehep.pidstore.providers.recid import InspireRecordIdProvider
+from invenio_db import db
 from invenio_pidstore.errors import PIDAlreadyExists, PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 
 LOGGER = structlog.getLogger()
 
@@ -21,6 +24,9 @@ class Minter:
     object_type = "rec"
     pid_type = None
     pid_value_path = None
+    #: When set, the pids are minted together with the ones of the other bulk
+    #: minters of the record by ``mint_external_pids``.
+    bulk_minting = False
 
     def __init__(self, object_uuid, data):
         self.data = data
@@ -114,6 +120,113 @@ class Minter:
         }
 
 
+def _raise_for_existing_pids(pids):
+    existing_pid = (
+        PersistentIdentifier.query.with_entities(
+            PersistentIdentifier.pid_type, PersistentIdentifier.pid_value
+        )
+        .filter(
+            tuple_(PersistentIdentifier.pid_type, PersistentIdentifier.pid_value).in_(
+                pids
+            )
+        )
+        .first()
+    )
+    if existing_pid:
+        raise PIDAlreadyExistsError(existing_pid.pid_type, existing_pid.pid_value)
+
+
+def mint_external_pids(minters, object_uuid, data, delete_missing=True):
+    """Create and delete the external pids of a record for several minters.
+
+    The pids of the record are fetched with one query and diffed with the
+    requested ones of all the minters, the differences are applied with one
+    bulk insert and one bulk delete.
+
+    Args:
+        minters (list): the minter classes, with ``bulk_minting`` set.
+        object_uuid (uuid.UUID): the uuid of the record.
+        data (dict): the record data.
+        delete_missing (bool): if set, the pids of the record which are not
+            requested anymore are deleted.
+
+    Raises:
+        PIDAlreadyExistsError: if a requested pid is already in use.
+    """
+    minters = [minter(object_uuid, data) for minter in minters]
+    if not minters:
+        return
+    for minter in minters:
+        minter.validate()
+
+    pid_types = {minter.pid_type for minter in minters}
+    pids_in_db = {
+        (pid_type, pid_value)
+        for pid_type, pid_value in PersistentIdentifier.query.with_entities(
+            PersistentIdentifier.pid_type, PersistentIdentifier.pid_value
+        )
+        .filter_by(
+            object_uuid=object_uuid,
+            object_type=Minter.object_type,
+            pid_provider=InspireExternalIdProvider.pid_provider,
+        )
+        .filter(PersistentIdentifier.pid_type.in_(pid_types))
+        .filter(PersistentIdentifier.status != PIDStatus.DELETED)
+    }
+    pids_requested = {
+        (minter.pid_type, pid_value)
+        for minter in minters
+        for pid_value in minter.get_pid_values()
+    }
+    pids_to_delete = pids_in_db - pids_requested if delete_missing else set()
+    pids_to_create = pids_requested - pids_in_db
+
+    if pids_to_delete:
+        LOGGER.info(
+            "Some pids for record are going to be removed",
+            pids_to_delete=pids_to_delete,
+            object_uuid=object_uuid,
+        )
+        PersistentIdentifier.query.filter_by(
+            object_uuid=object_uuid,
+            object_type=Minter.object_type,
+            pid_provider=InspireExternalIdProvider.pid_provider,
+        ).filter(
+            tuple_(PersistentIdentifier.pid_type, PersistentIdentifier.pid_value).in_(
+                pids_to_delete
+            )
+        ).delete(synchronize_session="fetch")
+
+    if pids_to_create:
+        LOGGER.info(
+            "Minting",
+            pids_to_create=pids_to_create,
+            object_uuid=str(object_uuid),
+            pid_provider=InspireExternalIdProvider.pid_provider,
+        )
+        _raise_for_existing_pids(pids_to_create)
+        try:
+            with db.session.begin_nested():
+                db.session.bulk_insert_mappings(
+                    PersistentIdentifier,
+                    [
+                        {
+                            "pid_type": pid_type,
+                            "pid_value": pid_value,
+                            "pid_provider": InspireExternalIdProvider.pid_provider,
+                            "status": InspireExternalIdProvider.default_status,
+                            "object_type": Minter.object_type,
+                            "object_uuid": object_uuid,
+                        }
+                        for pid_type, pid_value in pids_to_create
+                    ],
+                )
+        except IntegrityError:
+            # pids created concurrently
+            _raise_for_existing_pids(pids_to_create)
+            raise
+
+
 class ControlNumberMinter(Minter):
     pid_value_path = "control_number"
     provider = InspireRecordIdProvider
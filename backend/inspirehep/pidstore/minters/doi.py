@@ -11,6 +11,7 @@ from inspirehep.pidstore.minters.base import Minter
 class DoiMinter(Minter):
     pid_value_path = "dois.value"
     pid_type = "doi"
+    bulk_minting = True
 
     def create(self, pid_value):
         return super().create(pid_value.lower())
@@ -10,6 +10,7 @@ from inspirehep.pidstore.minters.base import Minter
 
 class OrcidMinter(Minter):
     pid_type = "orcid"
+    bulk_minting = True
 
     def get_pid_values(self):
         return set(get_values_for_schema(self.data.get("ids", []), "ORCID"))
@@ -145,3 +145,12 @@ class InspireRedirect(db.Model, Timestamp):
             db.session.flush([self])
             db.session.expire(self.original_pid)
             db.session.expire(self.new_pid)
+
+
+class InspireBAICounter(db.Model):
+    """Last number given to a BAI for each BAI prefix (ex. ``K.Janeway.``)."""
+
+    __tablename__ = "inspire_pidstore_bai_counter"
+
+    prefix = db.Column(db.String(255), primary_key=True)
+    last_number = db.Column(db.Integer, nullable=False)
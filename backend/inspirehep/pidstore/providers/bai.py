@@ -12,10 +12,14 @@ from flask import current_app
 from inspire_utils.name import format_name
 from inspire_utils.record import get_value
 from inspirehep.pidstore.errors import PIDAlreadyExistsError
+from inspirehep.pidstore.models import InspireBAICounter
 from inspirehep.pidstore.providers.base import InspireBaseProvider
 from inspirehep.records.marshmallow.utils import get_first_value_for_schema
+from invenio_db import db
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from unidecode import unidecode
 
@@ -52,14 +56,14 @@ class InspireBAIProvider(InspireBaseProvider):
         )
 
     @classmethod
-    def next_bai_number(cls, bai):
-        """Returns next possible free id for BAI
+    def last_bai_number(cls, bai):
+        """Returns the highest number of the existing BAIs with this prefix
 
         Args:
             bai(str): Bai without number at the end (ex. K.Janeway)
 
         Returns:
-            int: first free available id for specified BAI
+            int: highest number of the BAIs, 0 if there are none.
         """
         all_similar_bais = [
             result[0]
@@ -73,14 +77,78 @@ class InspireBAIProvider(InspireBaseProvider):
         if all_similar_bais:
             all_bais_numbers = [int(x.rsplit(".", 1)[-1]) for x in all_similar_bais]
             last_number = max(all_bais_numbers)
-        return int(last_number) + 1
+        return int(last_number)
+
+    @staticmethod
+    def _execute_counter_statement(statement):
+        """Execute a statement on the BAI counters in its own transaction.
+
+        The counter is committed right away, so that concurrent creations with
+        the same prefix don't wait on each other until the end of their
+        transactions. The numbers of BAIs whose creation is rolled back are
+        skipped.
+        """
+        with db.engine.begin() as connection:
+            result = connection.execute(statement)
+            return result.scalar() if result.returns_rows else None
+
+    @classmethod
+    def next_bai_number(cls, bai):
+        """Returns next possible free id for BAI
+
+        The number is taken from the counter of the BAI prefix, which is
+        created from the existing BAIs the first time the prefix is used.
+
+        Args:
+            bai(str): Bai without number at the end (ex. K.Janeway)
+
+        Returns:
+            int: first free available id for specified BAI
+        """
+        counter = InspireBAICounter.__table__
+        next_number = cls._execute_counter_statement(
+            update(counter)
+            .where(counter.c.prefix == bai)
+            .values(last_number=counter.c.last_number + 1)
+            .returning(counter.c.last_number)
+        )
+        if next_number is not None:
+            return next_number
+
+        insert_counter = insert(counter).values(
+            prefix=bai, last_number=cls.last_bai_number(bai) + 1
+        )
+        return cls._execute_counter_statement(
+            insert_counter.on_conflict_do_update(
+                index_elements=[counter.c.prefix],
+                set_={
+                    "last_number": func.greatest(
+                        counter.c.last_number + 1,
+                        insert_counter.excluded.last_number,
+                    )
+                },
+            ).returning(counter.c.last_number)
+        )
+
+    @classmethod
+    def update_bai_counter(cls, pid_value):
+        """Make sure the counter of the BAI prefix is not behind ``pid_value``."""
+        prefix, _, number = pid_value.rpartition(".")
+        if not number.isdigit():
+            return
+        counter = InspireBAICounter.__table__
+        cls._execute_counter_statement(
+            update(counter)
+            .where(counter.c.prefix == f"{prefix}.")
+            .values(last_number=func.greatest(counter.c.last_number, int(number)))
+        )
 
     @classmethod
     @backoff.on_exception(
         backoff.constant,
         (IntegrityError, PIDAlreadyExistsError),
         max_tries=5,
-        interval=5,
+        interval=0,
     )
     def create(
         cls, pid_value=None, object_uuid=None, data=None, object_type=None, **kwargs
@@ -102,6 +170,8 @@ class InspireBAIProvider(InspireBaseProvider):
                 status=PIDStatus.REGISTERED,
                 **kwargs,
             )
+            if pid_value:
+                cls.update_bai_counter(new_pid)
         elif pid_from_db.object_uuid != object_uuid:
             raise PIDAlreadyExistsError(pid_value=pid_value, pid_type="bai")
         else:
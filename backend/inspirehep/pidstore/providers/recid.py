@@ -4,15 +4,22 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from collections import deque
 
 import requests
 import structlog
 from flask import current_app
 from inspirehep.pidstore.providers.base import InspireBaseProvider
+from inspirehep.process_local import ProcessLocalRegistry
+from invenio_db import db
 from invenio_pidstore.models import PIDStatus, RecordIdentifier
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
 
 LOGGER = structlog.getLogger()
 
+_RECID_BLOCKS = ProcessLocalRegistry()
+
 
 def get_next_pid_from_legacy():
     """Reserve the next pid on legacy.
@@ -27,10 +34,46 @@ def get_next_pid_from_legacy():
     }
 
     url = current_app.config.get("LEGACY_PID_PROVIDER")
-    next_pid = requests.get(url, headers=headers).json()
+    next_pid = requests.get(
+        url,
+        headers=headers,
+        timeout=current_app.config.get("LEGACY_PID_PROVIDER_TIMEOUT"),
+    ).json()
     return next_pid
 
 
+def _reserve_recid_block(size):
+    return [
+        row[0]
+        for row in db.session.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence(:table_name, 'recid'))"
+                " FROM generate_series(1, :size)"
+            ),
+            {"table_name": RecordIdentifier.__tablename__, "size": size},
+        )
+    ]
+
+
+def get_next_recid_from_block():
+    """Take the next control number from the block reserved by this process.
+
+    A new block of ``PIDSTORE_RECID_BLOCK_SIZE`` values is taken from the
+    ``RecordIdentifier`` sequence with a single query when the previous one is
+    used up. Values of a block not used before the process exits are left as
+    gaps, the reserved blocks are logged so that the gaps can be traced.
+    """
+    block_size = current_app.config.get("PIDSTORE_RECID_BLOCK_SIZE", 1)
+    with _RECID_BLOCKS.lock:
+        block = _RECID_BLOCKS.get(deque)
+        if not block:
+            block.extend(_reserve_recid_block(block_size))
+            LOGGER.info(
+                "Reserved block of control numbers", first=block[0], last=block[-1]
+            )
+        return block.popleft()
+
+
 class InspireRecordIdProvider(InspireBaseProvider):
     """Record identifier provider."""
 
@@ -40,6 +83,21 @@ class InspireRecordIdProvider(InspireBaseProvider):
 
     default_status = PIDStatus.RESERVED
 
+    @classmethod
+    def next_recid(cls):
+        """Register the next free control number of the reserved block."""
+        while True:
+            recid = get_next_recid_from_block()
+            try:
+                with db.session.begin_nested():
+                    db.session.add(RecordIdentifier(recid=recid))
+            except IntegrityError:
+                # the sequence was moved back by a control number inserted
+                # explicitly, skip the values which are already taken
+                LOGGER.warning("Control number already taken, skipping", recid=recid)
+                continue
+            return recid
+
     @classmethod
     def create(cls, object_type=None, object_uuid=None, **kwargs):
         """Create a new record identifier."""
@@ -50,7 +108,7 @@ class InspireRecordIdProvider(InspireBaseProvider):
                 LOGGER.info("Control number from legacy", recid=kwargs["pid_value"])
                 RecordIdentifier.insert(kwargs["pid_value"])
             else:
-                kwargs["pid_value"] = str(RecordIdentifier.next())
+                kwargs["pid_value"] = str(cls.next_recid())
                 LOGGER.info(
                     "Control number from RecordIdentifier", recid=kwargs["pid_value"]
                 )
@@ -64,25 +64,33 @@ class InspireTexKeyProvider(InspireBaseProvider):
 
     @classmethod
     def get_texkey_with_random_part(cls, texkey):
+        """Pick a texkey not in use among random candidates.
+
+        Only the candidates are looked up, so that the cost doesn't depend on
+        how many texkeys share the same prefix. A texkey taken concurrently is
+        still caught by the unique constraint of the pidstore when inserting.
+        """
         retry_count = current_app.config.get("PIDSTORE_TEXKEY_MAX_RETRY_COUNT", 5)
         size = current_app.config.get("PIDSTORE_TEXKEY_RANDOM_PART_SIZE", 3)
-        used_texkeys = cls.query_all_texkeys_starting_with(texkey)
-        for _ in range(retry_count):
-            random_part = "".join(random.choices(string.ascii_lowercase, k=size))
-            pid_value = f"{texkey}{random_part}"
+        candidates = [
+            f"{texkey}{''.join(random.choices(string.ascii_lowercase, k=size))}"
+            for _ in range(retry_count)
+        ]
+        used_texkeys = cls.query_used_texkeys(candidates)
+        for pid_value in candidates:
             if pid_value not in used_texkeys:
                 return pid_value
         raise CannotGenerateUniqueTexKey
 
     @classmethod
-    def query_all_texkeys_starting_with(cls, texkey):
+    def query_used_texkeys(cls, texkeys):
         return {
             result[0]
             for result in PersistentIdentifier.query.with_entities(
                 PersistentIdentifier.pid_value
             )
             .filter(PersistentIdentifier.pid_type == cls.pid_type)
-            .filter(PersistentIdentifier.pid_value.startswith(texkey))
+            .filter(PersistentIdentifier.pid_value.in_(texkeys))
         }
 
     @classmethod
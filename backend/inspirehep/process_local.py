@@ -0,0 +1,55 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Values kept once per process, like connection pools and HTTP sessions."""
+
+import os
+import threading
+
+
+class ProcessLocalRegistry:
+    """Registry of values created lazily, once per process and key.
+
+    Values holding sockets or reserved resources must not be shared with the
+    processes forked after they were created (e.g. the Celery worker
+    processes), so every process creates its own. The registry can be used
+    from several threads, ``lock`` is reentrant so that callers can also hold
+    it while they use a value.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self.lock = threading.RLock()
+
+    def get(self, create, key=None):
+        """Get the value of ``key`` for the current process.
+
+        Args:
+            create (callable): called without arguments to create the value
+                the first time it is requested by the process.
+            key (hashable): key of the value, for registries holding several.
+        """
+        process_key = (os.getpid(), key)
+        with self.lock:
+            if process_key not in self._values:
+                self._values[process_key] = create()
+            return self._values[process_key]
+
+    def clear(self):
+        """Drop the values of all the processes.
+
+        Returns:
+            list: the dropped values created by the current process.
+        """
+        current_pid = os.getpid()
+        with self.lock:
+            values = [
+                value
+                for (pid, _key), value in self._values.items()
+                if pid == current_pid
+            ]
+            self._values.clear()
+        return values
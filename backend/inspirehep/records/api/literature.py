@@ -21,6 +21,7 @@ from inspire_schemas.builders import LiteratureBuilder
 from inspire_schemas.parsers.arxiv import ArxivParser
 from inspire_schemas.parsers.crossref import CrossrefParser
 from inspire_schemas.utils import is_arxiv, normalize_arxiv
+from inspire_utils.helpers import flatten_list
 from inspire_utils.record import get_value
 from inspirehep.disambiguation.tasks import disambiguate_authors
 from inspirehep.files.proxies import current_s3_instance
@@ -42,10 +43,14 @@ from inspirehep.records.errors import (
     UnknownImportIdentifierError,
     UnsupportedFileError,
 )
+from inspirehep.records.marshmallow.literature.common.reference_item import (
+    ReferenceItemSchemaV1,
+)
 from inspirehep.records.marshmallow.literature.es import (
     LiteratureElasticSearchSchema,
     LiteratureFulltextElasticSearchSchema,
 )
+from inspirehep.records.marshmallow.literature.utils import get_references_hash
 from inspirehep.records.models import DataLiterature
 from inspirehep.records.utils import (
     download_file_from_url,
@@ -59,12 +64,26 @@ from inspirehep.search.api import LiteratureSearch
 from inspirehep.utils import chunker, hash_data
 from invenio_db import db
 from jsonschema import ValidationError
+from opensearchpy import NotFoundError
 from pdfminer.pdftypes import PDFException
 
 LOGGER = structlog.getLogger()
 
 PLACEHOLDER = "<ID>"
 
+# Values of a record rendered in the references of the papers referencing it,
+# the other author fields (affiliations, ids...) are not shown there
+REFERENCE_DISPLAY_FIELDS = [
+    "arxiv_eprints[0].value",
+    "authors[:10].full_name",
+    "collaborations.value",
+    "deleted",
+    "dois[0].value",
+    "publication_info",
+    "titles[0].title",
+    "urls",
+]
+
 ARXIV_URL = (
     "https://oaipmh.arxiv.org/oai?"
     "verb=GetRecord&"
@@ -260,6 +279,37 @@ class LiteratureRecord(
             if author_with_excluded_ref != previous_author_with_excluded_ref:
                 yield author
 
+    def get_raw_affiliations_with_modified_matches(self):
+        """Return the raw affiliations whose matches may have changed since the
+        previous version.
+
+        Raw affiliations are matched with the authors of curated records only,
+        so they are returned only if the record is or was curated and its
+        authors affiliations, its curation or its deletion changed.
+        """
+        previous_version = self._previous_version
+        if not self.get("curated") and not previous_version.get("curated"):
+            return []
+
+        def get_matching_data(record):
+            return (
+                record.get("curated", False),
+                record.get("deleted", False),
+                [
+                    (author.get("raw_affiliations"), author.get("affiliations"))
+                    for author in record.get("authors", [])
+                ],
+            )
+
+        if get_matching_data(self) == get_matching_data(previous_version):
+            return []
+        return [
+            *flatten_list(self.get_value("authors.raw_affiliations.value", [])),
+            *flatten_list(
+                previous_version.get_value("authors.raw_affiliations.value", [])
+            ),
+        ]
+
     @staticmethod
     def update_authors_uuids(data):
         """Assigns a an uuid to each author of a record."""
@@ -550,6 +600,68 @@ class LiteratureRecord(
         LOGGER.info("No references changed", uuid=str(self.id))
         return set()
 
+    def get_referencing_papers_if_reference_display_changed(self):
+        """Gets all papers referencing this record if the record data shown in
+        their references changed.
+
+        The resolved references are stored in the ``_references_display``
+        field of the referencing papers, so they have to be reindexed.
+
+        Returns:
+            set(uuid): uuids of all the papers referencing this record.
+        """
+        prev_version = self._previous_version
+        if not prev_version or "control_number" not in self:
+            return set()
+        fields_changed = any(
+            get_value(self, field) != get_value(prev_version, field)
+            for field in REFERENCE_DISPLAY_FIELDS
+        )
+        if not fields_changed:
+            return set()
+        uuids = {
+            uuid.UUID(record_uuid)
+            for record_uuid in LiteratureSearch.get_referencing_records_uuids(
+                self["control_number"]
+            )
+        }
+        uuids.discard(self.id)
+        LOGGER.info(
+            f"Found {len(uuids)} papers referencing modified record, indexing them",
+            uuid=str(self.id),
+        )
+        return uuids
+
+    def get_references_display(self):
+        """Get the references of the record resolved as they are displayed.
+
+        The references are resolved when the record is indexed and read back
+        from the ``_references_display`` field of its document. They are
+        resolved again if the document is missing or if the ``_references_hash``
+        stored next to them shows that the references changed since.
+
+        Returns:
+            list(dict): the dumped references, in the same order as the
+            ``references`` of the record.
+        """
+        references = self.get("references", [])
+        try:
+            document = LiteratureSearch().get_source(
+                self.id,
+                _source_includes=["_references_display", "_references_hash"],
+            )
+            if document["_references_hash"] == get_references_hash(references):
+                references_display = orjson.loads(document["_references_display"])
+            else:
+                references_display = None
+        except (NotFoundError, KeyError):
+            references_display = None
+
+        if references_display is None:
+            LOGGER.info("Resolving references of record", uuid=str(self.id))
+            references_display = ReferenceItemSchemaV1(many=True).dump(references).data
+        return references_display
+
     def get_linked_datas_if_authors_changed(self):
         """Gets all data record where linked literature authors changed
 
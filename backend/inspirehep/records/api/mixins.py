@@ -22,7 +22,7 @@ from inspirehep.records.models import (
 )
 from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier
-from sqlalchemy import and_, func, not_, or_, text
+from sqlalchemy import and_, func, not_, or_, text, tuple_
 
 LOGGER = structlog.getLogger()
 
@@ -123,6 +123,61 @@ class CitationMixin(PapersAuthorsExtensionMixin):
             query = query.filter(RecordCitations.is_self_citation.is_(False))
         return query
 
+    def get_citing_records_ids(self, size, cursor=None, page=1):
+        """Returns a page of the records citing this one, most recent first.
+
+        The query is served by the ``(cited_id, citation_date, citer_id)`` index.
+        When paginating with ``cursor``, the citations after it are selected by
+        a row comparison, which the index scan starts from, so the cost doesn't
+        depend on the depth of the page. The citations without date come last
+        and are fetched separately, as they can't be compared with a date.
+
+        Args:
+            size (int): number of citations to return.
+            cursor (tuple): ``(citation_date, citer_id)`` of the last citation of
+                the previous page. When given, ``page`` is ignored.
+            page (int): page number, used only when ``cursor`` is not given.
+        Returns:
+            list: ``(citation_date, citer_id)`` rows.
+        """
+        query = (
+            self._citation_query()
+            .with_entities(RecordCitations.citation_date, RecordCitations.citer_id)
+            .order_by(
+                RecordCitations.citation_date.desc().nullslast(),
+                RecordCitations.citer_id.desc(),
+            )
+        )
+        if not cursor:
+            return query.offset((page - 1) * size).limit(size).all()
+
+        citation_date, citer_id = cursor
+        if citation_date is None:
+            return (
+                query.filter(
+                    RecordCitations.citation_date.is_(None),
+                    RecordCitations.citer_id < citer_id,
+                )
+                .limit(size)
+                .all()
+            )
+
+        citations = (
+            query.filter(
+                tuple_(RecordCitations.citation_date, RecordCitations.citer_id)
+                < tuple_(citation_date, citer_id)
+            )
+            .limit(size)
+            .all()
+        )
+        if len(citations) < size:
+            citations += (
+                query.filter(RecordCitations.citation_date.is_(None))
+                .limit(size - len(citations))
+                .all()
+            )
+        return citations
+
     @property
     def citation_count(self):
         """Gives citation count number
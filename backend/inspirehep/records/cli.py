@@ -7,7 +7,8 @@
 import datetime
 import os
 import re
-from itertools import islice
+import time
+from itertools import chain, islice
 
 import click
 import orjson
@@ -16,14 +17,19 @@ import structlog
 from flask import current_app
 from flask.cli import with_appcontext
 from flask_celeryext.app import current_celery_app
+from flask_sqlalchemy import models_committed
 from inspire_utils.record import get_value
-from inspirehep.mailing.api.jobs import send_job_deadline_reminder
+from inspirehep.indexer.tasks import batch_index
+from inspirehep.mailing.api.jobs import send_job_deadline_reminders
 from inspirehep.pidstore.api.base import PidStoreBase
 from inspirehep.records.api.base import InspireRecord
 from inspirehep.records.api.jobs import JobsRecord
+from inspirehep.records.api.literature import LiteratureRecord
 from inspirehep.records.models import RecordsAuthors
+from inspirehep.records.receivers import index_after_commit
 from inspirehep.records.tasks import (
     populate_journal_literature,
+    redirect_references_to_merged_record,
     regenerate_author_records_table_entries,
     remove_bai_from_literature_authors,
     update_records_relations,
@@ -135,6 +141,126 @@ def _create_records_from_files_in_directory(directory):
                 _create_record(data)
 
 
+def _iter_records_from_json_lines_files(files):
+    for _file in files:
+        for line in _file:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
+
+
+def _iter_records_from_json_lines_urls(urls, token):
+    authorization = f"Bearer {token or current_app.config['AUTHENTICATION_TOKEN']}"
+    for url in urls:
+        click.echo(f"Streaming records from {url}.")
+        with requests.get(
+            url,
+            headers={"Authorization": authorization},
+            stream=True,
+            timeout=current_app.config["IMPORTER_BULK_REQUEST_TIMEOUT"],
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
+
+
+def _bulk_create_or_update_record(data):
+    _replace_host_in_ref_url(data)
+    kwargs = {}
+    if issubclass(InspireRecord.get_class_for_record(data), LiteratureRecord):
+        kwargs = {
+            "disable_external_push": True,
+            "disable_relations_update": True,
+            "disable_disambiguation": True,
+        }
+    with db.session.begin_nested():
+        return InspireRecord.create_or_update(data, **kwargs)
+
+
+def _bulk_update_literature_relations(uuids, batch_size):
+    for batch in chunker(uuids, batch_size):
+        for record in LiteratureRecord.get_records_batched(
+            batch, with_deleted=True, max_batch=batch_size
+        ):
+            record.update_record_relationships()
+        db.session.commit()
+
+
+def _bulk_index_records(uuids, batch_size):
+    request_timeout = current_app.config.get("INDEXER_BULK_REQUEST_TIMEOUT")
+    failures = []
+    for batch in chunker(uuids, batch_size):
+        result = batch_index(
+            batch, request_timeout=request_timeout, skip_indexing_references=True
+        )
+        failures.extend(result.get("failures", []))
+    return failures
+
+
+def _bulk_create_records(records_data, commit_every, index_batch_size):
+    """Create or update records in batches.
+
+    Records are committed every ``commit_every`` records, the relation tables
+    of literature records are updated once all the records exist and all the
+    records are indexed in bulk at the end. Indexing on commit is disabled
+    meanwhile, so that the bulk indexing is the only indexing pass.
+    """
+    models_committed.disconnect(index_after_commit)
+    try:
+        all_uuids, merged_uuids, failed, start_time = _bulk_store_records(
+            records_data, commit_every
+        )
+    finally:
+        models_committed.connect(index_after_commit)
+
+    click.echo(f"Indexing {len(all_uuids)} records.")
+    index_failures = _bulk_index_records(all_uuids, index_batch_size)
+    for uuid in merged_uuids:
+        redirect_references_to_merged_record.delay(uuid)
+
+    elapsed_time = time.monotonic() - start_time
+    message = (
+        f"Bulk import finished in {elapsed_time:.1f}s: {len(all_uuids)} records "
+        f"imported, {failed} failed, {len(index_failures)} failed to index."
+    )
+    color = "red" if failed or index_failures else "green"
+    click.echo(click.style(message, fg=color))
+
+
+def _bulk_store_records(records_data, commit_every):
+    all_uuids = []
+    literature_uuids = []
+    merged_uuids = []
+    failed = 0
+    start_time = time.monotonic()
+    for chunk in chunker(records_data, commit_every):
+        for data in chunk:
+            try:
+                record = _bulk_create_or_update_record(data)
+            except Exception:
+                LOGGER.exception(
+                    "Cannot import record", recid=data.get("control_number")
+                )
+                failed += 1
+                continue
+            all_uuids.append(str(record.id))
+            if isinstance(record, LiteratureRecord):
+                literature_uuids.append(str(record.id))
+            if "new_record" in record:
+                merged_uuids.append(str(record.id))
+        db.session.commit()
+        elapsed_time = max(time.monotonic() - start_time, 1e-3)
+        click.echo(
+            f"Imported {len(all_uuids)} records, {failed} failed "
+            f"({len(all_uuids) / elapsed_time:.1f} records/s)."
+        )
+
+    click.echo(f"Updating relations of {len(literature_uuids)} literature records.")
+    _bulk_update_literature_relations(literature_uuids, commit_every)
+    return all_uuids, merged_uuids, failed, start_time
+
+
 @click.group()
 def importer():
     """Command to import records."""
@@ -195,6 +321,65 @@ def records(urls, directory, files, save, token):
     _create_records_from_files_in_directory(directory)
 
 
+@importer.command("bulk-records", help="Import records in bulk from JSON lines.")
+@click.option(
+    "-u",
+    "--urls",
+    multiple=True,
+    default=[],
+    type=str,
+    help="URL of a JSON lines dump, one raw record per line.",
+)
+@click.option(
+    "-f",
+    "--files",
+    multiple=True,
+    default=[],
+    type=click.File("rb"),
+    help="Path to a JSON lines dump, one raw record per line.",
+)
+@click.option(
+    "-c",
+    "--commit-every",
+    default=500,
+    show_default=True,
+    help="Number of records created in a single transaction.",
+)
+@click.option(
+    "-bs",
+    "--index-batch-size",
+    default=200,
+    show_default=True,
+    help="Number of records indexed in a single bulk request.",
+)
+@click.option(
+    "-t",
+    "--token",
+    help=(
+        "Auth token to be used while importing from urls, instead of"
+        " app.config['AUTHENTICATION_TOKEN']}"
+    ),
+    default=None,
+)
+@with_appcontext
+def bulk_records(urls, files, commit_every, index_batch_size, token):
+    """Import records from JSON lines dumps.
+
+    External pushes and author disambiguation are disabled for literature
+    records, relation tables are updated in a batched pass once all records
+    are created and indexing happens in bulk at the end.
+
+    Example:
+
+        >>> inspirehep importer bulk-records -f hep.jsonl -f authors.jsonl
+    """
+    records_data = chain(
+        _iter_records_from_json_lines_files(files),
+        _iter_records_from_json_lines_urls(urls, token),
+    )
+    _bulk_create_records(records_data, commit_every, index_batch_size)
+
+
 @importer.command("demo-records", help="Import demo records")
 @with_appcontext
 def demo_records():
@@ -251,8 +436,9 @@ def close_expired_jobs(notify):
     db.session.commit()
 
     if notify:
-        for job_record in expired_job_records:
-            send_job_deadline_reminder(dict(job_record))
+        send_job_deadline_reminders(
+            [dict(job_record) for job_record in expired_job_records]
+        )
 
     LOGGER.info("Closed expired jobs", notify=notify, num_records=len(expired_jobs))
 
@@ -877,11 +877,23 @@ LITERATURE_SOURCE_EXCLUDES_BY_CONTENT_TYPE = {
         "_latex_eu_display",
         "_bibtex_display",
         "_cv_format",
+        "_references_display",
+        "_references_hash",
     ],
 }
 
+LITERATURE_CITATIONS_SOURCE = [
+    "authors",
+    "control_number",
+    "earliest_date",
+    "titles",
+    "publication_info",
+]
 
 ADDITIONAL_LINKS = {"LITERATURE": {"citations": build_citation_search_link}}
 
 FILES_RESTRICTED_MIMETYPES = ("text/html", "text/javascript")
 FILES_SIZE_LIMIT = 100 * 1024 * 1024  # ~ 100MB
+
+#: Timeout (in seconds) of the requests streaming record dumps in bulk imports.
+IMPORTER_BULK_REQUEST_TIMEOUT = 60
@@ -35,6 +35,8 @@ FIELDS_TO_EXCLUDE = [
     "_latex_eu_display",
     "_bibtex_display",
     "_cv_format",
+    "_references_display",
+    "_references_hash",
 ]
 
 
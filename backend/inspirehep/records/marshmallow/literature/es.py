@@ -22,11 +22,17 @@ from inspirehep.records.marshmallow.literature.common.author import (
     FirstAuthorSchemaV1,
     SupervisorSchema,
 )
+from inspirehep.records.marshmallow.literature.common.reference_item import (
+    ReferenceItemSchemaV1,
+)
 from inspirehep.records.marshmallow.literature.common.thesis_info import (
     ThesisInfoSchemaForESV1,
 )
 from inspirehep.records.marshmallow.literature.ui import LiteratureDetailSchema
-from inspirehep.records.marshmallow.literature.utils import get_expanded_authors
+from inspirehep.records.marshmallow.literature.utils import (
+    get_expanded_authors,
+    get_references_hash,
+)
 from inspirehep.records.marshmallow.utils import (
     get_facet_author_name_lit_and_dat,
 )
@@ -50,6 +56,8 @@ class LiteratureElasticSearchSchema(ElasticSearchBaseSchema, LiteratureRawSchema
     _latex_eu_display = fields.Method("get_latex_eu_display", dump_only=True)
     _bibtex_display = fields.Method("get_bibtex_display", dump_only=True)
     _cv_format = fields.Method("get_cv_format", dump_only=True)
+    _references_display = fields.Method("get_references_display", dump_only=True)
+    _references_hash = fields.Method("get_references_hash", dump_only=True)
     abstracts = fields.Nested(AbstractSource, dump_only=True, many=True)
     author_count = fields.Method("get_author_count")
     authors = fields.Nested(AuthorsInfoSchemaForES, dump_only=True, many=True)
@@ -104,6 +112,19 @@ class LiteratureElasticSearchSchema(ElasticSearchBaseSchema, LiteratureRawSchema
     def get_ui_display(self, record):
         return orjson.dumps(LiteratureDetailSchema().dump(record).data).decode("utf-8")
 
+    def get_references_display(self, record):
+        references = record.get("references")
+        if not references:
+            return missing
+        references_display = ReferenceItemSchemaV1(many=True).dump(references).data
+        return orjson.dumps(references_display).decode("utf-8")
+
+    def get_references_hash(self, record):
+        references = record.get("references")
+        if not references:
+            return missing
+        return get_references_hash(references)
+
     def get_expanded_authors_display(self, record):
         expanded_authors = get_expanded_authors(record)
         return orjson.dumps(expanded_authors).decode("utf-8")
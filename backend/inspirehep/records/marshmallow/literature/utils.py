@@ -6,8 +6,10 @@
 
 import re
 
+import orjson
 from inspire_dojson.utils import get_recid_from_ref
 from inspirehep.records.api.base import InspireRecord
+from inspirehep.utils import hash_data
 from pylatexenc.latexencode import (
     RULE_DICT,
     UnicodeToLatexConversionRule,
@@ -19,6 +21,11 @@ from pylatexenc.latexencode import (
 MATH_EXPRESSION_REGEX = re.compile(r"((?<!\\)\$.*?(?<!\\)\$|(?<!\\)\\\(.*?(?<!\\)\\\))")
 
 
+def get_references_hash(references):
+    """Hash of the references of a record, to know if they were resolved."""
+    return hash_data(orjson.dumps(references, option=orjson.OPT_SORT_KEYS))
+
+
 def get_pages(data):
     pub_info = InspireRecord.get_value(data, "publication_info")
     page_start_list = []
@@ -63,6 +63,14 @@ class RecordCitations(db.Model):
     is_self_citation = db.Column(Boolean, nullable=False, default=False)
 
 
+db.Index(
+    "ix_records_citations_cited_id_citation_date",
+    RecordCitations.cited_id,
+    RecordCitations.citation_date.desc().nullslast(),
+    RecordCitations.citer_id.desc(),
+)
+
+
 class ConferenceToLiteratureRelationshipType(enum.Enum):
     conference_paper = "conference paper"
     proceedings = "proceedings"
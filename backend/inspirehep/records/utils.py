@@ -4,9 +4,13 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+import base64
+import datetime
+import uuid
 from io import BytesIO
 from itertools import chain
 
+import orjson
 import pdfplumber
 import requests
 import structlog
@@ -177,3 +181,26 @@ def get_changed_reference(old_record_version, new_record_version):
                 "previous_version": old_ref,
                 "reference_index": idx,
             }
+
+
+def encode_citations_cursor(citation_date, citer_id):
+    """Encode the position of a citation in an opaque pagination cursor."""
+    data = [citation_date.isoformat() if citation_date else None, str(citer_id)]
+    return base64.urlsafe_b64encode(orjson.dumps(data)).decode()
+
+
+def decode_citations_cursor(cursor):
+    """Decode a cursor built with :func:`encode_citations_cursor`.
+
+    Returns:
+        tuple: ``(citation_date, citer_id)``.
+    Raises:
+        ValueError: if the cursor is malformed.
+    """
+    try:
+        citation_date, citer_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        if citation_date is not None:
+            citation_date = datetime.date.fromisoformat(citation_date)
+        return citation_date, uuid.UUID(citer_id)
+    except (TypeError, ValueError, orjson.JSONDecodeError) as e:
+        raise ValueError(f"Invalid cursor {cursor}") from e
@@ -6,6 +6,7 @@
 import structlog
 from flask import Blueprint, abort, current_app, request
 from flask.views import MethodView
+from inspire_dojson.utils import strip_empty_values
 from inspirehep.accounts.decorators import login_required, login_required_with_roles
 from inspirehep.accounts.roles import Roles
 from inspirehep.pidstore.api.base import PidStoreBase
@@ -24,11 +25,10 @@ from inspirehep.records.errors import (
 from inspirehep.records.marshmallow.literature.common.reference_item import (
     ReferenceItemSchemaV2,
 )
-from inspirehep.records.marshmallow.literature.references import (
-    LiteratureReferencesSchema,
-)
 from inspirehep.records.models import WorkflowsRecordSources
 from inspirehep.records.utils import (
+    decode_citations_cursor,
+    encode_citations_cursor,
     get_changed_reference,
     get_ref_from_pid,
 )
@@ -54,6 +54,7 @@ class LiteratureCitationsResource(MethodView):
     def get(self, pid, record):
         page = request.values.get("page", 1, type=int)
         size = request.values.get("size", 10, type=int)
+        cursor = request.values.get("cursor", None, type=str)
 
         if page < 1 or size < 1:
             abort(400)
@@ -61,16 +62,31 @@ class LiteratureCitationsResource(MethodView):
         if size > current_app.config["MAX_API_RESULTS"]:
             raise MaxResultWindowRESTError
 
-        citing_records_results = LiteratureSearch.citations(record, page, size)
-        citing_records_count = citing_records_results.total["value"]
-        citing_records = [citation.to_dict() for citation in citing_records_results]
+        if cursor:
+            try:
+                cursor = decode_citations_cursor(cursor)
+            except ValueError:
+                abort(400)
+
+        citations = record.get_citing_records_ids(size + 1, cursor=cursor, page=page)
+        has_next_page = len(citations) > size
+        citations = citations[:size]
+        citing_records = LiteratureSearch().mget(
+            [str(citation.citer_id) for citation in citations],
+            _source=current_app.config["LITERATURE_CITATIONS_SOURCE"],
+        )
 
         data = {
             "metadata": {
                 "citations": citing_records,
-                "citation_count": citing_records_count,
+                "citation_count": record.citation_count,
             }
         }
+        if has_next_page:
+            last_citation = citations[-1]
+            data["metadata"]["next_cursor"] = encode_citations_cursor(
+                last_citation.citation_date, last_citation.citer_id
+            )
         return jsonify(data)
 
 
@@ -88,12 +104,10 @@ class LiteratureReferencesResource(MethodView):
         if size > current_app.config["MAX_API_RESULTS"]:
             raise MaxResultWindowRESTError()
 
-        references = record.get("references", [])
+        references = record.get_references_display()
         selected_references = references[(page - 1) * size : page * size]
         data = {
-            "metadata": LiteratureReferencesSchema()
-            .dump({"references": selected_references})
-            .data
+            "metadata": strip_empty_values({"references": selected_references}) or {}
         }
         data["metadata"]["references_count"] = len(references)
         return jsonify(data)
@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Shared Redis access layer.
+
+All backend code talking to Redis (editor locks, ORCID caches, distributed
+locks, ...) should get its client from here, so that a single connection pool
+is kept per process and per Redis URL instead of opening new connections on
+every access.
+"""
+
+from contextlib import contextmanager
+from functools import partial
+
+import structlog
+from flask import current_app
+from redis import ConnectionPool, StrictRedis
+
+from inspirehep.process_local import ProcessLocalRegistry
+
+LOGGER = structlog.getLogger()
+
+_POOLS = ProcessLocalRegistry()
+
+
+def _get_connection_pool(redis_url, decode_responses):
+    return _POOLS.get(
+        partial(
+            ConnectionPool.from_url,
+            redis_url,
+            decode_responses=decode_responses,
+            max_connections=current_app.config.get(
+                "REDIS_CONNECTION_POOL_MAX_CONNECTIONS"
+            ),
+            socket_timeout=current_app.config.get("REDIS_SOCKET_TIMEOUT"),
+            socket_connect_timeout=current_app.config.get(
+                "REDIS_SOCKET_CONNECT_TIMEOUT"
+            ),
+            health_check_interval=current_app.config.get(
+                "REDIS_HEALTH_CHECK_INTERVAL", 0
+            ),
+        ),
+        key=(redis_url, decode_responses),
+    )
+
+
+def get_redis_client(redis_url=None, decode_responses=False):
+    """Get a Redis client backed by the process-wide connection pool.
+
+    Args:
+        redis_url (str): Redis URL, defaults to ``CACHE_REDIS_URL``.
+        decode_responses (bool): if ``True`` the client returns ``str``
+            instead of ``bytes``.
+
+    Returns:
+        redis.StrictRedis: the client. Creating it is cheap, connections are
+        only borrowed from the pool when a command is executed.
+    """
+    redis_url = redis_url or current_app.config.get("CACHE_REDIS_URL")
+    pool = _get_connection_pool(redis_url, decode_responses)
+    return StrictRedis(connection_pool=pool)
+
+
+@contextmanager
+def redis_pipeline(redis_url=None, decode_responses=False, transaction=True):
+    """Context manager sending all the queued commands in one round trip.
+
+    The commands still queued are executed when the block exits without an
+    exception. Callers needing the results call ``pipeline.execute()`` in the
+    block themselves.
+
+    Examples:
+        >>> with redis_pipeline() as pipeline:
+        ...     pipeline.hset("name", key="key", value="value")
+        ...     pipeline.expire("name", 60)
+        >>> with redis_pipeline() as pipeline:
+        ...     pipeline.get("name")
+        ...     pipeline.ttl("name")
+        ...     value, ttl = pipeline.execute()
+    """
+    client = get_redis_client(redis_url, decode_responses=decode_responses)
+    with client.pipeline(transaction=transaction) as pipeline:
+        yield pipeline
+        # a no-op if the caller already executed the queued commands
+        pipeline.execute()
+
+
+def reset_redis_connection_pools():
+    """Drop all the connection pools of the current process.
+
+    Called after a Celery worker process is forked, as the sockets inherited
+    from the parent must not be shared between processes.
+    """
+    for pool in _POOLS.clear():
+        pool.disconnect()
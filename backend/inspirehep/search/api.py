@@ -87,7 +87,11 @@ class SearchMixin:
                 body={"ids": uuids},
                 **kwargs,
             )
-            results = [document["_source"] for document in documents["docs"]]
+            results = [
+                document["_source"]
+                for document in documents["docs"]
+                if document.get("found")
+            ]
         except RequestError:
             pass
 
@@ -264,33 +268,6 @@ class LiteratureSearch(InspireSearch):
         ).get(content_type)
         return self.source(includes=includes, excludes=excludes)
 
-    @staticmethod
-    def citations(record, page=1, size=10):
-        if "control_number" not in record:
-            return None
-
-        _source = [
-            "authors",
-            "control_number",
-            "earliest_date",
-            "titles",
-            "publication_info",
-        ]
-        from_rec = (page - 1) * size
-        citations_query = (
-            Q("match", **{"references.record.$ref": record["control_number"]})
-            & Q("match", **{"_collections": "Literature"})
-            & ~Q("match", **{"related_records.relation": "successor"})
-            & ~Q("match", **{"control_number": record["control_number"]})
-        )
-        citations_search = (
-            LiteratureSearch()
-            .query(citations_query)
-            .params(_source=_source, from_=from_rec, size=size)
-            .sort("-earliest_date")
-        )
-        return citations_search.execute().hits
-
     @staticmethod
     def get_records_by_pids(pids, source=None, size=10000):
         if not pids:
@@ -307,6 +284,20 @@ class LiteratureSearch(InspireSearch):
             results = results.params(_source=source)
         return results.execute().hits
 
+    @staticmethod
+    def get_referencing_records_uuids(control_number):
+        """Get the uuids of all the records referencing the given record.
+
+        Args:
+            control_number (int): the control number of the referenced record.
+
+        Returns:
+            set(str): the uuids of the referencing records.
+        """
+        query = Q("match", **{"references.record.$ref": control_number})
+        results = LiteratureSearch().query(query).source(False)
+        return {result.meta.id for result in results.scan()}
+
 
 class LiteratureAggregationsSearch(LiteratureSearch):
     def execute(self, *args, **kwargs):
@@ -13,6 +13,7 @@ import requests
 import structlog
 from flask import current_app, render_template
 from inspire_utils.record import get_value
+from inspirehep.process_local import ProcessLocalRegistry
 from inspirehep.snow.errors import (
     CreateTicketException,
     EditTicketException,
@@ -21,9 +22,43 @@ from inspirehep.snow.errors import (
 from inspirehep.snow.utils import get_response_result, strip_lines
 from inspirehep.utils import DistributedLockError, distributed_lock
 from invenio_cache import current_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 LOGGER = structlog.getLogger()
 
+_SNOW_SESSIONS = ProcessLocalRegistry()
+
+
+def _create_snow_session():
+    retry = Retry(
+        total=current_app.config.get("SNOW_REQUEST_MAX_RETRIES", 3),
+        backoff_factor=current_app.config.get("SNOW_REQUEST_BACKOFF_FACTOR", 0.5),
+        status_forcelist=(429, 502, 503, 504),
+        # creating tickets or adding comments twice is worse than failing
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_maxsize=current_app.config.get("SNOW_CONNECTION_POOL_SIZE", 10),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_snow_session():
+    """Get the HTTP session of the current process used to talk to SNOW.
+
+    The session is shared by all the SNOW clients of the process, so that the
+    connections to SNOW are pooled and reused across requests and tasks.
+    Failed ``GET`` requests are retried with exponential backoff, the other
+    requests only when the connection to SNOW couldn't be established.
+    """
+    return _SNOW_SESSIONS.get(_create_snow_session)
+
 
 class SnowTicketAPI:
     """Implements basic methods to interact with SNOW (CERN implementation).
@@ -45,6 +80,8 @@ class SnowTicketAPI:
         self.verify_cert = verify_cert
         self.base_url = url or current_app.config.get("SNOW_URL", "")
         self.api_url = f"{self.base_url}/api/now/table"
+        self.session = get_snow_session()
+        self.timeout = current_app.config.get("SNOW_REQUEST_TIMEOUT", 30)
 
     def relogin_if_needed(f):
         """Recalculate SNOW token if it's invalid."""
@@ -98,7 +135,12 @@ class SnowTicketAPI:
             "Content-Type": "application/x-www-form-urlencoded",
         }
         try:
-            response = requests.post(self.auth_url, data=login_payload, headers=headers)
+            response = self.session.post(
+                self.auth_url,
+                data=login_payload,
+                headers=headers,
+                timeout=self.timeout,
+            )
             response.raise_for_status()
             return response.json()["access_token"]
         except (requests.exceptions.RequestException, KeyError) as e:
@@ -112,10 +154,11 @@ class SnowTicketAPI:
             endpoint (str): an endpoint name.
             payload (:obj:`dict`): ticket payload.
         """
-        response = requests.post(
+        response = self.session.post(
             f"{self.api_url}/{endpoint}",
             data=orjson.dumps(payload),
             headers=self.headers,
+            timeout=self.timeout,
         )
         response.raise_for_status()
         return get_response_result(response)["sys_id"]
@@ -128,10 +171,11 @@ class SnowTicketAPI:
             params (str|:obj:`dict`, optional): params to be passed to the request query string.
                 Defaults to None.
         """
-        ticket_response = requests.get(
+        ticket_response = self.session.get(
             f"{self.api_url}/u_request_fulfillment/{ticket_id}",
             params=params,
             headers=self.headers,
+            timeout=self.timeout,
         )
         ticket_response.raise_for_status()
         return get_response_result(ticket_response)
@@ -146,21 +190,17 @@ class SnowTicketAPI:
          Returns:
             str: human-readable category name. None if the category is not found.
         """
-        try:
-            category = (
-                self.get_functional_categories_from_cache()
-                .get(category_id, {})
-                .get("sys_name")
-            )
-            if not category:
-                category = self.get_functional_categories_from_cache(force_update=True)[
-                    category_id
-                ].get("sys_name")
-            return category
-        except KeyError:
+        category = self._get_cached_lookup_entry(
+            "snow_functional_categories",
+            category_id,
+            self.get_functional_categories_from_cache,
+        )
+        if not category:
             LOGGER.warning(
                 "Functional category was not found!", category_id=category_id
             )
+            return None
+        return category.get("sys_name")
 
     @relogin_if_needed
     def get_user(self, user_id):
@@ -172,15 +212,13 @@ class SnowTicketAPI:
         Returns:
             (str): User name if the user exists. None if the user doesn't exist
         """
-        try:
-            user = self.get_users_from_cache().get(user_id, {}).get("user.name")
-            if not user:
-                user = self.get_users_from_cache(force_update=True)[user_id][
-                    "user.name"
-                ]
-            return user
-        except KeyError:
+        user = self._get_cached_lookup_entry(
+            "snow_users", user_id, self.get_users_from_cache
+        )
+        if not user:
             LOGGER.warning("User was not found!", user_id=user_id)
+            return None
+        return user.get("user.name")
 
     @relogin_if_needed
     def edit_ticket(self, ticket_id, payload):
@@ -193,10 +231,11 @@ class SnowTicketAPI:
         Returns:
             Edited ticket (list(dict)).
         """
-        response = requests.put(
+        response = self.session.put(
             f"{self.api_url}/u_request_fulfillment/{ticket_id}",
             orjson.dumps(payload),
             headers=self.headers,
+            timeout=self.timeout,
         )
         response.raise_for_status()
         return get_response_result(response)
@@ -221,10 +260,11 @@ class SnowTicketAPI:
         search_parameters_query_string = urllib.parse.urlencode(
             search_parameters, safe="&=^"
         )
-        response = requests.get(
+        response = self.session.get(
             f"{self.api_url}/{endpoint}",
             params=search_parameters_query_string,
             headers=self.headers,
+            timeout=self.timeout,
         )
         response.raise_for_status()
         return get_response_result(response)
@@ -257,11 +297,7 @@ class SnowTicketAPI:
                 category["sys_id"]: category
                 for category in self.get_functional_categories()
             }
-            current_cache.set(
-                "snow_functional_categories",
-                new_categories,
-                timeout=current_app.config.get("SNOW_CACHE_TIMEOUT", 86400),
-            )
+            self._write_lookup_to_cache("snow_functional_categories", new_categories)
             return new_categories
         return categories
 
@@ -288,14 +324,55 @@ class SnowTicketAPI:
         users = current_cache.get("snow_users")
         if not users or force_update:
             new_users = {user["user.sys_id"]: user for user in self.get_users()}
-            current_cache.set(
-                "snow_users",
-                new_users,
-                timeout=current_app.config.get("SNOW_CACHE_TIMEOUT", 86400),
-            )
+            self._write_lookup_to_cache("snow_users", new_users)
             return new_users
         return users
 
+    def _write_lookup_to_cache(self, cache_key, entries):
+        """Cache a lookup as a whole and each of its entries by id.
+
+        Args:
+            cache_key (str): cache key of the lookup.
+            entries (dict): the entries of the lookup as {entry_id: entry_data}.
+        """
+        timeout = current_app.config.get("SNOW_CACHE_TIMEOUT", 86400)
+        current_cache.set(cache_key, entries, timeout=timeout)
+        current_cache.set_many(
+            {f"{cache_key}:{entry_id}": entry for entry_id, entry in entries.items()},
+            timeout=timeout,
+        )
+        current_cache.set(
+            f"{cache_key}:refreshed",
+            True,
+            timeout=current_app.config.get("SNOW_CACHE_REFRESH_INTERVAL", 300),
+        )
+
+    def _get_cached_lookup_entry(self, cache_key, entry_id, get_lookup):
+        """Get an entry of a cached lookup by id.
+
+        Only the requested entry is read from the cache. When it's not there,
+        the whole lookup is reloaded from SNOW, but at most once every
+        ``SNOW_CACHE_REFRESH_INTERVAL`` seconds, so that looking up ids unknown
+        to SNOW doesn't reload it every time.
+
+        Args:
+            cache_key (str): cache key of the lookup.
+            entry_id (str): SNOW sys_id of the entry.
+            get_lookup (callable): returns the lookup, reloaded from SNOW
+                when called with ``force_update=True``.
+
+        Returns:
+            dict: the entry, None if it's not found.
+        """
+        entry = current_cache.get(f"{cache_key}:{entry_id}")
+        if entry is None and current_cache.add(
+            f"{cache_key}:refreshed",
+            True,
+            timeout=current_app.config.get("SNOW_CACHE_REFRESH_INTERVAL", 300),
+        ):
+            entry = get_lookup(force_update=True).get(entry_id)
+        return entry
+
 
 class InspireSnow(SnowTicketAPI):
     """Implements Inspire-specific methods to manage tickets related to Inspire."""
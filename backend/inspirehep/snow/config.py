@@ -15,6 +15,11 @@ SNOW_USERS_EMAILS_MAPPING = {"testemail@cern.ch": "testemail@non-cern-domain.com
 SNOW_INSPIRE_ASSIGNEMENT_GROUP = "1234"
 SNOW_OVERRIDE_FUNCTIONAL_CATEGORY = "1234"
 SNOW_CACHE_TIMEOUT = 86400
+SNOW_CACHE_REFRESH_INTERVAL = 300
+SNOW_REQUEST_TIMEOUT = 30
+SNOW_REQUEST_MAX_RETRIES = 3
+SNOW_REQUEST_BACKOFF_FACTOR = 0.5
+SNOW_CONNECTION_POOL_SIZE = 10
 SNOW_TICKETS_ENDPOINT = "u_request_fulfillment"
 SNOW_THIRD_PARTY_TICKET_ENDPOINT = "u_third_party_ticket_inspire"
 SNOW_TICKET_STATUS_MAPPING = {
@@ -8,7 +8,12 @@
 import re
 from os.path import splitext
 
+from inspirehep.accounts.api import is_superuser_or_cataloger_logged_in
 from inspirehep.search.api import LiteratureSearch
+from inspirehep.utils import chunker
+from invenio_search import current_search_client
+from invenio_search.utils import prefix_index
+from opensearch_dsl import MultiSearch
 from werkzeug.utils import secure_filename
 
 FORMAT_TO_SOURCE_FIELD = {
@@ -18,6 +23,9 @@ FORMAT_TO_SOURCE_FIELD = {
     "cv": "_cv_format",
 }
 
+#: Maximum number of references resolved in a single multi search.
+REFERENCES_MULTI_SEARCH_CHUNK_SIZE = 250
+
 
 def get_references(f):
     """Extract references from LaTeX string (whole file)"""
@@ -41,43 +49,68 @@ def get_references(f):
     return list(references.items())
 
 
+def _exact_reference_search(field, value):
+    search = LiteratureSearch().query("term", **{field: value})
+    if not is_superuser_or_cataloger_logged_in():
+        search = search.filter("terms", _collections=["Literature"])
+    return search
+
+
+def get_reference_search(ref):
+    """Build the search of the literature record cited with ``ref``.
+
+    ADS bibcodes, texkeys and eprints are looked up exactly, journal
+    references and report numbers through the query parser.
+    """
+    if re.search(r"^\d{4}[\w.&]{15}$", ref):
+        return _exact_reference_search("external_system_identifiers.value.raw", ref)
+    if re.search(r".*\:\d{4}\w\w\w?", ref):
+        return _exact_reference_search("texkeys.raw", ref)
+    if re.search(r".*\/\d{7}", ref) or re.search(r"\d{4}\.\d{4,5}", ref):
+        return _exact_reference_search(
+            "arxiv_eprints.value.raw", re.sub(r"^arxiv:", "", ref, flags=re.I)
+        )
+
+    query = ref
+    keyword = None
+    if re.search(r"\w\.\w+\.\w", ref):
+        keyword = "j"
+        query = re.sub(r"\.", ",", ref)
+    elif re.search(r"\w\-\w", ref):
+        keyword = "r"
+    return LiteratureSearch().query_from_iq(f"{keyword}:{query}")
+
+
 def find_references(references, requested_format):
     display_format = FORMAT_TO_SOURCE_FIELD[requested_format]
     ret = []
     errors = []
-    for ref, line in references:
-        query = ref
-        keyword = None
-        if re.search(r"^\d{4}[\w.&]{15}$", ref):
-            # ads
-            keyword = "external_system_identifiers.value"
-        elif re.search(r".*\:\d{4}\w\w\w?", ref):
-            keyword = "texkey"
-        elif re.search(r".*\/\d{7}", ref) or re.search(r"\d{4}\.\d{4,5}", ref):
-            keyword = "eprint"
-        elif re.search(r"\w\.\w+\.\w", ref):
-            keyword = "j"
-            query = re.sub(r"\.", ",", ref)
-        elif re.search(r"\w\-\w", ref):
-            keyword = "r"
-
-        results = (
-            LiteratureSearch()
-            .query_from_iq(f"{keyword}:{query}")
-            .params(size=2, _source=[display_format, "texkeys", "control_number"])
-            .execute()
+    for references_chunk in chunker(references, REFERENCES_MULTI_SEARCH_CHUNK_SIZE):
+        multi_search = MultiSearch(
+            index=prefix_index("records-hep"), using=current_search_client
         )
-
-        hits = results.hits.hits
-        if len(hits) == 0:
-            errors.append({"ref": ref, "line": line, "type": "not found"})
-        elif len(hits) > 1:
-            errors.append({"ref": ref, "line": line, "type": "ambiguous"})
-        else:
-            source_field = hits[0]["_source"]
-            control_number = source_field["control_number"]
-            texkey = getattr(source_field, "texkeys", [control_number])[0]
-            ret.append(source_field[display_format].replace(f"{{{texkey}", f"{{{ref}"))
+        for ref, _line in references_chunk:
+            multi_search = multi_search.add(
+                get_reference_search(ref)
+                .source([display_format, "texkeys", "control_number"])
+                .extra(size=2)
+            )
+
+        for (ref, line), results in zip(
+            references_chunk, multi_search.execute(), strict=True
+        ):
+            hits = results.hits.hits
+            if len(hits) == 0:
+                errors.append({"ref": ref, "line": line, "type": "not found"})
+            elif len(hits) > 1:
+                errors.append({"ref": ref, "line": line, "type": "ambiguous"})
+            else:
+                source_field = hits[0]["_source"]
+                control_number = source_field["control_number"]
+                texkey = getattr(source_field, "texkeys", [control_number])[0]
+                ret.append(
+                    source_field[display_format].replace(f"{{{texkey}", f"{{{ref}")
+                )
 
     return ret, errors
 
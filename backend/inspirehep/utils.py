@@ -16,10 +16,11 @@ import structlog
 import zulip
 from flask import current_app
 from flask_celeryext.app import current_celery_app
-from redis import StrictRedis
 from redis_lock import Lock
 from werkzeug.utils import import_string
 
+from inspirehep.redis_client import get_redis_client
+
 LOGGER = structlog.getLogger()
 
 MAX_CHARACTERS_IN_ZULIP_MESSAGE = 200
@@ -249,9 +250,7 @@ def distributed_lock(lock_name, expire=10, auto_renewal=True, blocking=False):
     if not lock_name:
         raise ValueError("Lock name not specified.")
 
-    redis_url = current_app.config.get("CACHE_REDIS_URL")
-
-    redis = StrictRedis.from_url(redis_url)
+    redis = get_redis_client()
     lock = Lock(redis, lock_name, expire=expire, auto_renewal=auto_renewal)
 
     if lock.acquire(blocking=blocking):
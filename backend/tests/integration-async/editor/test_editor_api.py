@@ -386,6 +386,76 @@ def test_get_revision(inspire_app, clean_celery_session, record_with_two_revisio
     assert result["titles"][0]["title"] == "record rev0"
 
 
+def test_get_revision_diff(
+    inspire_app, clean_celery_session, record_with_two_revisions
+):
+    user = create_user(role=Roles.cataloger.value)
+    record = LiteratureRecord.get_record_by_pid_value(record_with_two_revisions)
+
+    transaction_id_of_last_rev = record.revisions[1].model.transaction_id
+    rec_uuid = record.id
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.get(
+            f"/api/editor/revisions/{rec_uuid}/{transaction_id_of_last_rev}/diff",
+            content_type="application/json",
+        )
+
+    assert response.status_code == 200
+
+    result = orjson.loads(response.data)
+
+    assert {
+        "op": "replace",
+        "path": "/titles/0/title",
+        "value": "record rev1",
+    } in result
+
+
+def test_get_revision_diff_of_first_revision(
+    inspire_app, clean_celery_session, record_with_two_revisions
+):
+    user = create_user(role=Roles.cataloger.value)
+    record = LiteratureRecord.get_record_by_pid_value(record_with_two_revisions)
+
+    transaction_id_of_first_rev = record.revisions[0].model.transaction_id
+    rec_uuid = record.id
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.get(
+            f"/api/editor/revisions/{rec_uuid}/{transaction_id_of_first_rev}/diff",
+            content_type="application/json",
+        )
+
+    assert response.status_code == 200
+
+    result = orjson.loads(response.data)
+
+    assert {
+        "op": "add",
+        "path": "/titles",
+        "value": [{"title": "record rev0"}],
+    } in result
+
+
+def test_get_revision_diff_with_error(
+    inspire_app, clean_celery_session, record_with_two_revisions
+):
+    user = create_user(role=Roles.cataloger.value)
+    record = LiteratureRecord.get_record_by_pid_value(record_with_two_revisions)
+    rec_uuid = record.id
+
+    wrong_transaction_id = 88888
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.get(
+            f"/api/editor/revisions/{rec_uuid}/{wrong_transaction_id}/diff",
+            content_type="application/json",
+        )
+
+    assert response.status_code == 400
+
+
 def test_editor_locks_are_passed_in_payload_when_another_user_editing(
     inspire_app,
     clean_celery_session,
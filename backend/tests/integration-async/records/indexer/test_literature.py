@@ -258,6 +258,36 @@ def test_lit_record_reindexes_references_when_earliest_date_changed(
     assert_record()
 
 
+def test_lit_record_reindexes_referencing_records_when_title_changed(
+    inspire_app, clean_celery_session
+):
+    data_cited_record = faker.record("lit")
+    cited_record = LiteratureRecord.create(data_cited_record)
+    db.session.commit()
+
+    citations = [cited_record["control_number"]]
+    data_citing_record = faker.record("lit", literature_citations=citations)
+    citing_record = LiteratureRecord.create(data_citing_record)
+    db.session.commit()
+
+    assert_citation_count(cited_record, 1)
+
+    expected_titles = [{"title": "A new title"}]
+    data_cited_record["titles"] = expected_titles
+    data_cited_record["control_number"] = cited_record["control_number"]
+    cited_record.update(data_cited_record)
+    db.session.commit()
+
+    @retry_test(stop=stop_after_delay(30), wait=wait_fixed(3))
+    def assert_record():
+        current_search.flush_and_refresh("records-hep")
+        record_from_es = LiteratureSearch().get_record_data_from_es(citing_record)
+        references_display = orjson.loads(record_from_es["_references_display"])
+        assert expected_titles == references_display[0]["titles"]
+
+    assert_record()
+
+
 def test_many_records_in_one_commit(inspire_app, clean_celery_session):
     record_recids = set()
     for _x in range(4):
@@ -14,6 +14,14 @@ from sqlalchemy.engine import reflection
 def test_downgrade(inspire_app):
     alembic = Alembic(current_app)
 
+    alembic.downgrade(target="9cb847f41e76")
+    assert "inspire_pidstore_bai_counter" not in _get_table_names()
+
+    alembic.downgrade(target="41e81f8ee63a")
+    assert "ix_records_citations_cited_id_citation_date" not in _get_indexes(
+        "records_citations"
+    )
+
     alembic.downgrade(target="3fd6471bb960")
 
     assert "data_literature" not in _get_table_names()
@@ -355,6 +363,16 @@ def test_upgrade(inspire_app):
     assert "ix_data_literature_literature_uuid" in _get_indexes("data_literature")
     assert "ix_data_literature_data_uuid" in _get_indexes("data_literature")
 
+    alembic.upgrade(target="9cb847f41e76")
+
+    assert "ix_records_citations_cited_id_citation_date" in _get_indexes(
+        "records_citations"
+    )
+
+    alembic.upgrade(target="6d3c9a1e4b27")
+
+    assert "inspire_pidstore_bai_counter" in _get_table_names()
+
 
 def _get_indexes(tablename):
     query = text(
@@ -23,6 +23,7 @@ from helpers.factories.models.records import RecordMetadataFactory
 from inspirehep.cli import cli as inspire_cli
 from inspirehep.factory import create_app as inspire_create_app
 from inspirehep.files.api.s3 import S3
+from inspirehep.pidstore.models import InspireBAICounter
 from invenio_cache import current_cache
 from moto import mock_s3
 from redis import StrictRedis
@@ -118,6 +119,9 @@ def db_(database):
     session.remove()
     transaction.rollback()
     connection.close()
+    # the BAI counters are committed outside of the test transaction
+    with database.engine.begin() as counter_connection:
+        counter_connection.execute(InspireBAICounter.__table__.delete())
     database.session = old_session
 
 
@@ -220,5 +224,10 @@ def _mocked_inspire_snow(mocker):
 @pytest.fixture
 def _teardown_cache():
     yield
-    current_cache.delete("snow_users")
-    current_cache.delete("snow_functional_categories")
+    for cache_key in ("snow_users", "snow_functional_categories"):
+        cached_ids = current_cache.get(cache_key) or {}
+        current_cache.delete_many(
+            cache_key,
+            f"{cache_key}:refreshed",
+            *(f"{cache_key}:{cached_id}" for cached_id in cached_ids),
+        )
@@ -12,6 +12,8 @@ import pytest
 from helpers.utils import create_record
 from inspirehep.curation.api import (
     assign_institution_reference_to_affiliations,
+    invalidate_matched_affiliations,
+    match_affiliations,
     normalize_affiliations,
     normalize_collaborations,
 )
@@ -54,7 +56,7 @@ def _insert_ambiguous_experiments_into_db(inspire_app, datadir):
 
 
 @pytest.fixture
-def _insert_literature_in_db(inspire_app, datadir):
+def _insert_literature_in_db(inspire_app, datadir, redis):
     create_records_from_datadir(datadir, "lit", "literature")
 
 
@@ -327,6 +329,30 @@ def test_normalize_affiliations_run_query_only_once_when_authors_have_same_raw_a
     assert mock_assign_matched_affiliation_to_author.called_once()
 
 
+@pytest.mark.usefixtures("_insert_literature_in_db")
+def test_match_affiliations_uses_cached_matches(inspire_app):
+    raw_aff = "CERN, Genève, Switzerland"
+    expected_affiliations = [
+        {
+            "record": {"$ref": "http:/localhost:5000/api/institutions/902725"},
+            "value": "CERN",
+        }
+    ]
+
+    assert match_affiliations([raw_aff, raw_aff]) == {raw_aff: expected_affiliations}
+
+    with mock.patch(
+        "inspirehep.curation.api.lit_author_affiliations_multi_search"
+    ) as mock_multi_search:
+        assert match_affiliations([raw_aff]) == {raw_aff: expected_affiliations}
+        mock_multi_search.assert_not_called()
+
+        invalidate_matched_affiliations([raw_aff])
+        mock_multi_search.return_value.execute.return_value = [mock.MagicMock(hits=[])]
+        assert match_affiliations([raw_aff]) == {}
+        mock_multi_search.assert_called_once_with([raw_aff])
+
+
 @pytest.mark.usefixtures("_insert_literature_in_db")
 def test_normalize_affiliations_handle_not_found_affiliations(inspire_app):
     record = {
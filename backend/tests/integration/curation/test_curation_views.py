@@ -274,7 +274,7 @@ def test_normalize_collaborations_returns_403_for_non_authorized(inspire_app):
     assert response.status_code == 403
 
 
-def test_normalize_affiliations_happy_flow(inspire_app):
+def test_normalize_affiliations_happy_flow(inspire_app, redis):
     institution = create_record(
         "ins", data={"legacy_ICN": "Warsaw U.", "ICN": ["Warsaw U."]}
     )
@@ -316,7 +316,7 @@ def test_normalize_affiliations_happy_flow(inspire_app):
     assert not response.json["ambiguous_affiliations"]
 
 
-def test_normalize_affiliations_happy_flow_no_affiliations_matched(inspire_app):
+def test_normalize_affiliations_happy_flow_no_affiliations_matched(inspire_app, redis):
     user = create_user(role=Roles.cataloger.value)
     with inspire_app.test_client() as client:
         login_user_via_session(client, email=user.email)
@@ -434,3 +434,101 @@ def test_normalize_journal_titles_no_match(inspire_app):
         assert {"Technologies": "Technologies"}.items() <= response.json[
             "normalized_journal_titles"
         ].items()
+
+
+def test_records_coreness(inspire_app):
+    core_record = create_record("lit", data={"core": True})
+    deleted_record = create_record("lit", data={"deleted": True})
+    user = create_user(role=Roles.cataloger.value)
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.post(
+            "/curation/records-coreness",
+            content_type="application/json",
+            data=orjson.dumps(
+                {
+                    "control_numbers": [
+                        core_record["control_number"],
+                        deleted_record["control_number"],
+                        123456789,
+                    ]
+                }
+            ),
+        )
+    expected_result = {
+        str(core_record["control_number"]): {
+            "core": True,
+            "deleted": False,
+            "collections": ["Literature"],
+        },
+    }
+    assert response.status_code == 200
+    assert response.json == expected_result
+
+
+def test_records_coreness_for_data_records(inspire_app):
+    data_record = create_record("dat")
+    literature_record = create_record("lit", data={"core": True})
+    user = create_user(role=Roles.cataloger.value)
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.post(
+            "/curation/records-coreness",
+            content_type="application/json",
+            data=orjson.dumps(
+                {
+                    "endpoint": "data",
+                    "control_numbers": [
+                        data_record["control_number"],
+                        literature_record["control_number"],
+                    ],
+                }
+            ),
+        )
+    expected_result = {
+        str(data_record["control_number"]): {
+            "core": False,
+            "deleted": False,
+            "collections": ["Data"],
+        },
+    }
+    assert response.status_code == 200
+    assert response.json == expected_result
+
+
+def test_records_coreness_returns_400_for_unknown_endpoint(inspire_app):
+    user = create_user(role=Roles.cataloger.value)
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.post(
+            "/curation/records-coreness",
+            content_type="application/json",
+            data=orjson.dumps({"endpoint": "unknown", "control_numbers": [1]}),
+        )
+    assert response.status_code == 400
+
+
+def test_records_coreness_returns_400_for_too_many_control_numbers(
+    inspire_app, override_config
+):
+    user = create_user(role=Roles.cataloger.value)
+    with override_config(MAX_API_RESULTS=2), inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.post(
+            "/curation/records-coreness",
+            content_type="application/json",
+            data=orjson.dumps({"control_numbers": [1, 2, 3]}),
+        )
+    assert response.status_code == 400
+
+
+def test_records_coreness_returns_403_for_non_authorized(inspire_app):
+    user = create_user()
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.post(
+            "/curation/records-coreness",
+            content_type="application/json",
+            data=orjson.dumps({"control_numbers": [1]}),
+        )
+    assert response.status_code == 403
@@ -6,7 +6,7 @@
 
 from helpers.utils import create_record
 from inspirehep.curation.utils import (
-    assign_institution,
+    get_institutions_refs_by_legacy_icn,
     set_refereed_and_fix_document_type,
 )
 
@@ -83,6 +83,19 @@ def test_link_institutions_with_affiliations_assigning_institution_reference_in_
     inspire_app,
 ):
     create_record("ins", data={"legacy_ICN": "CERN"})
-    matched_affiliation = {"value": "CERN"}
-    matched_complete_affiliation = assign_institution(matched_affiliation)
-    assert isinstance(matched_complete_affiliation, dict)
+    institutions_refs = get_institutions_refs_by_legacy_icn(["CERN"])
+    assert isinstance(institutions_refs["CERN"], dict)
+
+
+def test_get_institutions_refs_by_legacy_icn(inspire_app):
+    cern = create_record("ins", data={"legacy_ICN": "CERN"})
+    warsaw = create_record("ins", data={"legacy_ICN": "Warsaw U."})
+
+    institutions_refs = get_institutions_refs_by_legacy_icn(
+        ["CERN", "Warsaw U.", "CERN", "Unknown U."]
+    )
+
+    assert institutions_refs == {
+        "CERN": cern["self"],
+        "Warsaw U.": warsaw["self"],
+    }
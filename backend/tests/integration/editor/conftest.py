@@ -29,3 +29,5 @@ def _clear_redis_editor_locks(inspire_app):
         redis_url = current_app.config.get("CACHE_REDIS_URL")
         redis = StrictRedis.from_url(redis_url)
         redis.delete("editor-lock")
+        for key in redis.scan_iter("curation:affiliations:*"):
+            redis.delete(key)
@@ -145,7 +145,7 @@ def test_create_snow_ticket_only_needs_queue_and_recid(inspire_app, override_con
     before_record_request=filter_out_authentication,
     before_record_response=filter_out_user_data_and_cookie_headers(),
 )
-@patch("inspirehep.snow.api.requests.put")
+@patch("inspirehep.snow.api.requests.Session.put")
 @pytest.mark.usefixtures("_mocked_inspire_snow", "_teardown_cache")
 def test_create_snow_ticket_returns_500_on_error(
     mocked_update_ticket_with_inspire_recid,
@@ -52,3 +52,43 @@ def test_hepdata_harvest_request_error(inspire_app, cli):
     ):
         result = cli.invoke(["hepdata", "harvest"])
         assert result.exit_code == 1
+
+
+def test_hepdata_harvest_in_chunks(inspire_app, cli):
+    record_1 = create_record("lit", data={"control_number": 1882568})
+    record_2 = create_record(
+        "lit",
+        data={
+            "control_number": 1866118,
+            "external_system_identifiers": [
+                {"schema": "HEPDATA", "value": "ins1866118"}
+            ],
+        },
+    )
+    record_3 = create_record("lit", data={"control_number": 1833997})
+    record_1_version = record_1.model.version_id
+    record_2_version = record_2.model.version_id
+    hepdata_response = mock.Mock()
+    hepdata_response.json.return_value = [1882568, 1866118, 1833997]
+
+    with mock.patch(
+        "inspirehep.hepdata.cli.requests.get", return_value=hepdata_response
+    ):
+        result = cli.invoke(["hepdata", "harvest", "--commit-every", "2"])
+
+    assert result.exit_code == 0
+
+    rec_1 = LiteratureRecord.get_record_by_pid_value(record_1["control_number"])
+    rec_2 = LiteratureRecord.get_record_by_pid_value(record_2["control_number"])
+    rec_3 = LiteratureRecord.get_record_by_pid_value(record_3["control_number"])
+    assert rec_1["external_system_identifiers"] == [
+        {"schema": "HEPDATA", "value": "ins1882568"}
+    ]
+    assert rec_1.model.version_id == record_1_version + 1
+    assert rec_2["external_system_identifiers"] == [
+        {"schema": "HEPDATA", "value": "ins1866118"}
+    ]
+    assert rec_2.model.version_id == record_2_version
+    assert rec_3["external_system_identifiers"] == [
+        {"schema": "HEPDATA", "value": "ins1833997"}
+    ]
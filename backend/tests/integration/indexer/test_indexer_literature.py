@@ -39,6 +39,8 @@ def test_index_literature_record(inspire_app, datadir):
     expected_metadata.pop("_created")
     expected_metadata.pop("_updated")
     expected_metadata.pop("_expanded_authors_display", None)
+    expected_metadata.pop("_references_display", None)
+    expected_metadata.pop("_references_hash", None)
 
     response = es_search("records-hep")
     result = response["hits"]["hits"][0]["_source"]
@@ -49,6 +51,8 @@ def test_index_literature_record(inspire_app, datadir):
     result.pop("_latex_eu_display")
     result.pop("_bibtex_display")
     result.pop("_expanded_authors_display")
+    result.pop("_references_display", None)
+    result.pop("_references_hash", None)
     result.pop("_oai", None)
     result.pop("authors")
     result_facet_author_name = result.pop("facet_author_name")
@@ -12,6 +12,7 @@ from inspirehep.mailing.api.jobs import (
     get_job_recipient,
     get_jobs_from_last_week,
     send_job_deadline_reminder,
+    send_job_deadline_reminders,
     subscribe_to_jobs_weekly_list,
 )
 from invenio_accounts.models import User
@@ -34,6 +35,18 @@ def test_jobs_from_last_week(create_jobs):
     assert expected_control_numbers == results_control_numbers
 
 
+def test_jobs_from_last_week_paginates(create_jobs, override_config):
+    expected_control_numbers = [
+        create_jobs["job_5_days_old"]["control_number"],
+        create_jobs["job_6_days_old"]["control_number"],
+        create_jobs["job_7_days_old"]["control_number"],
+    ]
+    with override_config(WEEKLY_JOBS_EMAIL_PAGE_SIZE=2):
+        results = get_jobs_from_last_week()
+        results_control_numbers = [result["control_number"] for result in results]
+    assert expected_control_numbers == results_control_numbers
+
+
 def test_jobs_from_last_week_empty(inspire_app):
     expected_control_numbers = []
 
@@ -42,7 +55,7 @@ def test_jobs_from_last_week_empty(inspire_app):
 
 
 def test_render_jobs_weekly_campaign_job_record_template_only(create_jobs):
-    jobs = get_jobs_from_last_week()
+    jobs = list(get_jobs_from_last_week())
     # Comparing strings is tricky especially with newlines, we're not going to test the whole template,
     # anyway it has a lot of extras from mailchimp and too much noise
     rec_1_control_number = create_jobs["job_5_days_old"]["control_number"]
@@ -178,3 +191,33 @@ def test_regression_send_email_doesnt_fail_when_contact_details_has_no_email(
     assert mock_call["recipient"] == expected_recipient
     assert mock_call["body"]
     assert mock_call["subject"] == "Expired deadline for your INSPIRE job: Tester"
+
+
+def test_send_job_deadline_reminders_uses_a_single_connection(inspire_app):
+    jobs = [
+        {
+            "contact_details": [{"email": "rcg6p@virginia.edu"}],
+            "position": "Tester",
+        },
+        {"control_number": 1, "position": "Tester without recipient"},
+        {
+            "contact_details": [{"email": "rkh6j@virginia.edu"}],
+            "position": "Other tester",
+        },
+    ]
+    mail = inspire_app.extensions["mail"]
+    with (
+        patch.object(mail, "connect", wraps=mail.connect) as mock_connect,
+        mail.record_messages() as outbox,
+    ):
+        send_job_deadline_reminders(jobs)
+
+    mock_connect.assert_called_once()
+    assert [message.recipients for message in outbox] == [
+        ["rcg6p@virginia.edu"],
+        ["rkh6j@virginia.edu"],
+    ]
+    assert [message.subject for message in outbox] == [
+        "Expired deadline for your INSPIRE job: Tester",
+        "Expired deadline for your INSPIRE job: Other tester",
+    ]
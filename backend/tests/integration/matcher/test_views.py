@@ -113,6 +113,34 @@ def test_get_journal_kb_data(inspire_app):
     assert expected == response.json["journal_kb_data"]
 
 
+def test_get_journal_kb_data_returns_304_if_not_modified(inspire_app):
+    user = create_user(role=Roles.cataloger.value)
+    data = {
+        "journal_title": {"title": "Journal of Physical Science and Application"},
+        "short_title": "J.Phys.Sci.Appl.",
+    }
+    create_record("jou", data=data)
+
+    with inspire_app.test_client() as client:
+        login_user_via_session(client, email=user.email)
+        response = client.get("api/matcher/journal-kb/")
+        etag = response.headers["ETag"]
+        not_modified_response = client.get(
+            "api/matcher/journal-kb/", headers={"If-None-Match": etag}
+        )
+        create_record("jou", data={"short_title": "Image Vision Comput."})
+        modified_response = client.get(
+            "api/matcher/journal-kb/", headers={"If-None-Match": etag}
+        )
+
+    assert response.status_code == 200
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.headers["ETag"] == etag
+    assert modified_response.status_code == 200
+    assert modified_response.headers["ETag"] != etag
+    assert "IMAGE VISION COMPUT" in modified_response.json["journal_kb_data"]
+
+
 def test_get_journal_kb_data_returns_403_for_non_authenticated(inspire_app):
     user = create_user()
     with inspire_app.test_client() as client:
@@ -11,7 +11,9 @@ import pytest
 from helpers.providers.record_provider import RecordProvider
 from helpers.utils import create_record
 from inspirehep.pidstore.errors import PIDAlreadyExists
+from inspirehep.pidstore.models import InspireBAICounter
 from inspirehep.pidstore.providers.bai import InspireBAIProvider
+from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 
 
@@ -269,6 +271,34 @@ def test_bai_minter_generates_correct_bai_when_numbers_are_not_consistent(
     assert rec_2["ids"] == rec_2_expected_ids
 
 
+def test_bai_minter_uses_bai_counter(inspire_app, override_config):
+    data = {"name": {"value": "Janeway, Kathryn"}}
+    with override_config(
+        FEATURE_FLAG_ENABLE_BAI_PROVIDER=True, FEATURE_FLAG_ENABLE_BAI_CREATION=True
+    ):
+        create_record(
+            "aut",
+            data={"ids": [{"schema": "INSPIRE BAI", "value": "K.Janeway.2"}], **data},
+        )
+        rec_1 = create_record("aut", data=data)
+        create_record(
+            "aut",
+            data={"ids": [{"schema": "INSPIRE BAI", "value": "K.Janeway.7"}], **data},
+        )
+        rec_2 = create_record("aut", data=data)
+
+    assert rec_1["ids"] == [{"schema": "INSPIRE BAI", "value": "K.Janeway.3"}]
+    assert rec_2["ids"] == [{"schema": "INSPIRE BAI", "value": "K.Janeway.8"}]
+    assert InspireBAICounter.query.get("K.Janeway.").last_number == 8
+
+
+def test_bai_counter_is_not_rolled_back_with_the_record(inspire_app):
+    assert InspireBAIProvider.next_bai_number("K.Janeway.") == 1
+    db.session.rollback()
+
+    assert InspireBAIProvider.next_bai_number("K.Janeway.") == 2
+
+
 def test_minter_bai_respects_feature_flag(inspire_app, override_config):
     with override_config(FEATURE_FLAG_ENABLE_BAI_PROVIDER=False):
         record = create_record("aut")
@@ -3,10 +3,19 @@
 #
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
+import string
+import threading
+import time
+import uuid
+from itertools import cycle
+from unittest import mock
+
 import pytest
 from helpers.utils import create_record
 from inspirehep.pidstore.errors import PIDAlreadyExistsError
+from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from sqlalchemy import text
 
 
 def test_minter_mint_new_record_without_texkey(inspire_app, override_config):
@@ -246,3 +255,108 @@ def test_minter_deletes_texkey_missing_in_metadata(inspire_app, override_config)
         PersistentIdentifier.query.filter_by(pid_value=generated_texkeys[0]).count()
         == 0
     )
+
+
+def test_minter_retries_texkey_taken_by_concurrent_record(inspire_app, override_config):
+    data = {
+        "authors": [{"full_name": "Janeway, K."}],
+        "publication_info": [{"year": 2000}],
+    }
+    create_record("lit", data={**data, "texkeys": ["Janeway:2000a"]})
+
+    with (
+        override_config(
+            PIDSTORE_TEXKEY_RANDOM_PART_SIZE=1, PIDSTORE_TEXKEY_MAX_RETRY_COUNT=2
+        ),
+        mock.patch(
+            "inspirehep.pidstore.providers.texkey.InspireTexKeyProvider.query_used_texkeys",
+            return_value=set(),
+        ),
+        mock.patch(
+            "inspirehep.pidstore.providers.texkey.random.choices",
+            side_effect=[["a"], ["a"], ["b"], ["b"]],
+        ),
+    ):
+        record = create_record("lit", data=data)
+
+    assert record["texkeys"] == ["Janeway:2000b"]
+    assert PersistentIdentifier.query.filter_by(pid_value="Janeway:2000a").count() == 1
+
+
+def test_minter_mints_unique_texkeys_with_same_prefix(inspire_app, override_config):
+    data = {
+        "authors": [{"full_name": "Janeway, K."}],
+        "publication_info": [{"year": 2000}],
+    }
+    # each draw is a new letter, so that the candidates of a record can't all
+    # be taken by the previous ones
+    letters = cycle(string.ascii_lowercase)
+    with (
+        override_config(PIDSTORE_TEXKEY_RANDOM_PART_SIZE=1),
+        mock.patch(
+            "inspirehep.pidstore.providers.texkey.random.choices",
+            side_effect=lambda population, k: [next(letters)],
+        ),
+    ):
+        records = [create_record("lit", data=data) for _ in range(15)]
+
+    texkeys = [record["texkeys"][0] for record in records]
+    assert len(set(texkeys)) == len(texkeys)
+
+
+def test_minter_retries_texkey_inserted_by_concurrent_transaction(
+    inspire_app, override_config
+):
+    data = {
+        "authors": [{"full_name": "Janeway, K."}],
+        "publication_info": [{"year": 2000}],
+    }
+    engine = db.engine
+    pidstore = PersistentIdentifier.__table__
+    other_connection = engine.connect()
+    other_transaction = other_connection.begin()
+    # the other transaction has inserted the texkey but not committed yet, so
+    # the minter sees it as free
+    other_connection.execute(
+        pidstore.insert().values(
+            pid_type="texkey",
+            pid_value="Janeway:2000a",
+            pid_provider="texkey",
+            status=PIDStatus.REGISTERED,
+            object_type="rec",
+            object_uuid=uuid.uuid4(),
+        )
+    )
+
+    def commit_when_minter_waits():
+        with engine.connect() as monitor_connection:
+            for _ in range(200):
+                if monitor_connection.execute(
+                    text("SELECT count(*) FROM pg_locks WHERE NOT granted")
+                ).scalar():
+                    break
+                time.sleep(0.05)
+        other_transaction.commit()
+
+    other_thread = threading.Thread(target=commit_when_minter_waits)
+    try:
+        with (
+            override_config(
+                PIDSTORE_TEXKEY_RANDOM_PART_SIZE=1, PIDSTORE_TEXKEY_MAX_RETRY_COUNT=2
+            ),
+            mock.patch(
+                "inspirehep.pidstore.providers.texkey.random.choices",
+                side_effect=[["a"], ["a"], ["b"], ["b"]],
+            ),
+        ):
+            other_thread.start()
+            record = create_record("lit", data=data)
+    finally:
+        other_thread.join()
+        with engine.begin() as cleanup_connection:
+            cleanup_connection.execute(
+                pidstore.delete().where(pidstore.c.pid_value == "Janeway:2000a")
+            )
+        other_connection.close()
+
+    assert record["texkeys"] == ["Janeway:2000b"]
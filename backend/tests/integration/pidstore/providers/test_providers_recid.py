@@ -6,9 +6,15 @@
 
 """INSPIRE module that adds more fun to the platform."""
 
+from unittest import mock
+
 from helpers.factories.models.records import RecordMetadataFactory
-from inspirehep.pidstore.providers.recid import InspireRecordIdProvider
-from invenio_pidstore.models import PIDStatus
+from inspirehep.pidstore.providers.recid import (
+    InspireRecordIdProvider,
+    _reserve_recid_block,
+)
+from inspirehep.process_local import ProcessLocalRegistry
+from invenio_pidstore.models import PIDStatus, RecordIdentifier
 
 
 def test_provider_without_pid_value(inspire_app):
@@ -36,3 +42,36 @@ def test_provider_with_pid_value(inspire_app):
     assert provider.pid.pid_value == 1
     assert provider.pid.pid_type == "pid"
     assert provider.pid.status == PIDStatus.REGISTERED
+
+
+def test_provider_reserves_control_numbers_in_blocks(inspire_app, override_config):
+    with (
+        override_config(PIDSTORE_RECID_BLOCK_SIZE=5),
+        mock.patch(
+            "inspirehep.pidstore.providers.recid._RECID_BLOCKS",
+            ProcessLocalRegistry(),
+        ),
+        mock.patch(
+            "inspirehep.pidstore.providers.recid._reserve_recid_block",
+            wraps=_reserve_recid_block,
+        ) as reserve_recid_block_mock,
+    ):
+        recids = [InspireRecordIdProvider.next_recid() for _ in range(6)]
+
+    assert reserve_recid_block_mock.call_count == 2
+    assert recids == sorted(set(recids))
+    assert (
+        RecordIdentifier.query.filter(RecordIdentifier.recid.in_(recids)).count() == 6
+    )
+
+
+def test_provider_skips_control_numbers_already_taken(inspire_app):
+    taken_recid = RecordIdentifier.max() + 10
+    RecordIdentifier.insert(taken_recid)
+    with mock.patch(
+        "inspirehep.pidstore.providers.recid.get_next_recid_from_block",
+        side_effect=[taken_recid, taken_recid + 1],
+    ):
+        recid = InspireRecordIdProvider.next_recid()
+
+    assert recid == taken_recid + 1
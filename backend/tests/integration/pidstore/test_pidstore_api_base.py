@@ -6,8 +6,11 @@
 
 """INSPIRE module that adds more fun to the platform."""
 
+import pytest
 from helpers.utils import create_record
 from inspirehep.pidstore.api.base import PidStoreBase
+from inspirehep.pidstore.errors import PIDAlreadyExistsError
+from invenio_pidstore.models import PersistentIdentifier
 
 
 def test_get_config_for_endpoints(appctx):
@@ -68,3 +71,43 @@ def test_arxiv_path_converter_works_for_all_arxiv_pid_values(inspire_app):
         expected_control_number
         == long_arxiv_number_response.json["metadata"]["control_number"]
     )
+
+
+def test_update_creates_and_deletes_external_pids_of_all_types(inspire_app):
+    record = create_record(
+        "lit",
+        data={
+            "arxiv_eprints": [{"value": "1607.06746", "categories": ["hep-th"]}],
+            "dois": [{"value": "10.1109/TPEL.2019.2900393"}],
+        },
+    )
+
+    data = dict(record)
+    data["arxiv_eprints"] = [{"value": "hep-ph/9709356", "categories": ["hep-ph"]}]
+    data["dois"] = [
+        {"value": "10.1109/TPEL.2019.2900393"},
+        {"value": "10.1103/PhysRevD.93.014010"},
+    ]
+    record.update(data)
+
+    external_pids = {
+        (pid.pid_type, pid.pid_value)
+        for pid in PersistentIdentifier.query.filter_by(
+            object_uuid=record.id, pid_provider="external"
+        )
+    }
+    assert external_pids == {
+        ("arxiv", "hep-ph/9709356"),
+        ("doi", "10.1109/tpel.2019.2900393"),
+        ("doi", "10.1103/physrevd.93.014010"),
+    }
+
+
+def test_update_raises_for_external_pid_of_another_record(inspire_app):
+    create_record("lit", data={"dois": [{"value": "10.1109/TPEL.2019.2900393"}]})
+    record = create_record("lit")
+
+    data = dict(record)
+    data["dois"] = [{"value": "10.1109/TPEL.2019.2900393"}]
+    with pytest.raises(PIDAlreadyExistsError):
+        record.update(data)
@@ -836,6 +836,83 @@ def test_get_modified_references(inspire_app):
     assert citing_record.get_modified_references() == [cited_record_2.id]
 
 
+@mock.patch(
+    "inspirehep.records.api.literature.LiteratureSearch.get_referencing_records_uuids"
+)
+def test_get_referencing_papers_if_reference_display_changed(
+    mock_get_referencing_records_uuids, inspire_app
+):
+    citing_uuid = uuid4()
+    mock_get_referencing_records_uuids.return_value = {str(citing_uuid)}
+    data = faker.record("lit", data={"authors": [{"full_name": "Smith, J."}]})
+    record = LiteratureRecord.create(data)
+    data["control_number"] = record["control_number"]
+
+    data["authors"][0]["affiliations"] = [{"value": "CERN"}]
+    record.update(data)
+
+    assert record.get_referencing_papers_if_reference_display_changed() == set()
+
+    data["authors"][0]["full_name"] = "Smith, John"
+    record.update(data)
+
+    assert record.get_referencing_papers_if_reference_display_changed() == {citing_uuid}
+
+
+def test_get_raw_affiliations_with_modified_matches(inspire_app):
+    data = faker.record(
+        "lit",
+        data={
+            "curated": True,
+            "authors": [
+                {
+                    "full_name": "Smith, J.",
+                    "raw_affiliations": [{"value": "CERN, Geneva"}],
+                }
+            ],
+        },
+    )
+    record = LiteratureRecord.create(data)
+    data["control_number"] = record["control_number"]
+
+    data["titles"] = [{"title": "Another title"}]
+    record.update(data)
+
+    assert record.get_raw_affiliations_with_modified_matches() == []
+
+    data["authors"][0]["affiliations"] = [{"value": "CERN"}]
+    record.update(data)
+
+    assert record.get_raw_affiliations_with_modified_matches() == [
+        "CERN, Geneva",
+        "CERN, Geneva",
+    ]
+
+
+def test_get_raw_affiliations_with_modified_matches_ignores_not_curated(
+    inspire_app,
+):
+    data = faker.record(
+        "lit",
+        data={
+            "curated": False,
+            "authors": [
+                {
+                    "full_name": "Smith, J.",
+                    "raw_affiliations": [{"value": "CERN, Geneva"}],
+                }
+            ],
+        },
+    )
+    record = LiteratureRecord.create(data)
+    data["control_number"] = record["control_number"]
+
+    data["authors"][0]["affiliations"] = [{"value": "CERN"}]
+    record.update(data)
+
+    assert record.get_raw_affiliations_with_modified_matches() == []
+
+
 def test_record_cannot_cite_itself(inspire_app):
     data1 = faker.record("lit", with_control_number=True)
     record = create_record(
@@ -704,6 +704,74 @@ def test_literature_references_pagination_with_page_with_no_results(inspire_app)
     assert expected_result == response_data_metadata
 
 
+def test_literature_references_are_read_from_es_without_resolving_them(
+    inspire_app,
+):
+    cited_record = create_record("lit", data=faker.record("lit"))
+    data = faker.record("lit", literature_citations=[cited_record["control_number"]])
+    record_with_references = create_record("lit", data=data)
+    headers = {"Accept": "application/json"}
+    with (
+        mock.patch(
+            "inspirehep.records.api.literature.LiteratureRecord.get_es_linked_references"
+        ) as mock_get_es_linked_references,
+        inspire_app.test_client() as client,
+    ):
+        response = client.get(
+            f"/literature/{record_with_references['control_number']}/references",
+            headers=headers,
+        )
+    response_data_metadata = orjson.loads(response.data)["metadata"]
+    expected_result = {
+        "references": [
+            {
+                "control_number": cited_record["control_number"],
+                "titles": cited_record["titles"],
+            },
+        ],
+        "references_count": 1,
+    }
+    assert response.status_code == 200
+    assert expected_result == response_data_metadata
+    mock_get_es_linked_references.assert_not_called()
+
+
+def test_literature_references_are_resolved_again_when_they_changed(inspire_app):
+    cited_record = create_record("lit", data=faker.record("lit"))
+    data = faker.record("lit", literature_citations=[cited_record["control_number"]])
+    record_with_references = create_record("lit", data=data)
+    headers = {"Accept": "application/json"}
+    outdated_document = {
+        "_references_display": orjson.dumps(
+            [{"titles": [{"title": "Outdated title"}]}]
+        ).decode("utf-8"),
+        "_references_hash": "outdated",
+    }
+    with (
+        mock.patch(
+            "inspirehep.records.api.literature.LiteratureSearch.get_source",
+            return_value=outdated_document,
+        ),
+        inspire_app.test_client() as client,
+    ):
+        response = client.get(
+            f"/literature/{record_with_references['control_number']}/references",
+            headers=headers,
+        )
+    response_data_metadata = orjson.loads(response.data)["metadata"]
+    expected_result = {
+        "references": [
+            {
+                "control_number": cited_record["control_number"],
+                "titles": cited_record["titles"],
+            },
+        ],
+        "references_count": 1,
+    }
+    assert response.status_code == 200
+    assert expected_result == response_data_metadata
+
+
 def test_literature_references_with_invalid_size(inspire_app):
     record = create_record("lit", data=faker.record("lit"))
     headers = {"Accept": "application/json"}
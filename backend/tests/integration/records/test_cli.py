@@ -9,13 +9,16 @@ from unittest import mock
 
 import orjson
 import pytest
+from flask_sqlalchemy import models_committed
 from freezegun import freeze_time
 from helpers.providers.faker import faker
 from helpers.utils import create_record
 from inspirehep.records.api.authors import AuthorsRecord
+from inspirehep.records.api.base import InspireRecord
 from inspirehep.records.api.jobs import JobsRecord
 from inspirehep.records.api.literature import LiteratureRecord
 from inspirehep.records.models import InstitutionLiterature
+from inspirehep.records.receivers import index_after_commit
 
 
 @pytest.mark.vcr
@@ -164,10 +167,69 @@ def test_create_record_with_directory(inspire_app, cli):
         assert control_number_author == result_record_author["control_number"]
 
 
+def test_bulk_create_records_from_json_lines_file(inspire_app, cli):
+    data_cited = faker.record("lit", with_control_number=True)
+    data_citing = faker.record(
+        "lit",
+        with_control_number=True,
+        literature_citations=[data_cited["control_number"]],
+    )
+    data_author = faker.record("aut", with_control_number=True)
+
+    with cli.isolated_filesystem():
+        with open("records.jsonl", "wb") as f:
+            for data in (data_citing, data_author, data_cited):
+                f.write(orjson.dumps(data) + b"\n")
+
+        with mock.patch.object(InspireRecord, "index") as mock_index:
+            result = cli.invoke(
+                [
+                    "importer",
+                    "bulk-records",
+                    "-f",
+                    "records.jsonl",
+                    "--commit-every",
+                    "2",
+                ]
+            )
+
+    assert result.exit_code == 0
+    assert "3 records imported, 0 failed" in result.output
+    mock_index.assert_not_called()
+    assert index_after_commit in models_committed.receivers_for(None)
+
+    cited_record = LiteratureRecord.get_record_by_pid_value(
+        data_cited["control_number"]
+    )
+    author_record = AuthorsRecord.get_record_by_pid_value(data_author["control_number"])
+
+    assert cited_record.citation_count == 1
+    assert author_record["control_number"] == data_author["control_number"]
+
+
+def test_bulk_create_records_skips_invalid_records(inspire_app, cli):
+    data_valid = faker.record("lit", with_control_number=True)
+    data_invalid = faker.record("lit", with_control_number=True)
+    data_invalid["document_type"] = ["not a document type"]
+
+    with cli.isolated_filesystem():
+        with open("records.jsonl", "wb") as f:
+            for data in (data_invalid, data_valid):
+                f.write(orjson.dumps(data) + b"\n")
+
+        result = cli.invoke(["importer", "bulk-records", "-f", "records.jsonl"])
+
+    assert result.exit_code == 0
+    assert "1 records imported, 1 failed" in result.output
+
+    record = LiteratureRecord.get_record_by_pid_value(data_valid["control_number"])
+    assert record["control_number"] == data_valid["control_number"]
+
+
 @freeze_time("2019-12-01")
-@mock.patch("inspirehep.records.cli.send_job_deadline_reminder")
+@mock.patch("inspirehep.records.cli.send_job_deadline_reminders")
 def test_close_expired_jobs_with_notify(
-    mock_send_job_deadline_reminder, inspire_app, cli
+    mock_send_job_deadline_reminders, inspire_app, cli
 ):
     expired_record = create_record(
         "job", data={"status": "open", "deadline_date": "2019-11-01"}
@@ -179,8 +241,7 @@ def test_close_expired_jobs_with_notify(
         expired_record["control_number"]
     )
 
-    mock_send_job_deadline_reminder.assert_called_once()
-    mock_send_job_deadline_reminder.assert_called_with(dict(expired_record))
+    mock_send_job_deadline_reminders.assert_called_once_with([dict(expired_record)])
 
 
 @freeze_time("2019-11-01")
@@ -194,9 +255,9 @@ def test_close_expired_jobs_has_exclusive_deadline(inspire_app, cli):
 
 
 @freeze_time("2019-11-02")
-@mock.patch("inspirehep.records.cli.send_job_deadline_reminder")
+@mock.patch("inspirehep.records.cli.send_job_deadline_reminders")
 def test_close_expired_jobs_without_notify(
-    mock_send_job_deadline_reminder, inspire_app, cli
+    mock_send_job_deadline_reminders, inspire_app, cli
 ):
     expired_record = create_record(
         "job", data={"status": "open", "deadline_date": "2019-11-01"}
@@ -216,7 +277,7 @@ def test_close_expired_jobs_without_notify(
     assert expired_record["status"] == "closed"
     assert not_expired_record["status"] == "open"
 
-    mock_send_job_deadline_reminder.assert_not_called()
+    mock_send_job_deadline_reminders.assert_not_called()
 
 
 @freeze_time("2019-12-01")
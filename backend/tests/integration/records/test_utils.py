@@ -5,6 +5,8 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 
+import datetime
+import uuid
 from io import BytesIO
 
 import pytest
@@ -17,7 +19,9 @@ from inspirehep.records.marshmallow.literature.utils import (
     get_parent_records,
 )
 from inspirehep.records.utils import (
+    decode_citations_cursor,
     download_file_from_url,
+    encode_citations_cursor,
     get_author_by_recid,
     get_pid_for_pid,
     is_document_scanned,
@@ -235,3 +239,25 @@ def test_is_document_scanned_doesnt_corrupt_document(inspire_app):
     is_document_scanned(file_data)
     pdf_after_check = BytesIO(file_data)
     assert original_pdf.read(10) == pdf_after_check.read(10)
+
+
+def test_citations_cursor_round_trip():
+    citer_id = uuid.uuid4()
+    citation_date = datetime.date(2019, 1, 1)
+
+    cursor = encode_citations_cursor(citation_date, citer_id)
+
+    assert decode_citations_cursor(cursor) == (citation_date, citer_id)
+
+
+def test_citations_cursor_round_trip_without_citation_date():
+    citer_id = uuid.uuid4()
+
+    cursor = encode_citations_cursor(None, citer_id)
+
+    assert decode_citations_cursor(cursor) == (None, citer_id)
+
+
+def test_decode_citations_cursor_with_malformed_cursor():
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_citations_cursor("not-a-cursor")
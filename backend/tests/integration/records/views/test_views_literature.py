@@ -268,6 +268,89 @@ def test_literature_citations(inspire_app):
     assert expected_data == response_data
 
 
+def test_literature_citations_with_cursor_pagination(inspire_app):
+    record = create_record("lit")
+    record_control_number = record["control_number"]
+    citing_records_control_numbers = []
+    for year in (2017, 2018, 2019):
+        citing_record = create_record(
+            "lit",
+            data={"publication_info": [{"year": year}]},
+            literature_citations=[record_control_number],
+        )
+        citing_records_control_numbers.append(citing_record["control_number"])
+
+    with inspire_app.test_client() as client:
+        first_page = client.get(
+            f"/literature/{record_control_number}/citations?size=2"
+        ).json["metadata"]
+        second_page = client.get(
+            f"/literature/{record_control_number}/citations",
+            query_string={"size": 2, "cursor": first_page["next_cursor"]},
+        ).json["metadata"]
+
+    assert first_page["citation_count"] == 3
+    assert [citation["control_number"] for citation in first_page["citations"]] == [
+        citing_records_control_numbers[2],
+        citing_records_control_numbers[1],
+    ]
+    assert [citation["control_number"] for citation in second_page["citations"]] == [
+        citing_records_control_numbers[0]
+    ]
+    assert "next_cursor" not in second_page
+
+
+def test_literature_citations_with_cursor_pagination_and_undated_citations(
+    inspire_app,
+):
+    record = create_record("lit")
+    record_control_number = record["control_number"]
+    citing_records_control_numbers = []
+    for data in (
+        {},
+        {"publication_info": [{"year": 2018}]},
+        {"publication_info": [{"year": 2019}]},
+        {},
+    ):
+        citing_record = create_record(
+            "lit", data=data, literature_citations=[record_control_number]
+        )
+        citing_records_control_numbers.append(citing_record["control_number"])
+
+    pages = []
+    query_string = {"size": 1}
+    with inspire_app.test_client() as client:
+        while True:
+            page = client.get(
+                f"/literature/{record_control_number}/citations",
+                query_string=query_string,
+            ).json["metadata"]
+            pages.append([citation["control_number"] for citation in page["citations"]])
+            if "next_cursor" not in page:
+                break
+            query_string = {"size": 1, "cursor": page["next_cursor"]}
+
+    assert pages[:2] == [
+        [citing_records_control_numbers[2]],
+        [citing_records_control_numbers[1]],
+    ]
+    # the undated citations come last, in no particular order
+    assert sorted(pages[2:]) == sorted(
+        [[citing_records_control_numbers[0]], [citing_records_control_numbers[3]]]
+    )
+
+
+def test_literature_citations_with_malformed_cursor(inspire_app):
+    record = create_record("lit")
+
+    with inspire_app.test_client() as client:
+        response = client.get(
+            f"/literature/{record['control_number']}/citations?cursor=wrong"
+        )
+
+    assert response.status_code == 400
+
+
 def test_literature_citations_with_superseded_citing_records(inspire_app):
     record = create_record("lit")
     record_control_number = record["control_number"]
@@ -9,6 +9,7 @@ from unittest.mock import patch
 
 import pytest
 import requests
+import requests_mock
 from flask import current_app
 from helpers.utils import (
     filter_out_authentication,
@@ -245,7 +246,7 @@ def test_edit_inspire_ticket(inspire_app):
     before_record_request=filter_out_authentication,
     before_record_response=filter_out_user_data_and_cookie_headers(),
 )
-@patch("inspirehep.snow.api.requests.put")
+@patch("inspirehep.snow.api.requests.Session.put")
 @pytest.mark.usefixtures("_mocked_inspire_snow", "_teardown_cache")
 def test_create_ticket_raises_create_ticket_exception(
     mocked_update_ticket_with_inspire_recid,
@@ -308,3 +309,47 @@ def test_comment_ticket_with_template(inspire_app):
 
     ticket = snow_instance.get_ticket(ticket_id, params="sysparm_display_value=true")
     assert "Thank you very much again for your suggestion" in ticket["comments"]
+
+
+@pytest.mark.usefixtures("_mocked_inspire_snow", "_teardown_cache")
+def test_snow_clients_reuse_session_with_timeout(inspire_app, override_config):
+    snow_url = inspire_app.config["SNOW_URL"]
+    with (
+        override_config(SNOW_REQUEST_TIMEOUT=5),
+        requests_mock.Mocker() as requests_mocker,
+    ):
+        requests_mocker.get(
+            f"{snow_url}/api/now/table/u_request_fulfillment/1234",
+            json={"result": {"sys_id": "1234"}},
+        )
+        first_snow_instance = InspireSnow()
+        second_snow_instance = InspireSnow()
+        ticket = second_snow_instance.get_ticket("1234")
+
+    assert first_snow_instance.session is second_snow_instance.session
+    assert ticket == {"sys_id": "1234"}
+    assert requests_mocker.last_request.timeout == 5
+
+
+@pytest.mark.usefixtures("_mocked_inspire_snow", "_teardown_cache")
+def test_get_user_reloads_users_at_most_once_per_interval(inspire_app):
+    snow_url = inspire_app.config["SNOW_URL"]
+    users = [
+        {
+            "user.sys_id": "1",
+            "user.name": "Jessica Jones",
+            "user.email": "jessica@jones.com",
+            "group.name": "Inspire Information systems",
+        }
+    ]
+    with requests_mock.Mocker() as requests_mocker:
+        requests_mocker.get(
+            f"{snow_url}/api/now/table/sys_user_grmember", json={"result": users}
+        )
+        snow_instance = InspireSnow()
+
+        assert snow_instance.get_user("1") == "Jessica Jones"
+        assert snow_instance.get_user("1") == "Jessica Jones"
+        assert snow_instance.get_user("unknown") is None
+
+    assert requests_mocker.call_count == 1
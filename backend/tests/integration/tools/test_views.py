@@ -268,3 +268,14 @@ def test_find_references(literature_records):
     assert references == expected_references_cv
 
     assert errors == expected_errors
+
+
+def test_find_references_resolves_eprints_with_arxiv_prefix(literature_records):
+    references, errors = find_references(
+        [("arXiv:hep-th/0501240", 1), ("hep-th/0501240", 2)], "bibtex"
+    )
+
+    assert len(references) == 2
+    assert references[0].startswith("@article{arXiv:hep-th/0501240,")
+    assert references[1].startswith("@article{hep-th/0501240,")
+    assert not errors
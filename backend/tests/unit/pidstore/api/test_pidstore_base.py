@@ -73,7 +73,7 @@ def test_get_pid_type_from_schema(
 
 
 def test_mint_with_one_minter():
-    minter_1 = MagicMock(mint=MagicMock())
+    minter_1 = MagicMock(mint=MagicMock(), bulk_minting=False)
 
     class TestBase(PidStoreBase):
         minters = [minter_1]
@@ -87,9 +87,9 @@ def test_mint_with_one_minter():
 
 
 def test_mint_with_many_minters():
-    minter_1 = MagicMock(mint=MagicMock())
-    minter_2 = MagicMock(mint=MagicMock())
-    minter_3 = MagicMock(mint=MagicMock())
+    minter_1 = MagicMock(mint=MagicMock(), bulk_minting=False)
+    minter_2 = MagicMock(mint=MagicMock(), bulk_minting=False)
+    minter_3 = MagicMock(mint=MagicMock(), bulk_minting=False)
 
     class TestBase(PidStoreBase):
         minters = [minter_1, minter_2, minter_3]
@@ -0,0 +1,41 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+from unittest import mock
+
+from inspirehep.process_local import ProcessLocalRegistry
+
+
+def test_process_local_registry_creates_value_once_per_key():
+    registry = ProcessLocalRegistry()
+    create = mock.Mock(side_effect=lambda: object())
+
+    value = registry.get(create, key="key")
+
+    assert registry.get(create, key="key") is value
+    assert registry.get(create, key="other-key") is not value
+    assert create.call_count == 2
+
+
+def test_process_local_registry_creates_new_value_in_forked_process():
+    registry = ProcessLocalRegistry()
+    parent_value = registry.get(object)
+
+    with mock.patch("inspirehep.process_local.os.getpid", return_value=-1):
+        child_value = registry.get(object)
+
+    assert child_value is not parent_value
+    assert registry.get(object) is parent_value
+
+
+def test_process_local_registry_clear_returns_values_of_current_process():
+    registry = ProcessLocalRegistry()
+    value = registry.get(object)
+    with mock.patch("inspirehep.process_local.os.getpid", return_value=-1):
+        registry.get(object)
+
+    assert registry.clear() == [value]
+    assert registry.get(object) is not value
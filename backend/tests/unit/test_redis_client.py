@@ -0,0 +1,66 @@
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+from unittest import mock
+
+import pytest
+from inspirehep.redis_client import (
+    get_redis_client,
+    redis_pipeline,
+    reset_redis_connection_pools,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    reset_redis_connection_pools()
+    yield
+    reset_redis_connection_pools()
+
+
+def test_get_redis_client_reuses_connection_pool():
+    first_client = get_redis_client()
+    second_client = get_redis_client()
+
+    assert first_client.connection_pool is second_client.connection_pool
+
+
+def test_get_redis_client_uses_separate_pool_for_decoded_responses():
+    raw_client = get_redis_client()
+    decoded_client = get_redis_client(decode_responses=True)
+
+    assert raw_client.connection_pool is not decoded_client.connection_pool
+    assert decoded_client.connection_pool.connection_kwargs["decode_responses"]
+
+
+def test_reset_redis_connection_pools_creates_new_pool():
+    client_before_reset = get_redis_client()
+    reset_redis_connection_pools()
+    client_after_reset = get_redis_client()
+
+    assert client_before_reset.connection_pool is not client_after_reset.connection_pool
+
+
+@mock.patch("redis.client.Pipeline.execute", return_value=[1, True])
+def test_redis_pipeline_executes_queued_commands_once(mock_execute):
+    with redis_pipeline() as pipeline:
+        pipeline.hset("editor-lock:1@1", key="user", value="message")
+        pipeline.expire("editor-lock:1@1", time=120)
+
+    mock_execute.assert_called_once()
+
+
+@mock.patch("redis.client.Pipeline.execute")
+def test_redis_pipeline_does_not_execute_on_error(mock_execute):
+    def _queue_commands_and_fail():
+        with redis_pipeline() as pipeline:
+            pipeline.hset("editor-lock:1@1", key="user", value="message")
+            raise ValueError("Cannot build the lock message")
+
+    with pytest.raises(ValueError, match="Cannot build the lock message"):
+        _queue_commands_and_fail()
+
+    mock_execute.assert_not_called()
@@ -19,11 +19,12 @@ AIRFLOW_HEADERS = (
 logger = logging.getLogger(__name__)
 
 
-def trigger_airflow_dag(dag_id, workflow_id, **kwargs):
+def trigger_airflow_dag(dag_id, workflow_id, session=None, **kwargs):
     """Triggers an airflow dag.
 
     :param dag_id: name of the dag to run
     :param workflow_id: id of the workflow being triggered
+    :param session: optional ``requests.Session`` reused between triggers
     :returns: request response content
     """
 
@@ -39,7 +40,7 @@ def trigger_airflow_dag(dag_id, workflow_id, **kwargs):
     url = f"{AIRFLOW_BASE_URL}/api/v2/dags/{dag_id}/dagRuns"
 
     logger.info("Triggering DAG %s with id %s", dag_id, str(workflow_id))
-    response = requests.post(
+    response = (session or requests).post(
         url,
         data=json.dumps(data, cls=DjangoJSONEncoder),
         headers=AIRFLOW_HEADERS | {"Content-Type": "application/json"},
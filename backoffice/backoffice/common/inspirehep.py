@@ -0,0 +1,63 @@
+import logging
+import os
+
+import requests
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts of the requests to inspirehep, in seconds
+INSPIREHEP_REQUEST_TIMEOUT = (3.05, 30)
+INSPIREHEP_RECORD_CACHE_TIMEOUT = 5 * 60
+
+inspirehep_session = requests.Session()
+inspirehep_session.mount("https://", HTTPAdapter(pool_maxsize=10))
+inspirehep_session.mount("http://", HTTPAdapter(pool_maxsize=10))
+
+
+def _get_record_cache_key(pid_type, control_number):
+    return f"inspirehep-record:{pid_type}:{control_number}"
+
+
+def get_inspirehep_record(pid_type, control_number):
+    """Fetch a record from inspirehep.
+
+    The last fetched revision of the record is cached for
+    ``INSPIREHEP_RECORD_CACHE_TIMEOUT`` seconds. It is revalidated with its
+    revision id as ETag, so that inspirehep only sends the record again if it
+    changed.
+
+    Returns:
+        dict: the record as returned by the inspirehep API, with ``metadata``,
+        ``revision_id`` and ``uuid``.
+
+    Raises:
+        requests.RequestException: if the record could not be fetched.
+    """
+    cache_key = _get_record_cache_key(pid_type, control_number)
+    cached_record = cache.get(cache_key)
+
+    headers = {"Accept": "application/json"}
+    if cached_record is not None:
+        headers["If-None-Match"] = f'"{cached_record["revision_id"]}"'
+
+    response = inspirehep_session.get(
+        f"{os.environ.get('INSPIREHEP_BASE_URL', '')}/api/{pid_type}/{control_number}",
+        headers=headers,
+        timeout=INSPIREHEP_REQUEST_TIMEOUT,
+    )
+    if cached_record is not None and response.status_code == 304:
+        logger.info(
+            "Record %s/%s not modified, using cached revision %s.",
+            pid_type,
+            control_number,
+            cached_record["revision_id"],
+        )
+        record = cached_record
+    else:
+        response.raise_for_status()
+        record = response.json()
+
+    cache.set(cache_key, record, timeout=INSPIREHEP_RECORD_CACHE_TIMEOUT)
+    return record
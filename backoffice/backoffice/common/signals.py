@@ -7,6 +7,9 @@ from django_opensearch_dsl.registries import registry
 from functools import partial
 from typing import Any
 from django.db import models, transaction
+from django.utils import timezone
+
+from backoffice.management.models import OpenSearchOutbox
 
 
 def update_registry_after_commit(instance):
@@ -40,3 +43,52 @@ class OnCommitSignalProcessor(RealTimeSignalProcessor):
         transaction.on_commit(
             partial(delete_from_registry_after_commit, instance=instance_for_delete)
         )
+
+
+def add_to_opensearch_outbox(instances):
+    """Record that the OpenSearch documents of the instances must be synced.
+
+    An instance already in the outbox only has its entry touched, so that it
+    is synced once after its last save.
+    """
+    now = timezone.now()
+    OpenSearchOutbox.objects.bulk_create(
+        [
+            OpenSearchOutbox(
+                model_label=instance._meta.label,
+                object_id=str(instance.pk),
+                _updated_at=now,
+            )
+            for instance in instances
+        ],
+        update_conflicts=True,
+        unique_fields=["model_label", "object_id"],
+        update_fields=["_updated_at"],
+    )
+
+
+class OutboxSignalProcessor(OnCommitSignalProcessor):
+    """Sync the documents of the saved and deleted instances asynchronously.
+
+    Instead of calling OpenSearch, the instances are recorded in the outbox
+    within the current transaction and indexed in bulk by
+    ``sync_opensearch_outbox``. Related documents are still updated on commit.
+    """
+
+    def handle_save(
+        self, sender: type[models.Model], instance: models.Model, **kwargs: Any
+    ) -> None:
+        if type(instance) not in registry.get_models():
+            super().handle_save(sender, instance, **kwargs)
+            return
+
+        add_to_opensearch_outbox([instance])
+
+    def handle_pre_delete(
+        self, sender: type[models.Model], instance: models.Model, **kwargs: Any
+    ) -> None:
+        if type(instance) not in registry.get_models():
+            super().handle_pre_delete(sender, instance, **kwargs)
+            return
+
+        add_to_opensearch_outbox([instance])
@@ -7,10 +7,13 @@ from django.db.migrations.recorder import MigrationRecorder
 
 from backoffice.common.signals import (
     OnCommitSignalProcessor,
+    OutboxSignalProcessor,
     delete_from_registry_after_commit,
     update_registry_after_commit,
 )
+from backoffice.hep.constants import HepStatusChoices, HepWorkflowType
 from backoffice.hep.models import HepWorkflow
+from backoffice.management.models import OpenSearchOutbox
 
 
 @pytest.fixture
@@ -80,3 +83,40 @@ def test_migration_recorder_rows_do_not_break_signal_handlers():
     recorder.record_unapplied("some_app", "0001_test")
 
     assert not recorder.migration_qs.filter(app="some_app", name="0001_test").exists()
+
+
+@pytest.fixture
+def outbox_processor():
+    # not instantiated, to not connect its handlers to the model signals
+    return OutboxSignalProcessor.__new__(OutboxSignalProcessor)
+
+
+@pytest.mark.django_db
+@patch("django.db.transaction.on_commit")
+def test_outbox_handle_save_records_registered_model(mock_on_commit, outbox_processor):
+    workflow = HepWorkflow(
+        data={},
+        status=HepStatusChoices.RUNNING,
+        workflow_type=HepWorkflowType.HEP_CREATE,
+    )
+
+    outbox_processor.handle_save(sender=HepWorkflow, instance=workflow)
+    outbox_processor.handle_pre_delete(sender=HepWorkflow, instance=workflow)
+
+    mock_on_commit.assert_not_called()
+    entry = OpenSearchOutbox.objects.get()
+    assert entry.model_label == "hep.HepWorkflow"
+    assert entry.object_id == str(workflow.id)
+
+
+@pytest.mark.django_db
+@patch("django.db.transaction.on_commit")
+def test_outbox_handle_save_ignores_unregistered_models(
+    mock_on_commit, outbox_processor, migration_instance
+):
+    outbox_processor.handle_save(
+        sender=type(migration_instance), instance=migration_instance
+    )
+
+    mock_on_commit.assert_not_called()
+    assert not OpenSearchOutbox.objects.exists()
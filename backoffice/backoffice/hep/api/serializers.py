@@ -24,6 +24,7 @@ from backoffice.hep.models import (
 from django.urls import reverse
 
 HEP_DECISION_VALUE_MAX_LENGTH = 1500
+HEP_BULK_CREATE_MAX_WORKFLOWS = 500
 
 
 def deserialize_references(value):
@@ -180,6 +181,32 @@ HEP_SEARCH_RESULT_DATA_FIELDS = (
 )
 
 
+# Parts of the documents returned by the search, the full workflows are
+# served by the detail endpoints
+HEP_SEARCH_RESULT_SOURCE_INCLUDES = (
+    "id",
+    "workflow_type",
+    "status",
+    "decisions",
+    "journal_coverage",
+    "relevance_prediction",
+    "classifier_results",
+    "reference_count",
+    "matches",
+    "_created_at",
+    "_updated_at",
+    *(
+        f"data.{field}"
+        for field in HEP_SEARCH_RESULT_DATA_FIELDS
+        if field not in ("_created_at", "_updated_at")
+    ),
+    "data.control_number",
+    "data.dois",
+    "data.source",
+    "data._private_notes",
+)
+
+
 class HepBackofficeSearchUISerializer(BaseBackofficeSearchUISerializer):
     def get_hit_representation(self, item):
         hit = super().get_hit_representation(item)
@@ -228,6 +255,14 @@ class HepBatchResolutionSerializer(serializers.Serializer):
     ids = serializers.ListField(child=serializers.UUIDField())
 
 
+class HepWorkflowBulkCreateSerializer(serializers.Serializer):
+    workflows = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=HEP_BULK_CREATE_MAX_WORKFLOWS,
+    )
+
+
 class HepChangeStatusSerializer(serializers.Serializer):
     note = serializers.CharField(max_length=255, default="")
 
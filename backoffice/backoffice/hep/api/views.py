@@ -1,18 +1,22 @@
 import logging
-import os
+from copy import deepcopy
+from functools import partial
 
-import requests
-from django.db import IntegrityError, transaction
+from django.db import transaction
+from django.http import Http404
+from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from backoffice.hep.tasks import batch_resolve_workflows
 from backoffice.hep.utils import (
     add_hep_decision,
-    add_hep_decision_batch,
+    add_hep_decisions_batch,
     resolve_workflow,
     complete_workflow,
+    get_hep_workflow_identifiers,
     get_restored_hep_workflow_type,
+    get_running_hep_submissions_identifiers,
     is_another_hep_submission_running,
 )
 from backoffice.hep.api.serializers import (
@@ -22,9 +26,12 @@ from backoffice.hep.api.serializers import (
     HepDecisionSerializer,
     HepResolutionSerializer,
     HepBatchResolutionSerializer,
+    HepWorkflowBulkCreateSerializer,
+    HEP_SEARCH_RESULT_SOURCE_INCLUDES,
     ManualMergeWorkflowSerializer,
 )
 from rest_framework.decorators import action
+from backoffice.common.signals import add_to_opensearch_outbox
 from backoffice.common.views import BaseWorkflowTicketViewSet, BaseWorkflowViewSet
 from backoffice.hep.models import HepWorkflowTicket, HepDecision, HepWorkflow
 from backoffice.hep.documents import HepWorkflowDocument
@@ -40,6 +47,7 @@ from drf_spectacular.utils import (
 )
 from requests.exceptions import RequestException
 from backoffice.common import airflow_utils
+from backoffice.common.inspirehep import get_inspirehep_record
 from backoffice.common.utils import (
     handle_request_exception,
     render_validation_error_response,
@@ -51,7 +59,10 @@ from backoffice.hep.api.renderers import (
     HepBackofficeUIBrowsableRenderer,
     HepBackofficeUIRenderer,
 )
-from backoffice.hep.tasks import trigger_hep_workflow_initialization
+from backoffice.hep.tasks import (
+    schedule_hep_workflows_initialization,
+    trigger_hep_workflow_initialization,
+)
 from django_elasticsearch_dsl_drf.filter_backends import (
     CompoundSearchFilterBackend,
     DefaultOrderingFilterBackend,
@@ -95,6 +106,14 @@ class HepDecisionViewSet(viewsets.ModelViewSet):
         description="Creates/Updates a Hep Workflow.",
         request=HepWorkflowSerializer,
     ),
+    bulk=extend_schema(
+        summary="Create Hep Workflows in bulk",
+        description=(
+            "Creates several Hep Workflows in one request. Workflows that "
+            "cannot be created are reported in errors by their index."
+        ),
+        request=HepWorkflowBulkCreateSerializer,
+    ),
     retrieve=extend_schema(
         summary="Retrieve a Hep Workflow",
         parameters=[
@@ -174,6 +193,88 @@ class HepWorkflowViewSet(BaseWorkflowViewSet):
         )
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        bulk_serializer = HepWorkflowBulkCreateSerializer(data=request.data)
+        bulk_serializer.is_valid(raise_exception=True)
+
+        errors = []
+        valid_workflows = []
+        for index, workflow_data in enumerate(
+            bulk_serializer.validated_data["workflows"]
+        ):
+            serializer = self.serializer_class(data=workflow_data)
+            if not serializer.is_valid():
+                errors.append({"index": index, "errors": serializer.errors})
+                continue
+            is_submission = (
+                serializer.validated_data["workflow_type"]
+                == HepWorkflowType.HEP_SUBMISSION
+            )
+            identifiers = (
+                get_hep_workflow_identifiers(workflow_data) if is_submission else None
+            )
+            valid_workflows.append((index, serializer.validated_data, identifiers))
+
+        running_arxiv_eprints, running_dois = get_running_hep_submissions_identifiers(
+            set().union(*(ids[0] for _index, _data, ids in valid_workflows if ids)),
+            set().union(*(ids[1] for _index, _data, ids in valid_workflows if ids)),
+        )
+
+        workflows = []
+        for index, validated_data, identifiers in valid_workflows:
+            if identifiers:
+                arxiv_eprints, dois = identifiers
+                if arxiv_eprints & running_arxiv_eprints or dois & running_dois:
+                    errors.append(
+                        {
+                            "index": index,
+                            "errors": {
+                                "error": "A workflow with the same arXiv eprint or DOI is currently being processed"
+                            },
+                        }
+                    )
+                    continue
+                # later submissions of the same paper in the batch conflict too
+                running_arxiv_eprints |= arxiv_eprints
+                running_dois |= dois
+
+            workflows.append(
+                HepWorkflow(
+                    **validated_data,
+                    source_data=deepcopy(validated_data["data"]),
+                )
+            )
+
+        created_workflows = HepWorkflow.objects.bulk_create(workflows)
+        logger.info(
+            "Created %s workflows in bulk, %s failed.",
+            len(created_workflows),
+            len(errors),
+        )
+
+        if created_workflows:
+            # bulk_create does not send the post_save signals
+            add_to_opensearch_outbox(created_workflows)
+            transaction.on_commit(
+                partial(schedule_hep_workflows_initialization, created_workflows)
+            )
+
+        return Response(
+            {
+                "workflows": [
+                    {
+                        "id": str(workflow.id),
+                        "workflow_type": workflow.workflow_type,
+                        "status": workflow.status,
+                    }
+                    for workflow in created_workflows
+                ],
+                "errors": sorted(errors, key=lambda error: error["index"]),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
     @action(detail=True, methods=["post"])
     def resolve(self, request, pk=None):
         serializer = self.resolution_serializer(data=request.data)
@@ -199,33 +300,35 @@ class HepWorkflowViewSet(BaseWorkflowViewSet):
         serializer.is_valid(raise_exception=True)
 
         data = serializer.validated_data
-        data["ids"] = [str(wf_id) for wf_id in data["ids"]]
-        accepted_ids = []
-
-        for wf_id in data["ids"]:
-            workflow = get_object_or_404(HepWorkflow, pk=wf_id)
-            try:
-                with transaction.atomic():
-                    add_hep_decision_batch(
-                        wf_id,
-                        request.user,
-                        data["action"],
-                        data.get("value"),
-                    )
-            except IntegrityError:
-                logger.warning(
-                    "Workflow %s already has an accept, core or reject decision.", wf_id
-                )
-                continue
+        workflow_ids = list(dict.fromkeys(data["ids"]))
 
-            workflow.status = HepStatusChoices.RUNNING
-            workflow.save()
+        existing_ids = set(
+            HepWorkflow.objects.select_for_update()
+            .filter(pk__in=workflow_ids)
+            .values_list("id", flat=True)
+        )
+        if len(existing_ids) != len(workflow_ids):
+            raise Http404("No HepWorkflow matches the given query.")
 
-            accepted_ids.append(wf_id)
+        accepted_ids = add_hep_decisions_batch(
+            workflow_ids, request.user, data["action"], data.get("value")
+        )
+        if len(accepted_ids) != len(workflow_ids):
+            logger.warning(
+                "Workflows %s already have an accept, core or reject decision.",
+                [str(wf_id) for wf_id in set(workflow_ids) - set(accepted_ids)],
+            )
+
+        HepWorkflow.objects.filter(pk__in=accepted_ids).update(
+            status=HepStatusChoices.RUNNING, _updated_at=timezone.now()
+        )
+
+        data["ids"] = [str(wf_id) for wf_id in accepted_ids]
 
-        data["ids"] = accepted_ids
         if accepted_ids:
-            transaction.on_commit(lambda: batch_resolve_workflows.delay(data))
+            # update does not send the post_save signals
+            add_to_opensearch_outbox(HepWorkflow.objects.filter(pk__in=accepted_ids))
+            transaction.on_commit(partial(batch_resolve_workflows.delay, data))
 
         return Response(
             {"message": "Batch resolution started.", "ids": data["ids"]},
@@ -314,15 +417,11 @@ class HepWorkflowViewSet(BaseWorkflowViewSet):
         logger.info("Data passed schema validation, creating workflow.")
 
         head_control_number = serializer.validated_data["head_control_number"]
-        inspirehep_base_url = os.environ.get("INSPIREHEP_BASE_URL", "")
         try:
-            response = requests.get(
-                f"{inspirehep_base_url}/api/literature/{head_control_number}",
-                headers={"Accept": "application/json"},
-            )
-            response.raise_for_status()
-            head_record_data = response.json().get("metadata", {})
-        except requests.RequestException as e:
+            head_record_data = get_inspirehep_record(
+                "literature", head_control_number
+            ).get("metadata", {})
+        except RequestException as e:
             return handle_request_exception(
                 f"Could not fetch head record {head_control_number} from inspirehep",
                 e,
@@ -441,6 +540,13 @@ class HepWorkflowDocumentView(BaseDocumentViewSet):
         super().__init__(*args, **kwargs)
         self.search = self.search.extra(track_total_hits=True)
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # only the result list is slimmed, the detail returns the whole document
+        if self.action == "list":
+            queryset = queryset.source(includes=list(HEP_SEARCH_RESULT_SOURCE_INCLUDES))
+        return queryset
+
     document = HepWorkflowDocument
     serializer_class = HepWorkflowDocumentSerializer
     pagination_class = OSStandardResultsSetPagination
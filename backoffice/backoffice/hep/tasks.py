@@ -1,5 +1,8 @@
 import logging
+import math
 
+import requests
+from celery import group
 from celery.exceptions import SoftTimeLimitExceeded
 from requests.exceptions import RequestException
 from backoffice.hep.constants import HepResolutions
@@ -13,6 +16,8 @@ from backoffice.hep.models import HepWorkflow
 
 logger = logging.getLogger(__name__)
 
+HEP_BULK_TRIGGER_MAX_CONCURRENCY = 4
+
 
 @celery_app.task(
     autoretry_for=(RequestException,),
@@ -29,6 +34,45 @@ def trigger_hep_workflow_initialization(workflow_id, workflow_type):
     return airflow_utils.trigger_airflow_dag(dag_id, workflow_id)
 
 
+@celery_app.task
+def trigger_hep_workflows_initialization(workflows):
+    """Trigger the initialization DAG of several HEP workflows.
+
+    ``workflows`` is a list of ``[workflow_id, workflow_type]`` pairs. The DAG
+    runs are triggered one after the other over a single HTTP session. A
+    workflow whose trigger fails is retried on its own by
+    ``trigger_hep_workflow_initialization``.
+    """
+    with requests.Session() as session:
+        for workflow_id, workflow_type in workflows:
+            dag_id = WORKFLOW_DAGS[workflow_type].initialize
+            try:
+                airflow_utils.trigger_airflow_dag(dag_id, workflow_id, session=session)
+            except RequestException:
+                logger.exception(
+                    "Error triggering HEP workflow DAG %s for workflow %s, retrying",
+                    dag_id,
+                    workflow_id,
+                )
+                trigger_hep_workflow_initialization.delay(workflow_id, workflow_type)
+
+
+def schedule_hep_workflows_initialization(workflows):
+    """Trigger the initialization DAG of the workflows in grouped tasks.
+
+    The workflows are split in at most ``HEP_BULK_TRIGGER_MAX_CONCURRENCY``
+    chunks, so that at most that many requests are sent to Airflow at once.
+    """
+    if not workflows:
+        return
+    workflows = [[str(workflow.id), workflow.workflow_type] for workflow in workflows]
+    chunk_size = math.ceil(len(workflows) / HEP_BULK_TRIGGER_MAX_CONCURRENCY)
+    group(
+        trigger_hep_workflows_initialization.s(workflows[start : start + chunk_size])
+        for start in range(0, len(workflows), chunk_size)
+    ).apply_async()
+
+
 @celery_app.task(soft_time_limit=10 * 60, time_limit=11 * 60)
 def batch_resolve_workflows(data):
     """Clear the requested Airflow task for each workflow in a batch.
@@ -40,13 +84,19 @@ def batch_resolve_workflows(data):
     ``ERROR``; ``SoftTimeLimitExceeded`` is re-raised so Celery can stop the
     task cleanly.
     """
+    workflow_types = {
+        str(wf_id): workflow_type
+        for wf_id, workflow_type in HepWorkflow.objects.filter(
+            pk__in=data["ids"]
+        ).values_list("id", "workflow_type")
+    }
     for wf_id in data["ids"]:
         try:
-            workflow = HepWorkflow.objects.only("workflow_type").get(pk=wf_id)
+            workflow_type = workflow_types[wf_id]
             task_to_restart = HepResolutions[data["action"]].label
             if task_to_restart:
                 airflow_utils.clear_airflow_dag_tasks(
-                    WORKFLOW_DAGS[workflow.workflow_type].initialize,
+                    WORKFLOW_DAGS[workflow_type].initialize,
                     wf_id,
                     tasks=[task_to_restart],
                 )
@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 
 from django.apps import apps
+from django.core.cache import cache
 from django.urls import reverse
 from requests.exceptions import RequestException
 
@@ -29,13 +30,18 @@ class TestManualMergeViewSet(BaseTransactionTestCase):
     reset_sequences = True
     fixtures = ["backoffice/fixtures/groups.json"]
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def _mock_inspirehep_response(self, metadata):
         mock_response = Mock()
         mock_response.raise_for_status = Mock()
-        mock_response.json.return_value = {"metadata": metadata}
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"metadata": metadata, "revision_id": 3}
         return mock_response
 
-    @patch("backoffice.hep.api.views.requests.get")
+    @patch("backoffice.common.inspirehep.inspirehep_session.get")
     @patch("backoffice.common.airflow_utils.trigger_airflow_dag")
     def test_manual_merge_creates_workflow_with_head_data(
         self, mock_trigger_dag, mock_get
@@ -59,7 +65,7 @@ class TestManualMergeViewSet(BaseTransactionTestCase):
         self.assertIn("id", json_response)
         self.assertTrue(HepWorkflow.objects.filter(id=json_response["id"]).exists())
 
-    @patch("backoffice.hep.api.views.requests.get")
+    @patch("backoffice.common.inspirehep.inspirehep_session.get")
     @patch("backoffice.common.airflow_utils.trigger_airflow_dag")
     def test_manual_merge_triggers_dag_with_correct_params(
         self, mock_trigger_dag, mock_get
@@ -83,7 +89,36 @@ class TestManualMergeViewSet(BaseTransactionTestCase):
             update_control_number=222,
         )
 
-    @patch("backoffice.hep.api.views.requests.get")
+    @patch("backoffice.common.inspirehep.inspirehep_session.get")
+    @patch("backoffice.common.airflow_utils.trigger_airflow_dag")
+    def test_manual_merge_revalidates_cached_head_record(
+        self, mock_trigger_dag, mock_get
+    ):
+        mock_get.side_effect = [
+            self._mock_inspirehep_response(HEAD_RECORD_METADATA),
+            Mock(status_code=304),
+        ]
+        mock_trigger_dag.return_value = ({}, 200)
+        self.api_client.force_authenticate(user=self.curator)
+
+        responses = [
+            self.api_client.post(
+                MANUAL_MERGE_URL,
+                format="json",
+                data={"head_control_number": 111, "update_control_number": 222},
+            )
+            for _ in range(2)
+        ]
+
+        for response in responses:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["data"], HEAD_RECORD_METADATA)
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(
+            mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"3"'
+        )
+
+    @patch("backoffice.common.inspirehep.inspirehep_session.get")
     def test_manual_merge_returns_error_when_head_fetch_fails(self, mock_get):
         mock_get.side_effect = RequestException("inspirehep unreachable")
         self.api_client.force_authenticate(user=self.curator)
@@ -101,7 +136,7 @@ class TestManualMergeViewSet(BaseTransactionTestCase):
             ).exists()
         )
 
-    @patch("backoffice.hep.api.views.requests.get")
+    @patch("backoffice.common.inspirehep.inspirehep_session.get")
     @patch(
         "backoffice.common.airflow_utils.trigger_airflow_dag",
         side_effect=RequestException("Airflow unavailable"),
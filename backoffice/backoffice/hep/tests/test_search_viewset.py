@@ -84,6 +84,41 @@ class TestHepWorkflowSearchViewSet(BaseTransactionTestCase):
         author = response.json()["results"][0]["data"]["authors"][0]
         self.assertEqual(author["affiliations"], [])
 
+    def test_search_returns_list_projection(self):
+        self.api_client.force_authenticate(user=self.curator)
+
+        self.workflow.data = {
+            "titles": [{"title": "A title"}],
+            "references": [{"reference": {"title": {"title": "A reference"}}}],
+        }
+        self.workflow.save()
+
+        response = self.api_client.get(self.endpoint, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        result = response.json()["results"][0]
+        self.assertEqual(result["status"], HepStatusChoices.APPROVAL)
+        self.assertEqual(result["data"]["titles"], [{"title": "A title"}])
+        self.assertNotIn("references", result["data"])
+
+        response = self.api_client.get(
+            reverse("api:hep-detail", kwargs={"pk": self.workflow.id}), format="json"
+        )
+        self.assertEqual(
+            response.json()["data"]["references"],
+            self.workflow.data["references"],
+        )
+
+        response = self.api_client.get(
+            reverse("search:hep-detail", kwargs={"pk": self.workflow.id}),
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["data"]["references"],
+            self.workflow.data["references"],
+        )
+
     @patch("backoffice.common.airflow_utils.trigger_airflow_dag")
     def test_post_hep_workflow_adds_document_to_index(self, mock_trigger_airflow_dag):
         self.api_client.force_authenticate(user=self.curator)
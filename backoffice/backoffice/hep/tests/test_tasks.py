@@ -8,7 +8,12 @@ from backoffice.hep.constants import (
     HepWorkflowType,
 )
 from backoffice.hep.models import HepWorkflow
-from backoffice.hep.tasks import batch_resolve_workflows
+from backoffice.hep.tasks import (
+    HEP_BULK_TRIGGER_MAX_CONCURRENCY,
+    batch_resolve_workflows,
+    schedule_hep_workflows_initialization,
+    trigger_hep_workflows_initialization,
+)
 from requests.exceptions import RequestException
 
 
@@ -56,3 +61,42 @@ class TestBatchResolveWorkflowsTask(BaseTransactionTestCase):
         self.assertEqual(wfs[0].status, HepStatusChoices.RUNNING)
         self.assertEqual(wfs[1].status, HepStatusChoices.ERROR)
         self.assertEqual(wfs[2].status, HepStatusChoices.RUNNING)
+
+
+class TestTriggerHepWorkflowsInitializationTask(BaseTransactionTestCase):
+    @patch("backoffice.hep.tasks.trigger_hep_workflow_initialization.delay")
+    @patch("backoffice.common.airflow_utils.trigger_airflow_dag")
+    def test_trigger_hep_workflows_initialization_retries_failures_alone(
+        self, mock_trigger, mock_trigger_single
+    ):
+        ok = (b"", 200)
+        mock_trigger.side_effect = [ok, RequestException("Airflow is down"), ok]
+        workflows = [[str(uuid.uuid4()), HepWorkflowType.HEP_CREATE] for _ in range(3)]
+
+        trigger_hep_workflows_initialization(workflows)
+
+        self.assertEqual(mock_trigger.call_count, 3)
+        sessions = {call.kwargs["session"] for call in mock_trigger.call_args_list}
+        self.assertEqual(len(sessions), 1)
+        mock_trigger_single.assert_called_once_with(*workflows[1])
+
+    @patch("backoffice.hep.tasks.group")
+    def test_schedule_hep_workflows_initialization_bounds_concurrency(self, mock_group):
+        workflows = [
+            HepWorkflow(workflow_type=HepWorkflowType.HEP_CREATE, id=uuid.uuid4())
+            for _ in range(10)
+        ]
+
+        schedule_hep_workflows_initialization(workflows)
+
+        signatures = list(mock_group.call_args.args[0])
+        self.assertEqual(len(signatures), HEP_BULK_TRIGGER_MAX_CONCURRENCY)
+        self.assertEqual(
+            [
+                workflow_id
+                for signature in signatures
+                for workflow_id, _workflow_type in signature.args[0]
+            ],
+            [str(workflow.id) for workflow in workflows],
+        )
+        mock_group.return_value.apply_async.assert_called_once()
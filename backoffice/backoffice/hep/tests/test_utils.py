@@ -5,11 +5,14 @@ import uuid
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.test import TransactionTestCase
+from opensearchpy.exceptions import OpenSearchException
 from rest_framework.exceptions import ValidationError
 from backoffice.hep.utils import (
     resolve_workflow,
     complete_workflow,
     get_restored_hep_workflow_type,
+    get_running_hep_submissions_identifiers,
+    get_running_hep_submissions_query,
     is_another_hep_submission_running,
 )
 
@@ -204,6 +207,45 @@ class TestUtils(TransactionTestCase):
         self.assertFalse(result)
         mock_search.assert_not_called()
 
+    @patch("backoffice.hep.utils.opensearch_client.search")
+    def test_get_running_hep_submissions_identifiers(self, mock_search):
+        mock_search.return_value = {
+            "aggregations": {
+                "arxiv_eprints": {"buckets": [{"key": "2502.05665", "doc_count": 1}]},
+                "dois": {"buckets": []},
+            }
+        }
+
+        result = get_running_hep_submissions_identifiers(
+            {"2504.01123", "2502.05665"}, {"10.1103/fc8j-tb8k"}
+        )
+
+        self.assertEqual(result, ({"2502.05665"}, set()))
+        query = mock_search.call_args.kwargs["body"]
+        self.assertEqual(
+            query["query"],
+            get_running_hep_submissions_query(
+                ["2502.05665", "2504.01123"], ["10.1103/fc8j-tb8k"]
+            ),
+        )
+        self.assertEqual(query["size"], 0)
+        self.assertEqual(
+            query["aggs"]["arxiv_eprints"]["terms"]["include"],
+            ["2502.05665", "2504.01123"],
+        )
+
+    @patch("backoffice.hep.utils.opensearch_client.search")
+    def test_get_running_hep_submissions_identifiers_ignores_opensearch_error(
+        self, mock_search
+    ):
+        mock_search.side_effect = OpenSearchException("OpenSearch unavailable")
+
+        with self.assertLogs("backoffice.hep.utils", level="ERROR") as logs:
+            result = get_running_hep_submissions_identifiers({"2502.05665"}, set())
+
+        self.assertEqual(result, (set(), set()))
+        self.assertIn("OpenSearch unavailable", logs.output[0])
+
     @patch("backoffice.hep.utils.opensearch_client.search")
     def test_is_another_hep_submission_running_skips_null_arxiv_value(
         self, mock_search
@@ -11,6 +11,7 @@ from backoffice.hep.api.serializers import (
     HepWorkflowSerializer,
 )
 from backoffice.hep.models import HepWorkflowTicket
+from backoffice.management.models import OpenSearchOutbox
 from backoffice.hep.constants import (
     HepWorkflowType,
     HepStatusChoices,
@@ -282,6 +283,105 @@ class TestWorkflowViewSet(BaseTransactionTestCase):
         self.assertEqual(validate_response.status_code, 400)
         self.assertEqual(validate_response.json(), expected_response)
 
+    @patch("backoffice.hep.api.views.schedule_hep_workflows_initialization")
+    def test_bulk_create_hep(self, mock_schedule_hep_workflows_initialization):
+        self.api_client.force_authenticate(user=self.curator)
+        workflows = [
+            {
+                "workflow_type": HepWorkflowType.HEP_CREATE,
+                "data": hep_data_valid(),
+            },
+            {"data": hep_data_valid()},
+            {
+                "workflow_type": HepWorkflowType.HEP_PUBLISHER_CREATE,
+                "data": hep_data_valid(),
+            },
+        ]
+
+        response = self.api_client.post(
+            reverse("api:hep-bulk"), format="json", data={"workflows": workflows}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        json_response = response.json()
+        self.assertEqual(
+            [workflow["workflow_type"] for workflow in json_response["workflows"]],
+            [HepWorkflowType.HEP_CREATE, HepWorkflowType.HEP_PUBLISHER_CREATE],
+        )
+        self.assertEqual(len(json_response["errors"]), 1)
+        self.assertEqual(json_response["errors"][0]["index"], 1)
+        self.assertIn("workflow_type", json_response["errors"][0]["errors"])
+        self.assertEqual(HepWorkflow.objects.count(), 3)
+        created_workflow = HepWorkflow.objects.get(
+            id=json_response["workflows"][0]["id"]
+        )
+        self.assertEqual(created_workflow.source_data, workflows[0]["data"])
+        self.assertEqual(
+            set(OpenSearchOutbox.objects.values_list("object_id", flat=True)),
+            {workflow["id"] for workflow in json_response["workflows"]},
+        )
+        mock_schedule_hep_workflows_initialization.assert_called_once()
+        self.assertEqual(
+            [
+                str(workflow.id)
+                for workflow in mock_schedule_hep_workflows_initialization.call_args.args[
+                    0
+                ]
+            ],
+            [workflow["id"] for workflow in json_response["workflows"]],
+        )
+
+    @patch(
+        "backoffice.hep.api.views.get_running_hep_submissions_identifiers",
+        return_value=({"2502.05665"}, set()),
+    )
+    @patch("backoffice.hep.api.views.schedule_hep_workflows_initialization")
+    def test_bulk_create_hep_reports_running_submissions(
+        self, mock_schedule_hep_workflows_initialization, mock_get_running
+    ):
+        self.api_client.force_authenticate(user=self.curator)
+
+        def submission(arxiv_eprint, doi):
+            return {
+                "workflow_type": HepWorkflowType.HEP_SUBMISSION,
+                "data": {
+                    **hep_data_valid(),
+                    "arxiv_eprints": [{"value": arxiv_eprint}],
+                    "dois": [{"value": doi}],
+                },
+            }
+
+        workflows = [
+            submission("2502.05665", "10.1000/running"),
+            submission("2502.00001", "10.1000/new"),
+            submission("2502.00002", "10.1000/new"),
+            {"workflow_type": HepWorkflowType.HEP_CREATE, "data": hep_data_valid()},
+        ]
+
+        response = self.api_client.post(
+            reverse("api:hep-bulk"), format="json", data={"workflows": workflows}
+        )
+
+        self.assertEqual(response.status_code, 201)
+        mock_get_running.assert_called_once_with(
+            {"2502.05665", "2502.00001", "2502.00002"},
+            {"10.1000/running", "10.1000/new"},
+        )
+        self.assertEqual(
+            [error["index"] for error in response.json()["errors"]], [0, 2]
+        )
+        self.assertEqual(len(response.json()["workflows"]), 2)
+        self.assertEqual(HepWorkflow.objects.count(), 3)
+
+    def test_bulk_create_hep_empty(self):
+        self.api_client.force_authenticate(user=self.curator)
+
+        response = self.api_client.post(
+            reverse("api:hep-bulk"), format="json", data={"workflows": []}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
     def test_get_non_existent_workflow(self):
         self.api_client.force_authenticate(user=self.curator)
         detail_url = reverse("api:hep-detail", kwargs={"pk": "THISISFORSURENOTANID"})
@@ -503,6 +603,10 @@ class TestWorkflowViewSet(BaseTransactionTestCase):
 
             self.assertEqual(workflow.status, HepStatusChoices.RUNNING)
         self.assertEqual(mock_post.call_count, len(wfs_ids))
+        self.assertEqual(
+            set(OpenSearchOutbox.objects.values_list("object_id", flat=True)),
+            {str(wf_id) for wf_id in wfs_ids},
+        )
 
     @patch("backoffice.common.airflow_utils.requests.post")
     def test_batch_resolve_skips_workflow_with_exclusive_decision(self, mock_post):
@@ -534,6 +638,30 @@ class TestWorkflowViewSet(BaseTransactionTestCase):
         self.assertEqual(workflow.status, HepStatusChoices.APPROVAL)
         self.assertEqual(workflow.decisions.count(), 1)
 
+    @patch("backoffice.hep.api.views.batch_resolve_workflows.delay")
+    def test_batch_resolve_unknown_workflow(self, mock_delay):
+        workflow = HepWorkflow.objects.create(
+            data={},
+            status=HepStatusChoices.APPROVAL,
+            workflow_type=HepWorkflowType.HEP_CREATE,
+        )
+        self.api_client.force_authenticate(user=self.curator)
+
+        response = self.api_client.post(
+            reverse("api:hep-batch-resolve-list"),
+            format="json",
+            data={
+                "ids": [workflow.id, uuid.uuid4()],
+                "action": HepResolutions.hep_accept,
+            },
+        )
+
+        self.assertEqual(response.status_code, 404)
+        mock_delay.assert_not_called()
+        workflow.refresh_from_db()
+        self.assertEqual(workflow.status, HepStatusChoices.APPROVAL)
+        self.assertFalse(workflow.decisions.exists())
+
     @patch("backoffice.common.airflow_utils.requests.post")
     def test_batch_resolve_exception_partial_success(self, mock_post):
         response_ok = Mock(
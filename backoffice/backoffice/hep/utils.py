@@ -8,6 +8,7 @@ import logging
 from backoffice.hep.models import HepWorkflow
 
 from backoffice.hep.constants import (
+    HEP_EXCLUSIVE_RESOLUTIONS,
     HepResolutions,
     HepStatusChoices,
     HepWorkflowType,
@@ -18,6 +19,7 @@ from backoffice.common import airflow_utils
 from inspire_utils.record import get_value
 
 from backoffice.management.utils import get_opensearch_client
+from opensearchpy.exceptions import OpenSearchException
 
 
 from django.conf import settings
@@ -43,16 +45,40 @@ def get_restored_hep_workflow_type(workflow):
     return HepWorkflowType.HEP_CREATE
 
 
-def add_hep_decision_batch(workflow_id, user, action, value=None):
-    data = {"workflow": workflow_id, "user": user, "action": action}
+def add_hep_decisions_batch(workflow_ids, user, action, value=None):
+    """Add the same decision to several workflows at once.
 
-    if value is not None:
-        data["value"] = value
+    Workflows that already have the same decision, or another exclusive
+    resolution when ``action`` is exclusive, are skipped.
 
-    serializer = HepDecisionSerializer(data=data)
-    serializer.is_valid(raise_exception=True)
-    serializer.save()
-    return serializer.data
+    Returns:
+        list: the ids of the workflows the decision was added to.
+    """
+    conflicting_actions = [action]
+    if action in HEP_EXCLUSIVE_RESOLUTIONS:
+        conflicting_actions.extend(HEP_EXCLUSIVE_RESOLUTIONS)
+    conflicting_ids = set(
+        HepDecision.objects.filter(
+            workflow_id__in=workflow_ids, action__in=conflicting_actions
+        ).values_list("workflow_id", flat=True)
+    )
+    accepted_ids = [
+        workflow_id
+        for workflow_id in workflow_ids
+        if workflow_id not in conflicting_ids
+    ]
+
+    extra_fields = {"value": value} if value is not None else {}
+    HepDecision.objects.bulk_create(
+        [
+            HepDecision(
+                workflow_id=workflow_id, user=user, action=action, **extra_fields
+            )
+            for workflow_id in accepted_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return accepted_ids
 
 
 def add_hep_decision(workflow_id, user, action, value=None):
@@ -115,6 +141,95 @@ def complete_workflow(id, data):
     return workflow
 
 
+def get_hep_workflow_identifiers(workflow):
+    """Return the arXiv eprints and DOIs of a workflow payload as sets."""
+    arxiv_eprints_values = {
+        value
+        for value in get_value(workflow, "data.arxiv_eprints.value", []) or []
+        if value
+    }
+    dois_values = {
+        value for value in get_value(workflow, "data.dois.value", []) or [] if value
+    }
+    return arxiv_eprints_values, dois_values
+
+
+def get_running_hep_submissions_query(arxiv_eprints_values, dois_values):
+    """Build the query of the HEP submissions not completed with the identifiers."""
+    should_clauses = []
+    if arxiv_eprints_values:
+        should_clauses.append(
+            {"terms": {"data.arxiv_eprints.value": arxiv_eprints_values}}
+        )
+    if dois_values:
+        should_clauses.append({"terms": {"data.dois.value": dois_values}})
+
+    return {
+        "bool": {
+            "must": [{"term": {"data.acquisition_source.method": "submitter"}}],
+            "must_not": [{"match": {"status": HepStatusChoices.COMPLETED}}],
+            "should": should_clauses,
+            "minimum_should_match": 1,
+        }
+    }
+
+
+def get_running_hep_submissions_identifiers(arxiv_eprints_values, dois_values):
+    """Find which arXiv eprints and DOIs belong to a HEP submission not completed.
+
+    All the values are checked with a single OpenSearch query, aggregating the
+    matching submissions on the requested values only.
+
+    Returns:
+        tuple(set, set): the arXiv eprints and the DOIs with a running submission.
+    """
+    if not arxiv_eprints_values and not dois_values:
+        return set(), set()
+
+    index_name = settings.OPENSEARCH_INDEX_NAMES.get(settings.HEP_DOCUMENTS)
+    fields = {
+        "arxiv_eprints": ("data.arxiv_eprints.value", sorted(arxiv_eprints_values)),
+        "dois": ("data.dois.value", sorted(dois_values)),
+    }
+    aggs = {
+        name: {"terms": {"field": field, "include": values, "size": len(values)}}
+        for name, (field, values) in fields.items()
+        if values
+    }
+
+    query = {
+        "size": 0,
+        "query": get_running_hep_submissions_query(
+            fields["arxiv_eprints"][1], fields["dois"][1]
+        ),
+        "aggs": aggs,
+    }
+    try:
+        response = opensearch_client.search(index=index_name, body=query)
+    except OpenSearchException as e:
+        logger.error(
+            "Ignoring check for active submissions running. "
+            "OpenSearch failed with error: %s",
+            str(e),
+        )
+        return set(), set()
+
+    aggregations = response.get("aggregations", {})
+    running_identifiers = tuple(
+        {
+            bucket["key"]
+            for bucket in aggregations.get(name, {}).get("buckets", [])
+            if bucket.get("doc_count")
+        }
+        for name in fields
+    )
+    logger.info(
+        "Found %s arXiv eprints and %s DOIs with active HEP submissions",
+        *(len(identifiers) for identifiers in running_identifiers),
+    )
+    return running_identifiers
+
+
 def is_another_hep_submission_running(workflow):
     """Check whether a matching HEP submission has not completed."""
 
@@ -130,23 +245,8 @@ def is_another_hep_submission_running(workflow):
         logger.info("No arXiv eprints or DOIs in workflow, skipping matching.")
         return False
 
-    should_clauses = []
-    if arxiv_eprints_values:
-        should_clauses.append(
-            {"terms": {"data.arxiv_eprints.value": arxiv_eprints_values}}
-        )
-    if dois_values:
-        should_clauses.append({"terms": {"data.dois.value": dois_values}})
-
     query = {
-        "query": {
-            "bool": {
-                "must": [{"term": {"data.acquisition_source.method": "submitter"}}],
-                "must_not": [{"match": {"status": HepStatusChoices.COMPLETED}}],
-                "should": should_clauses,
-                "minimum_should_match": 1,
-            }
-        }
+        "query": get_running_hep_submissions_query(arxiv_eprints_values, dois_values)
     }
     try:
         response = opensearch_client.search(index=index_name, body=query)
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-19 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("management", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="opensearchoutbox",
+            name="_claimed_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import models
+from django.utils import timezone
+
+
+class OpenSearchOutbox(models.Model):
+    """Instance whose OpenSearch documents have to be synced.
+
+    There is at most one entry per instance, so that the successive saves of
+    an instance are synced only once. An entry being synced is claimed until
+    ``_claimed_until``, after which another sync can take it over.
+    """
+
+    model_label = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=64)
+    _updated_at = models.DateTimeField(default=timezone.now)
+    _claimed_until = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = (
+            models.UniqueConstraint(
+                fields=["model_label", "object_id"],
+                name="unique_opensearch_outbox_entry",
+            ),
+        )
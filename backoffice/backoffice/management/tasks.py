@@ -0,0 +1,155 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django_opensearch_dsl.registries import registry
+from opensearchpy.exceptions import OpenSearchException
+
+from backoffice.management.models import OpenSearchOutbox
+from config import celery_app
+
+logger = logging.getLogger(__name__)
+
+OPENSEARCH_OUTBOX_BATCH_SIZE = 500
+OPENSEARCH_OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=10)
+
+
+def _get_document_actions(document, object_ids, instances):
+    for object_id in object_ids:
+        instance = instances.get(object_id)
+        if instance is None:
+            yield {
+                "_op_type": "delete",
+                "_index": document._index._name,
+                "_id": object_id,
+            }
+        elif document.should_index_object(instance):
+            yield {
+                "_op_type": "index",
+                "_index": document._index._name,
+                "_id": str(document.generate_id(instance)),
+                "_source": document.prepare(instance),
+            }
+        else:
+            yield {
+                "_op_type": "delete",
+                "_index": document._index._name,
+                "_id": str(document.generate_id(instance)),
+            }
+
+
+def _sync_documents(model_label, object_ids):
+    """Sync the documents of the given instances with one bulk request each.
+
+    Returns:
+        set: the ids of the instances that could not be synced.
+    """
+    model = apps.get_model(model_label)
+    instances = {
+        str(pk): instance for pk, instance in model.objects.in_bulk(object_ids).items()
+    }
+
+    failed_ids = set()
+    for document_class in registry._models.get(model, ()):
+        document = document_class()
+        try:
+            _, errors = document.bulk(
+                _get_document_actions(document, object_ids, instances),
+                raise_on_error=False,
+                refresh=getattr(settings, "OPENSEARCH_DSL_AUTO_REFRESH", False),
+            )
+        except OpenSearchException:
+            logger.exception("Error syncing %s documents", model_label)
+            return set(object_ids)
+
+        for error in errors:
+            for op_type, item in error.items():
+                # deleting a document that was never indexed is not an error
+                if op_type == "delete" and item.get("status") == 404:
+                    continue
+                failed_ids.add(str(item["_id"]))
+    return failed_ids
+
+
+@celery_app.task
+def sync_opensearch_outbox(batch_size=OPENSEARCH_OUTBOX_BATCH_SIZE):
+    """Sync the documents of the oldest outbox entries with OpenSearch.
+
+    Existing instances are fully reindexed, deleted ones or the ones that
+    should not be indexed anymore are removed from the index. An entry is
+    removed only if its instance was not saved again during the sync, and
+    kept to be retried if the sync failed.
+
+    The entries are claimed in a short transaction and synced outside of it,
+    so that saving their instances is not blocked by the sync. Overlapping runs
+    skip the claimed entries and sync the next ones, and the claims of a run
+    that died are taken over once ``OPENSEARCH_OUTBOX_CLAIM_TIMEOUT`` passed.
+    """
+    entries = _claim_opensearch_outbox_entries(batch_size)
+    if not entries:
+        return 0
+
+    try:
+        return _sync_opensearch_outbox_entries(entries)
+    finally:
+        # the entries that are left are retried by the next run
+        OpenSearchOutbox.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+            _claimed_until=None
+        )
+
+
+def _claim_opensearch_outbox_entries(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        entries = list(
+            OpenSearchOutbox.objects.select_for_update(skip_locked=True)
+            .filter(Q(_claimed_until__isnull=True) | Q(_claimed_until__lt=now))
+            .order_by("_updated_at")[:batch_size]
+        )
+        OpenSearchOutbox.objects.filter(pk__in=[entry.pk for entry in entries]).update(
+            _claimed_until=now + OPENSEARCH_OUTBOX_CLAIM_TIMEOUT
+        )
+    return entries
+
+
+def _sync_opensearch_outbox_entries(entries):
+    object_ids_by_model = defaultdict(list)
+    for entry in entries:
+        object_ids_by_model[entry.model_label].append(entry.object_id)
+
+    failed_entries = set()
+    for model_label, object_ids in object_ids_by_model.items():
+        failed_entries.update(
+            (model_label, object_id)
+            for object_id in _sync_documents(model_label, object_ids)
+        )
+
+    synced_entries = [
+        entry
+        for entry in entries
+        if (entry.model_label, entry.object_id) not in failed_entries
+    ]
+    if synced_entries:
+        OpenSearchOutbox.objects.filter(
+            reduce(
+                or_,
+                (
+                    Q(pk=entry.pk, _updated_at=entry._updated_at)
+                    for entry in synced_entries
+                ),
+            )
+        ).delete()
+
+    logger.info(
+        "Synced %s documents with OpenSearch, %s failed.",
+        len(synced_entries),
+        len(failed_entries),
+    )
+    return len(synced_entries)
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+from opensearchpy.exceptions import OpenSearchException
+
+from backoffice.common.signals import add_to_opensearch_outbox
+from backoffice.hep.constants import HepStatusChoices, HepWorkflowType
+from backoffice.hep.documents import HepWorkflowDocument
+from backoffice.hep.models import HepWorkflow
+from backoffice.management.models import OpenSearchOutbox
+from backoffice.management.tasks import sync_opensearch_outbox
+
+
+class SyncOpenSearchOutboxTestCase(TransactionTestCase):
+    def _create_workflow(self):
+        return HepWorkflow.objects.create(
+            data={},
+            status=HepStatusChoices.RUNNING,
+            workflow_type=HepWorkflowType.HEP_CREATE,
+        )
+
+    def test_add_to_opensearch_outbox_keeps_one_entry_per_instance(self):
+        workflow = self._create_workflow()
+
+        add_to_opensearch_outbox([workflow])
+        first_updated_at = OpenSearchOutbox.objects.get()._updated_at
+        add_to_opensearch_outbox([workflow])
+
+        entry = OpenSearchOutbox.objects.get()
+        self.assertEqual(entry.model_label, "hep.HepWorkflow")
+        self.assertEqual(entry.object_id, str(workflow.id))
+        self.assertGreater(entry._updated_at, first_updated_at)
+
+    def test_sync_opensearch_outbox(self):
+        workflow = self._create_workflow()
+        deleted_workflow = self._create_workflow()
+        deleted_workflow.delete()
+        HepWorkflow.objects.filter(pk=workflow.pk).update(
+            status=HepStatusChoices.COMPLETED
+        )
+        add_to_opensearch_outbox([workflow, deleted_workflow])
+
+        synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 2)
+        self.assertFalse(OpenSearchOutbox.objects.exists())
+        document = HepWorkflowDocument.get(id=str(workflow.id))
+        self.assertEqual(document.status, HepStatusChoices.COMPLETED)
+        self.assertIsNone(
+            HepWorkflowDocument.get(id=str(deleted_workflow.id), ignore=404)
+        )
+
+    def test_sync_opensearch_outbox_keeps_failed_entries(self):
+        workflow = self._create_workflow()
+        add_to_opensearch_outbox([workflow])
+
+        with patch.object(
+            HepWorkflowDocument,
+            "bulk",
+            return_value=(0, [{"index": {"_id": str(workflow.id), "status": 500}}]),
+        ):
+            synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 0)
+        self.assertTrue(OpenSearchOutbox.objects.exists())
+
+    def test_sync_opensearch_outbox_keeps_entries_saved_during_sync(self):
+        workflow = self._create_workflow()
+        add_to_opensearch_outbox([workflow])
+
+        def save_during_sync(actions, **kwargs):
+            list(actions)
+            self.assertFalse(connection.in_atomic_block)
+            add_to_opensearch_outbox([workflow])
+            return 1, []
+
+        with patch.object(HepWorkflowDocument, "bulk", side_effect=save_during_sync):
+            sync_opensearch_outbox()
+
+        entry = OpenSearchOutbox.objects.get()
+        self.assertIsNone(entry._claimed_until)
+
+    def test_sync_opensearch_outbox_deletes_documents_not_to_index(self):
+        workflow = self._create_workflow()
+        self.assertIsNotNone(HepWorkflowDocument.get(id=str(workflow.id), ignore=404))
+        add_to_opensearch_outbox([workflow])
+
+        with patch.object(
+            HepWorkflowDocument, "should_index_object", return_value=False
+        ):
+            synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 1)
+        self.assertIsNone(HepWorkflowDocument.get(id=str(workflow.id), ignore=404))
+
+    def test_sync_opensearch_outbox_skips_entries_claimed_by_another_run(self):
+        workflow = self._create_workflow()
+        add_to_opensearch_outbox([workflow])
+        OpenSearchOutbox.objects.update(
+            _claimed_until=timezone.now() + timedelta(minutes=5)
+        )
+
+        synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 0)
+        self.assertTrue(OpenSearchOutbox.objects.exists())
+
+    def test_sync_opensearch_outbox_takes_over_expired_claims(self):
+        workflow = self._create_workflow()
+        add_to_opensearch_outbox([workflow])
+        OpenSearchOutbox.objects.update(
+            _claimed_until=timezone.now() - timedelta(minutes=5)
+        )
+
+        synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 1)
+        self.assertFalse(OpenSearchOutbox.objects.exists())
+
+    def test_sync_opensearch_outbox_releases_failed_entries(self):
+        workflow = self._create_workflow()
+        add_to_opensearch_outbox([workflow])
+
+        with patch.object(
+            HepWorkflowDocument, "bulk", side_effect=OpenSearchException("down")
+        ):
+            synced = sync_opensearch_outbox()
+
+        self.assertEqual(synced, 0)
+        self.assertIsNone(OpenSearchOutbox.objects.get()._claimed_until)
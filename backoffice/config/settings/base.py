@@ -322,6 +322,19 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-schedule
+# Sent by a single dedicated `celery beat` process, not by the workers
+OPENSEARCH_OUTBOX_SYNC_INTERVAL = env.float(
+    "OPENSEARCH_OUTBOX_SYNC_INTERVAL", default=5.0
+)
+CELERY_BEAT_SCHEDULE = {
+    "sync-opensearch-outbox": {
+        "task": "backoffice.management.tasks.sync_opensearch_outbox",
+        "schedule": OPENSEARCH_OUTBOX_SYNC_INTERVAL,
+        # a run not started before the next one is sent is useless
+        "options": {"expires": OPENSEARCH_OUTBOX_SYNC_INTERVAL},
+    },
+}
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
@@ -407,7 +420,9 @@ OPENSEARCH_DSL = {
     "default": {"hosts": env("OPENSEARCH_HOST")},
 }
 
-OPENSEARCH_DSL_SIGNAL_PROCESSOR = "backoffice.common.signals.OnCommitSignalProcessor"
+# Documents are synced in bulk from the outbox by a periodic task, so that
+# saving a workflow does not wait for OpenSearch
+OPENSEARCH_DSL_SIGNAL_PROCESSOR = "backoffice.common.signals.OutboxSignalProcessor"
 
 # Workaround because it wont add the connection settings automatically
 connections.configure(default=OPENSEARCH_DSL["default"])
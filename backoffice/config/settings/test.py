@@ -44,6 +44,8 @@ OPENSEARCH_INDEX_NAMES = {
 }
 # Force an index refresh with every save.
 OPENSEARCH_DSL_AUTO_REFRESH = True
+# Index on commit instead of through the outbox, tests search right after saving
+OPENSEARCH_DSL_SIGNAL_PROCESSOR = "backoffice.common.signals.OnCommitSignalProcessor"
 
 OPENSEARCH_DSL = {
     "default": {
@@ -1,6 +1,5 @@
 import datetime
 import logging
-import time
 
 from airflow.sdk import Param, Variable, dag, task
 from airflow.sdk.execution_time.macros import ds_add
@@ -8,12 +7,13 @@ from hooks.generic_http_hook import GenericHttpHook
 from include.utils import workflows
 from include.utils.alerts import FailedDagNotifier
 from include.utils.data import (
+    HEPDATA_VERSIONS_CACHE_PATH,
     build_record,
-    delay_calculator,
-    download_record_versions,
+    cache_record_version,
+    download_records_versions,
     load_record,
 )
-from include.utils.s3 import S3JsonStore
+from include.utils.s3 import LocalJsonStore, S3JsonStore
 from literature.check_failures_task import check_failures
 
 logger = logging.getLogger(__name__)
@@ -35,7 +35,8 @@ def data_harvest_dag():
 
     Tasks:
     1. collect_ids: Obtains all new data ids to process.
-    2. download_record_versions: fetches a data record and all its previous versions
+    2. download_record_versions: fetches a data record and the previous versions
+       missing from the local versions cache, unchanged records are skipped
     3. build_record: Build a record that is compatible with the INSPIRE data schema
     4. normalize_collaborations: Normalize the collaborations in the record.
     5. load_record: Creates or Updates the record on INSPIRE.
@@ -88,23 +89,17 @@ def data_harvest_dag():
         s3_json_store = S3JsonStore(aws_conn_id="s3_conn")
 
         data_schema = Variable.get("data_schema")
-        hepdata_records = []
-
-        delay = delay_calculator(len(record_ids))
+        versions_store = LocalJsonStore(HEPDATA_VERSIONS_CACHE_PATH)
 
         logger.info(f"Processing {len(record_ids)} records.")
-        for record_id in record_ids:
-            try:
-                hepdata_records.append(download_record_versions(record_id))
-                time.sleep(delay)
-            except Exception as e:
-                logger.error(
-                    f"Error occurred while downloading "
-                    f"versions for record {record_id}: {e}"
-                )
-                failed_records["download_failed"].append(record_id)
+        hepdata_records, cached_ids, failed_records["download_failed"] = (
+            download_records_versions(record_ids, versions_store)
+        )
 
-        logger.info(f"Retrieved HEPData records for {len(hepdata_records)} records.")
+        logger.info(
+            f"Retrieved HEPData records for {len(hepdata_records)} records, "
+            f"{len(cached_ids)} records are unchanged."
+        )
 
         data_records = []
         for hepdata_record in hepdata_records:
@@ -134,14 +129,16 @@ def data_harvest_dag():
                 failed_records["normalize_failed"].append(hepdata_record_id)
                 continue
 
-            data_records.append(data_record)
+            data_records.append((hepdata_record, data_record))
 
-        for data_record in data_records:
+        for hepdata_record, data_record in data_records:
             try:
                 load_record(data_record)
             except Exception as e:
                 logger.error(f"Error occurred while loading record {data_record}: {e}")
                 failed_records["load_failed"].append(data_record)
+                continue
+            cache_record_version(versions_store, hepdata_record["base"])
 
         return s3_json_store.write_object(
             failed_records, f"harvests/data/{context['run_id']}.json"
@@ -7,7 +7,7 @@ from hooks.backoffice.workflow_management_hook import HEP, WorkflowManagementHoo
 from include.utils.alerts import FailedDagNotifier
 from include.utils.cds_harvest import build_records
 from include.utils.constants import HEP_PUBLISHER_CREATE
-from include.utils.harvests import fetch_records_oaipmh, load_records
+from include.utils.harvests import harvest_records_oaipmh, load_records
 from include.utils.s3 import S3JsonStore
 from literature.check_failures_task import check_failures
 from literature.oai_harvest_tasks import get_sets
@@ -53,31 +53,29 @@ def cds_literature_harvest_dag():
 
         logger.info(f"Fetching records with sets={sets}")
 
-        xml_records, failed_sets = fetch_records_oaipmh(
+        def process_xml_records(xml_records):
+            parsed_records, failed_build_records = build_records(
+                xml_records, context["run_id"]
+            )
+            failed_load_records = load_records(
+                parsed_records,
+                workflow_management_hook,
+                workflow_type=HEP_PUBLISHER_CREATE,
+            )
+            return failed_build_records, failed_load_records
+
+        failures = harvest_records_oaipmh(
             connection_id="cds_oaipmh_connection",
             metadata_prefix=context["params"]["metadata_prefix"],
             sets=sets,
             from_date=from_date,
             until_date=until_date,
+            process_records=process_xml_records,
+            checkpoint_store=s3_store,
+            checkpoint_prefix=f"cds_literature_harvest_dag/{context['run_id']}",
         )
 
-        parsed_records, failed_build_records = build_records(
-            xml_records,
-            context["run_id"],
-        )
-        failed_load_records = load_records(
-            parsed_records,
-            workflow_management_hook,
-            workflow_type=HEP_PUBLISHER_CREATE,
-        )
-
-        return s3_store.write_object(
-            {
-                "failed_sets": failed_sets,
-                "failed_build_records": failed_build_records,
-                "failed_load_records": failed_load_records,
-            }
-        )
+        return s3_store.write_object(failures)
 
     sets = get_sets()
     failed_record_key = process_records(sets)
@@ -41,7 +41,7 @@ from include.inspire.is_record_relevant import (
 from include.inspire.journal_title_normalization import (
     get_normalized_publication_info,
 )
-from include.inspire.journals import get_db_journals
+from include.inspire.journals import get_db_journals, get_journal_kb
 from include.inspire.refextract_utils import (
     extract_references_from_pdf,
     extract_references_from_text,
@@ -515,23 +515,43 @@ def hep_create_dag():
             if not references:
                 return
 
-            pid_type_and_recids = [
-                (reference.split("/")[-2], reference.split("/")[-1])
-                for reference in references
-            ]
+            endpoints_and_recids = []
+            for reference in references:
+                reference_parts = reference.split("/")
+                if len(reference_parts) < 2 or not reference_parts[-1].isdigit():
+                    logger.info(f"Skipping malformed reference {reference}")
+                    continue
+                endpoints_and_recids.append((reference_parts[-2], reference_parts[-1]))
+
+            records_coreness = {}
+            for endpoint in dict.fromkeys(
+                endpoint for endpoint, _ in endpoints_and_recids
+            ):
+                recids = dict.fromkeys(
+                    int(recid)
+                    for recid_endpoint, recid in endpoints_and_recids
+                    if recid_endpoint == endpoint
+                )
+                endpoint_records_coreness = (
+                    inspire_http_record_management_hook.get_records_coreness(
+                        list(recids), endpoint=endpoint
+                    )
+                )
+                for recid, record_coreness in endpoint_records_coreness.items():
+                    records_coreness[(endpoint, recid)] = record_coreness
 
             cited_records = []
-            for pid_type, recid in pid_type_and_recids:
-                try:
-                    record = inspire_http_record_management_hook.get_record(
-                        pid_type=pid_type,
-                        control_number=recid,
-                    )
-                    cited_records.append(record["metadata"])
-                except AirflowException:
+            for endpoint, recid in endpoints_and_recids:
+                record_coreness = records_coreness.get((endpoint, recid))
+                if not record_coreness:
                     logger.info(
-                        f"Skipping {pid_type} {recid} (no record found in Inspire)",
+                        f"Skipping {endpoint} {recid} (no record found in Inspire)",
                     )
+                    continue
+                if record_coreness["deleted"]:
+                    logger.info(f"Skipping {endpoint} {recid} (deleted record)")
+                    continue
+                cited_records.append(record_coreness)
 
             if not cited_records:
                 return
@@ -769,12 +789,7 @@ def hep_create_dag():
 
             source = LiteratureReader(workflow_data["data"]).source
 
-            response = inspire_http_hook.call_api(
-                endpoint="api/matcher/journal-kb",
-                method="GET",
-            )
-            response.raise_for_status()
-            journal_kb_dict = get_value(response.json(), "journal_kb_data")
+            journal_kb_dict = get_journal_kb(inspire_http_hook)
 
             if "references" in workflow_data["data"]:
                 raw_refs_to_extract, references = raw_refs_to_list(
@@ -867,12 +882,7 @@ def hep_create_dag():
             if not publication_infos:
                 return
 
-            response = inspire_http_hook.call_api(
-                endpoint="api/matcher/journal-kb",
-                method="GET",
-            )
-            response.raise_for_status()
-            kbs_journal_dict = get_value(response.json(), "journal_kb_data")
+            kbs_journal_dict = get_journal_kb(inspire_http_hook)
 
             extracted_publications = refextract_journal_info(
                 publication_infos, kbs_journal_dict
@@ -1936,7 +1946,7 @@ def hep_create_dag():
     @task
     def save_workflow(**context):
         workflow_id = context["params"]["workflow_id"]
-        workflow_data = s3_store.read_workflow(workflow_id)
+        workflow_data = s3_store.checkpoint_workflow(workflow_id)
         workflows.save_workflow(workflow_data)
 
     @task
@@ -2010,7 +2020,7 @@ def hep_create_dag():
     @task(trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS)
     def save_and_complete_workflow(**context):
         workflow_id = context["params"]["workflow_id"]
-        workflow_data = s3_store.read_workflow(workflow_id)
+        workflow_data = s3_store.checkpoint_workflow(workflow_id)
         workflow_data["status"] = STATUS_COMPLETED
 
         workflow_management_hook.update_workflow(workflow_id, workflow_data)
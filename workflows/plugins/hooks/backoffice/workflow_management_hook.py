@@ -69,6 +69,22 @@ class WorkflowManagementHook(BackofficeHook):
             endpoint=endpoint,
         )
 
+    def post_workflows(self, workflows_data: list[dict]) -> dict:
+        """Create several workflows with a single request.
+
+        :param workflows_data: The workflows to create.
+        :returns: The ``workflows`` created and the ``errors`` of the
+            workflows that could not be created, by ``index`` in
+            ``workflows_data``.
+        """
+        endpoint = f"{self.endpoint}/bulk/"
+        response = self.call_api(
+            method="POST",
+            json={"workflows": workflows_data},
+            endpoint=endpoint,
+        )
+        return response.json()
+
     def filter_workflows(self, params) -> dict:
         endpoint = f"{self.endpoint}/search/"
         response = self.call_api(method="GET", endpoint=endpoint, params=params)
@@ -1,6 +1,17 @@
+import json
+import os
+import tempfile
+import time
+from contextlib import suppress
+from pathlib import Path
+
 from hooks.inspirehep.inspire_http_hook import InspireHttpHook
 from requests import Response
 
+RECORDS_CORENESS_CHUNK_SIZE = 500
+RECORD_CACHE_PATH = Path(tempfile.gettempdir()) / "inspire_records"
+RECORD_CACHE_TIMEOUT = 5 * 60
+
 
 class InspireHTTPRecordManagementHook(InspireHttpHook):
     def __init__(self, *args, **kwargs):
@@ -18,14 +29,52 @@ class InspireHTTPRecordManagementHook(InspireHttpHook):
             endpoint=f"/api/{pid_type}/{control_number}",
         )
 
-    def get_record(self, pid_type: str, control_number: int) -> Response:
+    def get_record(
+        self,
+        pid_type: str,
+        control_number: int,
+        cache_path: Path = RECORD_CACHE_PATH,
+    ) -> dict:
+        """Get a record from inspirehep.
+
+        The last fetched revision of the record is cached on the worker for
+        ``RECORD_CACHE_TIMEOUT`` seconds. It is revalidated with its revision
+        id as ETag, so that inspirehep only sends the record again if it
+        changed. Otherwise it answers with ``304 Not Modified``.
+        """
+        record_cache_path = Path(cache_path) / f"{pid_type}_{control_number}.json"
+        cached_record = None
+        with suppress(OSError, ValueError):
+            if time.time() - record_cache_path.stat().st_mtime < RECORD_CACHE_TIMEOUT:
+                cached_record = json.loads(record_cache_path.read_text())
+
+        headers = self.headers
+        if cached_record:
+            headers = {
+                **(self.headers or {}),
+                "If-None-Match": f'"{cached_record["revision_id"]}"',
+            }
         response = self.run_with_advanced_retry(
             _retry_args=self.tenacity_retry_kwargs,
             method="GET",
-            headers=self.headers,
+            headers=headers,
             endpoint=f"/api/{pid_type}/{control_number}",
         )
-        return response.json()
+        if cached_record and response.status_code == 304:
+            record = cached_record
+        else:
+            record = response.json()
+
+        if "revision_id" in record:
+            # written to a temporary file first as other tasks of the worker may
+            # read the cache at the same time
+            Path(cache_path).mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_path, delete=False
+            ) as cache_file:
+                json.dump(record, cache_file)
+            os.replace(cache_file.name, record_cache_path)
+        return record
 
     def get_record_revision_id(self, pid_type: str, control_number: int) -> int:
         response = self.run_with_advanced_retry(
@@ -56,3 +105,29 @@ class InspireHTTPRecordManagementHook(InspireHttpHook):
             data=query_params,
         )
         return response.json()
+
+    def get_records_coreness(
+        self,
+        control_numbers: list,
+        endpoint: str = "literature",
+        chunk_size: int = RECORDS_CORENESS_CHUNK_SIZE,
+    ) -> dict:
+        """Get coreness, deleted status and collections of the endpoint records.
+
+        The control numbers are sent in chunks of ``chunk_size``. The result
+        maps the control numbers (as strings) of the existing records to
+        their info.
+        """
+        records_coreness = {}
+        for index in range(0, len(control_numbers), chunk_size):
+            response = self.call_api(
+                endpoint="api/curation/records-coreness",
+                method="POST",
+                json={
+                    "endpoint": endpoint,
+                    "control_numbers": control_numbers[index : index + chunk_size],
+                },
+            )
+            response.raise_for_status()
+            records_coreness.update(response.json())
+        return records_coreness
@@ -1,3 +1,9 @@
+import json
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
 from airflow.sdk.exceptions import AirflowException
 from hooks.inspirehep.inspire_http_record_management_hook import (
     InspireHTTPRecordManagementHook,
@@ -6,6 +12,8 @@ from include.utils.constants import JOURNALS_PID_TYPE
 from inspire_utils.helpers import maybe_int
 from inspire_utils.record import get_value
 
+JOURNAL_KB_CACHE_PATH = Path(tempfile.gettempdir()) / "inspire_journal_kb.json"
+
 
 def get_db_journals(data):
     inspire_http_record_management_hook = InspireHTTPRecordManagementHook()
@@ -27,3 +35,38 @@ def get_db_journals(data):
             pass
 
     return db_journals
+
+
+def get_journal_kb(inspire_http_hook, cache_path=JOURNAL_KB_CACHE_PATH):
+    """Get the journal KB used by refextract.
+
+    The KB is cached on disk with its ETag, so that the backend only sends it
+    again when it changed. Otherwise it answers with ``304 Not Modified``.
+    """
+    cached_journal_kb = None
+    with suppress(OSError, ValueError):
+        cached_journal_kb = json.loads(Path(cache_path).read_text())
+
+    headers = None
+    if cached_journal_kb:
+        headers = {"If-None-Match": cached_journal_kb["etag"]}
+    response = inspire_http_hook.call_api(
+        endpoint="api/matcher/journal-kb",
+        method="GET",
+        headers=headers,
+    )
+    if cached_journal_kb and response.status_code == 304:
+        return cached_journal_kb["journal_kb_data"]
+    response.raise_for_status()
+
+    journal_kb_data = get_value(response.json(), "journal_kb_data")
+    etag = response.headers.get("ETag")
+    if etag:
+        # written to a temporary file first as other tasks of the worker may
+        # read the cache at the same time
+        with tempfile.NamedTemporaryFile(
+            "w", dir=Path(cache_path).parent, delete=False
+        ) as cache_file:
+            json.dump({"etag": etag, "journal_kb_data": journal_kb_data}, cache_file)
+        os.replace(cache_file.name, cache_path)
+    return journal_kb_data
@@ -1,4 +1,9 @@
 import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from airflow.sdk.exceptions import AirflowException
 from hooks.generic_http_hook import GenericHttpHook
@@ -11,29 +16,161 @@ logger = logging.getLogger(__name__)
 
 generic_http_hook = GenericHttpHook(http_conn_id="hepdata_connection")
 
+HEPDATA_MAX_CONCURRENT_DOWNLOADS = 4
+HEPDATA_VERSIONS_CACHE_PATH = os.path.join(tempfile.gettempdir(), "hepdata")
 
-def download_record_versions(id):
-    """Download the versions of the record.
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    The bucket holds up to ``capacity`` tokens and is refilled with
+    ``capacity`` tokens every ``period`` seconds.
+    """
+
+    def __init__(self, capacity, period):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, waiting until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# the limits of the HEPData API are 60 requests per minute and 1000 per hour
+hepdata_rate_limits = (TokenBucket(60, 60), TokenBucket(1000, 60 * 60))
+
+
+def download_record_version(id, version=None):
+    """Download a version of the record, the latest one by default.
 
     Args: id (int): The id of the record.
-    Returns: dict: The record versions.
+            version (int): The version to download.
+    Returns: dict: The record version.
     """
-    hepdata_response = generic_http_hook.call_api(
-        endpoint=f"/record/ins{id}?format=json"
+    endpoint = f"/record/ins{id}?format=json"
+    if version:
+        endpoint = f"{endpoint}&version={version}"
+
+    for rate_limit in hepdata_rate_limits:
+        rate_limit.acquire()
+    response = generic_http_hook.call_api(endpoint=endpoint)
+    response.raise_for_status()
+    return response.json()
+
+
+def _get_record_version_key(id, version):
+    return f"ins{id}/{version}.json"
+
+
+def cache_record_version(versions_store, payload):
+    """Store a record version payload in the versions cache.
+
+    Args: versions_store (JsonStore): The versions cache.
+            payload (dict): The record version payload.
+    """
+    record = payload["record"]
+    versions_store.write_object(
+        payload, key=_get_record_version_key(record["inspire_id"], record["version"])
     )
-    payload = hepdata_response.json()
+
+
+def is_record_version_cached(versions_store, payload):
+    """Check whether the record version is cached and was not updated since.
+
+    Args: versions_store (JsonStore): The versions cache.
+            payload (dict): The record version payload.
+    Returns: bool: ``True`` if the same version is cached.
+    """
+    record = payload["record"]
+    key = _get_record_version_key(record["inspire_id"], record["version"])
+    if not versions_store.object_exists(key):
+        return False
+    cached_record = versions_store.read_object(key)["record"]
+    return cached_record["last_updated"] == record["last_updated"]
+
+
+def download_record_versions(id, versions_store=None):
+    """Download the versions of the record.
+
+    Previous versions of a HEPData record never change, so they are read from
+    ``versions_store`` when cached there and cached after being downloaded.
+    The latest version is cached by ``cache_record_version`` once processed.
+
+    Args: id (int): The id of the record.
+            versions_store (JsonStore): The versions cache.
+    Returns: dict: The record versions, or ``None`` if the latest version is
+        cached and was not updated since.
+    """
+    payload = download_record_version(id)
+    if versions_store and is_record_version_cached(versions_store, payload):
+        logger.info(f"Record {id} version {payload['record']['version']} is cached")
+        return None
 
     record = {"base": payload}
     for version in range(1, payload["record"]["version"]):
-        response = generic_http_hook.call_api(
-            endpoint=f"/record/ins{id}?format=json&version={version}"
-        )
-        response.raise_for_status()
-        record[version] = response.json()
+        key = _get_record_version_key(id, version)
+        if versions_store and versions_store.object_exists(key):
+            record[version] = versions_store.read_object(key)
+            continue
+
+        record[version] = download_record_version(id, version)
+        if versions_store:
+            versions_store.write_object(record[version], key=key)
 
     return record
 
 
+def download_records_versions(
+    ids, versions_store=None, max_workers=HEPDATA_MAX_CONCURRENT_DOWNLOADS
+):
+    """Download the versions of the records concurrently.
+
+    Args: ids (list): The ids of the records.
+            versions_store (JsonStore): The versions cache.
+            max_workers (int): Maximum number of records downloaded at once.
+    Returns: tuple: The downloaded records, the ids of the records whose
+        latest version is cached and the ids that failed to download.
+    """
+    records = []
+    cached_ids = []
+    failed_ids = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            id: executor.submit(download_record_versions, id, versions_store)
+            for id in ids
+        }
+        for id, future in futures.items():
+            try:
+                record = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error occurred while downloading versions for record {id}: {e}"
+                )
+                failed_ids.append(id)
+                continue
+
+            if record is None:
+                cached_ids.append(id)
+            else:
+                records.append(record)
+
+    return records, cached_ids, failed_ids
+
+
 def build_record(data_schema, payload):
     """Build the record from the payload.
 
@@ -88,20 +225,3 @@ def load_record(new_record):
         f"Data Record Updated: " f"{response.json()['metadata']['self']['$ref']}"
     )
     return response.json()
-
-
-def delay_calculator(record_count):
-    """Calculate the delay between requests based on the number of records.
-    This is done in order to prevent hitting the invenio API rate limit on hepdata
-    the limits are: 1000 per hour and 60 per minute.
-
-    Args: record_count (int): The number of records to process.
-
-    Returns: float: The delay in seconds.
-    """
-
-    if record_count < 60:
-        return 0
-    elif record_count < 1000:
-        return 1
-    return 3.6
@@ -1,56 +1,234 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from airflow.sdk.bases.hook import BaseHook
 from airflow.sdk.exceptions import AirflowSkipException
 from sickle import Sickle, oaiexceptions
+from sickle.iterator import OAIResponseIterator
 
 logger = logging.getLogger(__name__)
 
+LOAD_RECORDS_CHUNK_SIZE = 100
+OAIPMH_MAX_PARALLEL_SETS = 4
+
 
 def load_records(
     parsed_records,
     workflow_management_hook,
     workflow_type,
+    chunk_size=LOAD_RECORDS_CHUNK_SIZE,
 ):
     """Load built records into backoffice workflows.
 
+    The workflows are created in chunks of ``chunk_size`` through the bulk
+    create endpoint of the backoffice.
+
     Args:
         parsed_records (list): Built records to load.
         workflow_management_hook: Hook used to create workflows in backoffice.
         workflow_type (str): Workflow type assigned to each created workflow.
+        chunk_size (int): Number of workflows created per request.
 
     Returns:
         list: Records that failed to load.
     """
     failed_load_records = []
-    for record in parsed_records:
-        workflow_data = {
-            "data": record,
-            "workflow_type": workflow_type,
-        }
+    for start in range(0, len(parsed_records), chunk_size):
+        chunk = parsed_records[start : start + chunk_size]
+        workflows_data = [
+            {"data": record, "workflow_type": workflow_type} for record in chunk
+        ]
         try:
-            workflow_management_hook.post_workflow(
-                workflow_data=workflow_data,
+            response = workflow_management_hook.post_workflows(
+                workflows_data=workflows_data,
             )
         except Exception:
-            logger.exception(f"Failed to load record: {record}")
+            logger.exception(f"Failed to load {len(chunk)} records")
+            failed_load_records.extend(chunk)
+            continue
+
+        for error in response["errors"]:
+            record = chunk[error["index"]]
+            logger.error(f"Failed to load record: {record}: {error['errors']}")
             failed_load_records.append(record)
 
     return failed_load_records
 
 
-def fetch_records_oaipmh(
-    connection_id, metadata_prefix, sets, from_date, until_date=None
+def iter_oaipmh_pages(sickle, params):
+    """Iterate over the pages of an OAI-PMH ``ListRecords`` request.
+
+    Only one page of records is kept in memory at a time.
+
+    Args:
+        sickle (Sickle): The client of the OAI-PMH server.
+        params (dict): The OAI arguments of the first request, or the
+            ``resumptionToken`` of the page to start from.
+
+    Yields:
+        tuple: The records of the page and the resumption token of the next
+        page, ``None`` for the last page.
+    """
+    responses = OAIResponseIterator(sickle, {"verb": "ListRecords", **params})
+    record_class = sickle.class_mapping["ListRecords"]
+    for response in responses:
+        records = [
+            record_class(element)
+            for element in response.xml.iterfind(f".//{sickle.oai_namespace}record")
+        ]
+        resumption_token = responses.resumption_token
+        yield records, resumption_token.token if resumption_token else None
+
+
+def _write_checkpoint(checkpoint, checkpoint_store, checkpoint_key):
+    if checkpoint_store:
+        checkpoint_store.write_object(checkpoint, key=checkpoint_key)
+
+
+def _harvest_set_pages(
+    sickle,
+    params,
+    checkpoint,
+    process_records,
+    harvested_identifiers,
+    harvested_identifiers_lock,
+    checkpoint_store,
+    checkpoint_key,
+):
+    for records, resumption_token in iter_oaipmh_pages(sickle, params):
+        xml_records = []
+        with harvested_identifiers_lock:
+            for record in records:
+                if record.header.identifier in harvested_identifiers:
+                    continue
+                harvested_identifiers.add(record.header.identifier)
+                checkpoint["identifiers"].append(record.header.identifier)
+                xml_records.append(record.raw)
+
+        # the page is marked as in progress before its workflows are created,
+        # so that a crash while posting it does not create them twice on resume
+        checkpoint["page_in_progress"] = xml_records
+        _write_checkpoint(checkpoint, checkpoint_store, checkpoint_key)
+
+        failed_build_records, failed_load_records = process_records(xml_records)
+        checkpoint["failed_build_records"].extend(failed_build_records)
+        checkpoint["failed_load_records"].extend(failed_load_records)
+        checkpoint["page_in_progress"] = []
+        checkpoint["resumption_token"] = resumption_token
+        checkpoint["complete"] = resumption_token is None
+        checkpoint["harvested"] = len(checkpoint["identifiers"])
+        _write_checkpoint(checkpoint, checkpoint_store, checkpoint_key)
+    return checkpoint
+
+
+def _read_checkpoint(set_name, checkpoint_store, checkpoint_key):
+    checkpoint = {
+        "resumption_token": None,
+        "complete": False,
+        "harvested": 0,
+        "identifiers": [],
+        "page_in_progress": [],
+        "failed_build_records": [],
+        "failed_load_records": [],
+    }
+    if not checkpoint_store or not checkpoint_store.object_exists(checkpoint_key):
+        return checkpoint
+
+    checkpoint = checkpoint_store.read_object(checkpoint_key)
+    if checkpoint["page_in_progress"]:
+        logger.warning(
+            f"Harvest of set '{set_name}' stopped while loading "
+            f"{len(checkpoint['page_in_progress'])} records, reporting them as "
+            "failed instead of loading them again"
+        )
+        checkpoint["failed_load_records"].extend(checkpoint["page_in_progress"])
+        checkpoint["page_in_progress"] = []
+    return checkpoint
+
+
+def _harvest_set(
+    sickle,
+    set_name,
+    oaiargs,
+    checkpoint,
+    process_records,
+    harvested_identifiers,
+    harvested_identifiers_lock,
+    checkpoint_store=None,
+    checkpoint_key=None,
 ):
-    """Fetch the xml records for the given sets and date range from an OAI-PMH endpoint.
+    if checkpoint["complete"]:
+        logger.info(f"Set '{set_name}' was already harvested, skipping")
+        return checkpoint
+    if checkpoint["harvested"]:
+        logger.info(
+            f"Resuming set '{set_name}' after {checkpoint['harvested']} records"
+        )
+
+    harvest_args = (
+        checkpoint,
+        process_records,
+        harvested_identifiers,
+        harvested_identifiers_lock,
+        checkpoint_store,
+        checkpoint_key,
+    )
+    if not checkpoint["resumption_token"]:
+        return _harvest_set_pages(sickle, {"set": set_name, **oaiargs}, *harvest_args)
+
+    try:
+        return _harvest_set_pages(
+            sickle, {"resumptionToken": checkpoint["resumption_token"]}, *harvest_args
+        )
+    except oaiexceptions.BadResumptionToken:
+        # the records processed before the restart are skipped through the
+        # harvested identifiers, so they are neither loaded nor counted twice
+        logger.warning(
+            f"Resumption token of set '{set_name}' expired, harvesting it again"
+        )
+        checkpoint["resumption_token"] = None
+        return _harvest_set_pages(sickle, {"set": set_name, **oaiargs}, *harvest_args)
+
+
+def harvest_records_oaipmh(
+    connection_id,
+    metadata_prefix,
+    sets,
+    from_date,
+    process_records,
+    until_date=None,
+    checkpoint_store=None,
+    checkpoint_prefix=None,
+    max_workers=OAIPMH_MAX_PARALLEL_SETS,
+):
+    """Harvest the given sets and date range from an OAI-PMH endpoint page by page.
+
+    The sets are harvested in parallel and each page of records is handed to
+    ``process_records`` as soon as it is received. Records already harvested
+    from another set are skipped. When a ``checkpoint_store`` is given, the
+    resumption token and the processed identifiers of each set are persisted
+    after every page, so that a retried harvest resumes where the previous
+    attempt stopped without loading the same records twice. The records of a
+    page that was being loaded when the previous attempt stopped are reported
+    as failed to load. The checkpoints are deleted once all the sets have been
+    harvested.
+
     Args:
         connection_id (str): The connection id for the OAI-PMH server.
         metadata_prefix (str): The metadata prefix to use.
         sets (list): The sets to fetch records from.
         from_date (str): The date from which to fetch records (YYYY-MM-DD).
+        process_records (callable): Called with the xml records of each page,
+            returns a tuple of the records that failed to build and to load.
         until_date (str, optional): The date until which to fetch records (YYYY-MM-DD).
+        checkpoint_store (JsonStore, optional): The store of the checkpoints.
+        checkpoint_prefix (str, optional): The prefix of the checkpoints keys,
+            must be unique for the harvest (e.g. the dag and run ids).
+        max_workers (int): Maximum number of sets harvested in parallel.
     Returns:
-        tuple: A list of xml records and a list of sets that failed to be harvested.
+        dict: The ``failed_sets``, ``failed_build_records`` and
+        ``failed_load_records`` of the harvest.
     """
 
     conn = BaseHook.get_connection(connection_id)
@@ -63,31 +241,67 @@ def fetch_records_oaipmh(
     if until_date:
         oaiargs["until"] = until_date
 
-    harvested_records = {}
-    failed_sets = []
+    harvested_identifiers = set()
+    harvested_identifiers_lock = threading.Lock()
+    failures = {
+        "failed_sets": [],
+        "failed_build_records": [],
+        "failed_load_records": [],
+    }
 
-    for set_name in sets:
-        try:
+    checkpoint_keys = {
+        set_name: f"{checkpoint_prefix}/oaipmh/{set_name}.json" for set_name in sets
+    }
+    # all the checkpoints are read before harvesting, so that records processed
+    # by any set in a previous attempt are skipped by every set
+    checkpoints = {
+        set_name: _read_checkpoint(set_name, checkpoint_store, checkpoint_key)
+        for set_name, checkpoint_key in checkpoint_keys.items()
+    }
+    for checkpoint in checkpoints.values():
+        harvested_identifiers.update(checkpoint["identifiers"])
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for set_name in sets:
             logger.info(
                 f"Collecting records using connection '{connection_id}' "
                 f"({conn.host}) from {from_date} to {until_date} for set '{set_name}'"
             )
+            futures[set_name] = executor.submit(
+                _harvest_set,
+                sickle,
+                set_name,
+                oaiargs,
+                checkpoints[set_name],
+                process_records,
+                harvested_identifiers,
+                harvested_identifiers_lock,
+                checkpoint_store=checkpoint_store,
+                checkpoint_key=checkpoint_keys[set_name],
+            )
 
-            records = list(sickle.ListRecords(set=set_name, **oaiargs))
+        for set_name, future in futures.items():
+            try:
+                checkpoint = future.result()
+            except oaiexceptions.NoRecordsMatch:
+                logger.info(f"No records for '{set_name}'")
+                continue
+            except Exception:
+                logger.exception(f"Failed to harvest set '{set_name}'")
+                failures["failed_sets"].append(set_name)
+                continue
 
-        except oaiexceptions.NoRecordsMatch:
-            logger.info(f"No records for '{set_name}'")
-            continue
-        except Exception:
-            logger.exception(f"Failed to harvest set '{set_name}'")
-            failed_sets.append(set_name)
-            continue
+            logger.info(
+                f"Collected {checkpoint['harvested']} records for set '{set_name}'"
+            )
+            failures["failed_build_records"].extend(checkpoint["failed_build_records"])
+            failures["failed_load_records"].extend(checkpoint["failed_load_records"])
 
-        logger.info(f"Collected {len(records)} records for set '{set_name}'")
-        for record in records:
-            harvested_records[record.header.identifier] = record
+    if checkpoint_store:
+        checkpoint_store.delete_objects(list(checkpoint_keys.values()))
 
-    return [record.raw for record in harvested_records.values()], failed_sets
+    return failures
 
 
 def fetch_record_oaipmh_by_identifier(connection_id, metadata_prefix, identifier):
@@ -1,75 +1,315 @@
+import hashlib
 import json
+import logging
+import os
 import uuid
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from pathlib import Path
 from urllib.parse import urlparse
 
 from airflow.providers.amazon.aws.hooks.s3 import S3Hook
 from airflow.sdk import Variable
+from botocore.exceptions import ClientError
 
+logger = logging.getLogger(__name__)
 
-class S3JsonStore:
-    def __init__(self, aws_conn_id="s3_conn", bucket_name=None):
-        self.aws_conn_id = aws_conn_id
-        self._bucket_name = bucket_name
-        self._hook = None
+MAX_PENDING_WORKFLOW_PATCHES = 10
+MAX_WORKFLOW_READ_ATTEMPTS = 3
 
-    @property
-    def hook(self):
-        if self._hook is None:
-            self._hook = S3Hook(aws_conn_id=self.aws_conn_id)
-        return self._hook
+
+def _escape_json_pointer_token(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_json_pointer_token(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _is_same_json(source, target):
+    return type(source) is type(target) and source == target
+
+
+def make_json_patch(source, target, path=""):
+    """Compute the JSON-Patch (RFC 6902) transforming ``source`` into ``target``.
+
+    Objects are compared key by key, any other value (lists included) is
+    replaced as a whole when it changed.
+    """
+    if not isinstance(source, dict) or not isinstance(target, dict):
+        if _is_same_json(source, target):
+            return []
+        return [{"op": "replace", "path": path, "value": target}]
+
+    operations = [
+        {"op": "remove", "path": f"{path}/{_escape_json_pointer_token(key)}"}
+        for key in source
+        if key not in target
+    ]
+    for key, value in target.items():
+        key_path = f"{path}/{_escape_json_pointer_token(key)}"
+        if key not in source:
+            operations.append({"op": "add", "path": key_path, "value": value})
+        elif not _is_same_json(source[key], value):
+            operations.extend(make_json_patch(source[key], value, key_path))
+    return operations
+
+
+def apply_json_patch(document, operations):
+    """Apply a JSON-Patch computed by ``make_json_patch`` to ``document``."""
+    for operation in operations:
+        if not operation["path"]:
+            document = deepcopy(operation["value"])
+            continue
+        tokens = [
+            _unescape_json_pointer_token(token)
+            for token in operation["path"].split("/")[1:]
+        ]
+        target = document
+        for token in tokens[:-1]:
+            target = target[token]
+        if operation["op"] == "remove":
+            del target[tokens[-1]]
+        else:
+            target[tokens[-1]] = deepcopy(operation["value"])
+    return document
+
+
+class JsonStore(ABC):
+    """Base class of the stores keeping the workflow state as JSON objects.
+
+    Subclasses implement the raw storage primitives. On top of them the store
+    keeps a task-local cache of the workflows it read or wrote, keyed by the
+    version (ETag) of the stored object and its pending patches. Writing a
+    workflow that is still cached only uploads the JSON-Patch from the cached
+    version, the patches are applied on read and compacted into the workflow
+    at checkpoints.
+
+    Each patch is tagged with the version of the workflow it was written
+    against and only applies to that version, so that patches already
+    compacted into a newer version are never applied twice. A single listing
+    returns both the version of the workflow and its patches, which is all
+    that is needed to know if the cached workflow is still the stored one.
+    """
+
+    def __init__(self, max_pending_patches=MAX_PENDING_WORKFLOW_PATCHES):
+        self.max_pending_patches = max_pending_patches
+        self._workflows_cache = {}
 
     @property
+    @abstractmethod
     def bucket_name(self):
-        if self._bucket_name is None:
-            self._bucket_name = self.hook.service_config.get(
-                "bucket_name"
-            ) or Variable.get("s3_bucket_name")
-        return self._bucket_name
+        """Return the default bucket."""
 
-    def parse_s3_url(self, url):
-        bucket, key = urlparse(url).path.lstrip("/").split("/", 1)
-        return bucket, key
+    @abstractmethod
+    def _get_object(self, key, bucket_name):
+        """Return the content of the object and its version.
 
-    def initialize(self):
-        _ = self.hook
-        _ = self.bucket_name
+        Raises:
+            FileNotFoundError: if the object doesn't exist.
+        """
+
+    @abstractmethod
+    def _get_object_version(self, key, bucket_name):
+        """Return the version of the object, ``None`` if it doesn't exist."""
+
+    @abstractmethod
+    def _put_object(self, body, key, bucket_name, overwrite):
+        """Store the object and return its new version."""
+
+    @abstractmethod
+    def _list_objects(self, prefix, bucket_name):
+        """Return the versions of the objects under ``prefix`` by key."""
+
+    @abstractmethod
+    def _delete_keys(self, keys, bucket_name):
+        """Delete the objects."""
 
     def read_object(self, key, bucket_name=None):
         bucket = bucket_name or self.bucket_name
-        content = self.hook.get_key(key, bucket_name=bucket).get()
-        return json.loads(content["Body"].read().decode("utf-8"))
+        content, _version = self._get_object(key, bucket)
+        return json.loads(content)
+
+    def object_exists(self, key, bucket_name=None):
+        bucket = bucket_name or self.bucket_name
+        return self._get_object_version(key, bucket) is not None
+
+    def delete_objects(self, keys, bucket_name=None):
+        bucket = bucket_name or self.bucket_name
+        if keys:
+            self._delete_keys(keys, bucket)
 
     def write_object(self, data, key=None, bucket_name=None, overwrite=True):
         bucket = bucket_name or self.bucket_name
         object_key = key or str(uuid.uuid4())
-        self.hook.load_string(
-            json.dumps(data),
-            key=object_key,
-            bucket_name=bucket,
-            replace=overwrite,
-        )
+        self._put_object(json.dumps(data), object_key, bucket, overwrite)
         return object_key
 
-    def write_workflow(self, workflow_data, bucket_name=None, filename="workflow.json"):
+    def _get_workflow_patches_prefix(self, key):
+        return f"{key}.patches/"
+
+    def _get_version_token(self, version):
+        return hashlib.md5(version.encode("utf-8")).hexdigest()[:16]
+
+    def _list_workflow_objects(self, key, bucket_name):
+        """Return the version of the stored workflow and all its patches keys."""
+        objects = self._list_objects(key, bucket_name)
+        patches_prefix = self._get_workflow_patches_prefix(key)
+        patches_keys = sorted(
+            object_key
+            for object_key in objects
+            if object_key.startswith(patches_prefix)
+        )
+        return objects.get(key), patches_keys
+
+    def _get_version_patches_keys(self, key, patches_keys, version):
+        """Return the patches written against the given version of the workflow.
+
+        Patch keys are ``<sequence>-<version token>-<uuid>.json``, the others
+        were written against a previous version and are already compacted.
+        """
+        if version is None:
+            return []
+        token = self._get_version_token(version)
+        patches_prefix = self._get_workflow_patches_prefix(key)
+        return [
+            patch_key
+            for patch_key in patches_keys
+            if patch_key[len(patches_prefix) :].split("-")[1] == token
+        ]
+
+    def _cache_workflow(self, key, bucket_name, workflow_data, version, patches_keys):
+        self._workflows_cache[(bucket_name, key)] = {
+            "workflow": deepcopy(workflow_data),
+            "version": version,
+            "patches_keys": list(patches_keys),
+        }
+
+    def _write_full_workflow(self, workflow_data, key, bucket_name, patches_keys):
+        version = self._put_object(json.dumps(workflow_data), key, bucket_name, True)
+        if patches_keys:
+            self._delete_keys(patches_keys, bucket_name)
+        self._cache_workflow(key, bucket_name, workflow_data, version, [])
+
+    def _get_cached_workflow(self, key, bucket_name, version, patches_keys):
+        """Return the cached workflow if it is still the stored one."""
+        cached = self._workflows_cache.get((bucket_name, key))
+        if (
+            cached is not None
+            and cached["version"] == version
+            and cached["patches_keys"]
+            == self._get_version_patches_keys(key, patches_keys, version)
+        ):
+            return cached
+        return None
+
+    def write_workflow(
+        self,
+        workflow_data,
+        bucket_name=None,
+        filename="workflow.json",
+        checkpoint=False,
+    ):
+        """Store the workflow.
+
+        If the workflow was read or written before by this store, only the
+        changes since then are uploaded as a JSON-Patch, unless ``checkpoint``
+        is set, the patch isn't smaller than the workflow or there are already
+        ``max_pending_patches`` patches pending. In those cases the full
+        workflow is written and the pending patches are removed.
+        """
+        bucket = bucket_name or self.bucket_name
         key = f"{workflow_data['id']}/{filename}"
-        self.write_object(
-            workflow_data,
-            bucket_name=bucket_name,
-            key=key,
-            overwrite=True,
+        version, patches_keys = self._list_workflow_objects(key, bucket)
+        cached = self._get_cached_workflow(key, bucket, version, patches_keys)
+        if cached is None:
+            self._write_full_workflow(workflow_data, key, bucket, patches_keys)
+            return key
+
+        patch = make_json_patch(cached["workflow"], workflow_data)
+        if not patch and not (checkpoint and patches_keys):
+            logger.info("Workflow %s did not change, skipping write", key)
+            return key
+
+        version_patches_keys = cached["patches_keys"]
+        if checkpoint or len(version_patches_keys) >= self.max_pending_patches:
+            self._write_full_workflow(workflow_data, key, bucket, patches_keys)
+            return key
+
+        patch_body = json.dumps(patch)
+        if len(patch_body) * 2 > len(json.dumps(workflow_data)):
+            self._write_full_workflow(workflow_data, key, bucket, patches_keys)
+            return key
+
+        # patches written concurrently by other tasks must not be overwritten
+        patch_key = (
+            f"{self._get_workflow_patches_prefix(key)}"
+            f"{len(version_patches_keys) + 1:06d}-"
+            f"{self._get_version_token(version)}-{uuid.uuid4().hex}.json"
+        )
+        self._put_object(patch_body, patch_key, bucket, True)
+        self._cache_workflow(
+            key, bucket, workflow_data, version, version_patches_keys + [patch_key]
         )
         return key
 
     def read_workflow(self, workflow_id, bucket_name=None, filename="workflow.json"):
+        bucket = bucket_name or self.bucket_name
         key = f"{workflow_id}/{filename}"
-        return self.read_object(key=key, bucket_name=bucket_name)
+        for attempt in range(1, MAX_WORKFLOW_READ_ATTEMPTS + 1):
+            version, patches_keys = self._list_workflow_objects(key, bucket)
+            cached = self._get_cached_workflow(key, bucket, version, patches_keys)
+            if cached is not None:
+                return deepcopy(cached["workflow"])
 
-    def set_flag(self, flag, value, workflow_id, bucket_name=None):
+            # the workflow might have been compacted since it was listed, only
+            # the patches written against the version read apply to it
+            content, version = self._get_object(key, bucket)
+            version_patches_keys = self._get_version_patches_keys(
+                key, patches_keys, version
+            )
+            workflow_data = json.loads(content)
+            try:
+                for patch_key in version_patches_keys:
+                    patch_content, _patch_version = self._get_object(patch_key, bucket)
+                    workflow_data = apply_json_patch(
+                        workflow_data, json.loads(patch_content)
+                    )
+            except FileNotFoundError:
+                if attempt == MAX_WORKFLOW_READ_ATTEMPTS:
+                    raise
+                logger.info("Workflow %s was compacted while read, rereading", key)
+                continue
+            self._cache_workflow(
+                key, bucket, workflow_data, version, version_patches_keys
+            )
+            return workflow_data
+
+    def checkpoint_workflow(
+        self, workflow_id, bucket_name=None, filename="workflow.json"
+    ):
+        """Compact the pending patches of the workflow and return it."""
+        workflow_data = self.read_workflow(
+            workflow_id, bucket_name=bucket_name, filename=filename
+        )
+        self.write_workflow(
+            workflow_data, bucket_name=bucket_name, filename=filename, checkpoint=True
+        )
+        return workflow_data
+
+    def _read_flags(self, workflow_id, bucket_name=None):
         key = f"{workflow_id}/flags.json"
         try:
-            flags = self.read_object(key=key, bucket_name=bucket_name)
+            return self.read_object(key=key, bucket_name=bucket_name)
         except Exception:
-            flags = {}
+            return None
+
+    def set_flag(self, flag, value, workflow_id, bucket_name=None):
+        key = f"{workflow_id}/flags.json"
+        flags = self._read_flags(workflow_id, bucket_name=bucket_name)
+        if flags is not None and flag in flags and _is_same_json(flags[flag], value):
+            return
+        flags = flags or {}
         flags[flag] = value
         self.write_object(flags, key=key, bucket_name=bucket_name, overwrite=True)
 
@@ -80,6 +320,10 @@ class S3JsonStore:
 
     def set_flags(self, flags_dict, workflow_id, bucket_name=None):
         key = f"{workflow_id}/flags.json"
+        if _is_same_json(
+            self._read_flags(workflow_id, bucket_name=bucket_name), flags_dict
+        ):
+            return
         self.write_object(
             flags_dict,
             bucket_name=bucket_name,
@@ -87,6 +331,76 @@ class S3JsonStore:
             overwrite=True,
         )
 
+
+class S3JsonStore(JsonStore):
+    def __init__(
+        self,
+        aws_conn_id="s3_conn",
+        bucket_name=None,
+        max_pending_patches=MAX_PENDING_WORKFLOW_PATCHES,
+    ):
+        super().__init__(max_pending_patches=max_pending_patches)
+        self.aws_conn_id = aws_conn_id
+        self._bucket_name = bucket_name
+        self._hook = None
+
+    @property
+    def hook(self):
+        if self._hook is None:
+            self._hook = S3Hook(aws_conn_id=self.aws_conn_id)
+        return self._hook
+
+    @property
+    def bucket_name(self):
+        if self._bucket_name is None:
+            self._bucket_name = self.hook.service_config.get(
+                "bucket_name"
+            ) or Variable.get("s3_bucket_name")
+        return self._bucket_name
+
+    def parse_s3_url(self, url):
+        bucket, key = urlparse(url).path.lstrip("/").split("/", 1)
+        return bucket, key
+
+    def initialize(self):
+        _ = self.hook
+        _ = self.bucket_name
+
+    def _get_object(self, key, bucket_name):
+        try:
+            content = self.hook.conn.get_object(Bucket=bucket_name, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise FileNotFoundError(key) from e
+            raise
+        return content["Body"].read().decode("utf-8"), content["ETag"]
+
+    def _get_object_version(self, key, bucket_name):
+        response = self.hook.head_object(key, bucket_name=bucket_name)
+        return response["ETag"] if response else None
+
+    def _put_object(self, body, key, bucket_name, overwrite):
+        if not overwrite and self._get_object_version(key, bucket_name) is not None:
+            raise ValueError(f"The key {key} already exists.")
+        response = self.hook.conn.put_object(
+            Bucket=bucket_name,
+            Key=key,
+            Body=body.encode("utf-8"),
+            **self.hook.extra_args,
+        )
+        return response["ETag"]
+
+    def _list_objects(self, prefix, bucket_name):
+        paginator = self.hook.conn.get_paginator("list_objects_v2")
+        return {
+            s3_object["Key"]: s3_object["ETag"]
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+            for s3_object in page.get("Contents", [])
+        }
+
+    def _delete_keys(self, keys, bucket_name):
+        self.hook.delete_objects(bucket=bucket_name, keys=keys)
+
     def get_default_bucket_name(self):
         return self.bucket_name or self.hook.get_bucket().name
 
@@ -104,3 +418,68 @@ class S3JsonStore:
     def key_to_s3_url(self, key, bucket_name=None):
         s3_host = self.hook.conn.meta.endpoint_url
         return f"{s3_host}/{bucket_name or self.bucket_name}/{key}"
+
+
+class LocalJsonStore(JsonStore):
+    """Store keeping the objects on the local filesystem.
+
+    Buckets are directories of ``base_path``. Used for the state that only
+    has to live on the worker, like the HEPData versions cache, and to run
+    the workflow state handling without S3.
+    """
+
+    def __init__(
+        self,
+        base_path,
+        bucket_name="workflows",
+        max_pending_patches=MAX_PENDING_WORKFLOW_PATCHES,
+    ):
+        super().__init__(max_pending_patches=max_pending_patches)
+        self.base_path = Path(base_path)
+        self._bucket_name = bucket_name
+
+    @property
+    def bucket_name(self):
+        return self._bucket_name
+
+    def _get_path(self, key, bucket_name):
+        return self.base_path / bucket_name / key
+
+    def _get_object(self, key, bucket_name):
+        path = self._get_path(key, bucket_name)
+        return path.read_text(encoding="utf-8"), self._get_object_version(
+            key, bucket_name
+        )
+
+    def _get_object_version(self, key, bucket_name):
+        try:
+            stat = os.stat(self._get_path(key, bucket_name))
+        except FileNotFoundError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def _put_object(self, body, key, bucket_name, overwrite):
+        path = self._get_path(key, bucket_name)
+        if path.exists() and not overwrite:
+            raise ValueError(f"The key {key} already exists.")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body, encoding="utf-8")
+        return self._get_object_version(key, bucket_name)
+
+    def _list_objects(self, prefix, bucket_name):
+        bucket_path = self.base_path / bucket_name
+        prefix_path = bucket_path / prefix
+        # like S3, a prefix isn't limited to a "directory"
+        objects = {}
+        for path in prefix_path.parent.glob(f"{prefix_path.name}*"):
+            for file_path in path.rglob("*") if path.is_dir() else [path]:
+                if file_path.is_file():
+                    object_key = str(file_path.relative_to(bucket_path))
+                    objects[object_key] = self._get_object_version(
+                        object_key, bucket_name
+                    )
+        return objects
+
+    def _delete_keys(self, keys, bucket_name):
+        for key in keys:
+            self._get_path(key, bucket_name).unlink(missing_ok=True)
@@ -13,7 +13,7 @@ class TestCDSLiteratureHarvest:
     dag = dagbag.get_dag("cds_literature_harvest_dag")
 
     @patch(
-        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflow"
+        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
     )
     @pytest.mark.vcr
     def test_process_records(self, mock_post_workflow):
@@ -32,7 +32,8 @@ class TestCDSLiteratureHarvest:
         )
 
         failed_records = self.s3_store.read_object(result)
-        assert mock_post_workflow.call_count == 2
+        assert mock_post_workflow.call_count == 1
+        assert len(mock_post_workflow.call_args.kwargs["workflows_data"]) == 2
         assert len(failed_records["failed_sets"]) == 0
         assert len(failed_records["failed_build_records"]) == 0
         assert len(failed_records["failed_load_records"]) == 0
@@ -18,7 +18,7 @@ class TestCDSLiteratureSingleHarvest:
 
     @pytest.mark.vcr
     @patch(
-        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflow"
+        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
     )
     def test_process_records(self, mock_post_workflow):
         result = task_test(
@@ -1,14 +1,18 @@
+from unittest.mock import patch
 from urllib.parse import urlparse
 
 import orjson
 import pytest
 from airflow.models import DagBag
 from include.utils.data import (
+    TokenBucket,
     build_record,
-    delay_calculator,
+    cache_record_version,
     download_record_versions,
+    download_records_versions,
     load_record,
 )
+from include.utils.s3 import LocalJsonStore
 
 from tests.test_utils import task_test
 
@@ -19,12 +23,24 @@ dagbag = DagBag()
 class TestDataHarvest:
     dag = dagbag.get_dag("data_harvest_dag")
 
-    @pytest.mark.parametrize(
-        ("record_count", "expected_delay"),
-        [(0, 0), (59, 0), (60, 1), (999, 1), (1000, 3.6)],
-    )
-    def test_delay_calculator(self, record_count, expected_delay):
-        assert delay_calculator(record_count) == expected_delay
+    @patch("include.utils.data.time.sleep")
+    def test_token_bucket(self, mock_sleep):
+        token_bucket = TokenBucket(2, 60)
+
+        token_bucket.acquire()
+        token_bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        token_bucket.updated -= 30
+        token_bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        mock_sleep.side_effect = lambda seconds: setattr(
+            token_bucket, "updated", token_bucket.updated - seconds - 1
+        )
+        token_bucket.acquire()
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args.args[0] == pytest.approx(30, abs=1)
 
     @pytest.mark.vcr
     def test_collect_ids_param(self):
@@ -75,6 +91,53 @@ class TestDataHarvest:
         assert res["base"]["record"]["version"] == 3
         assert all(value in res for value in [1, 2])
 
+    @patch("include.utils.data.download_record_version")
+    def test_download_record_versions_uses_versions_cache(
+        self, mock_download_record_version, datadir, tmp_path
+    ):
+        versions = {
+            version: orjson.loads(
+                (datadir / f"ins1906174_version{version}.json").read_text()
+            )
+            for version in (1, 2, 3)
+        }
+        mock_download_record_version.side_effect = lambda id, version=None: versions[
+            version or 3
+        ]
+        versions_store = LocalJsonStore(tmp_path)
+
+        res = download_record_versions("1906174", versions_store)
+
+        assert res == {"base": versions[3], 1: versions[1], 2: versions[2]}
+        assert mock_download_record_version.call_count == 3
+
+        mock_download_record_version.reset_mock()
+        res = download_record_versions("1906174", versions_store)
+
+        assert res == {"base": versions[3], 1: versions[1], 2: versions[2]}
+        mock_download_record_version.assert_called_once_with("1906174")
+
+        cache_record_version(versions_store, versions[3])
+        mock_download_record_version.reset_mock()
+
+        assert download_record_versions("1906174", versions_store) is None
+        mock_download_record_version.assert_called_once_with("1906174")
+
+    @patch("include.utils.data.download_record_versions")
+    def test_download_records_versions(self, mock_download_record_versions):
+        records = {"1": {"base": {}}, "2": None}
+
+        def download(id, versions_store):
+            if id == "3":
+                raise ValueError("HEPData is down")
+            return records[id]
+
+        mock_download_record_versions.side_effect = download
+
+        res = download_records_versions(["1", "2", "3"])
+
+        assert res == ([{"base": {}}], ["2"], ["3"])
+
     def test_build_record(self, datadir):
         payload = {
             "1": orjson.loads((datadir / "ins1906174_version1.json").read_text()),
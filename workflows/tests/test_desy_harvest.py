@@ -7,7 +7,9 @@ from tenacity import Future, RetryError
 
 
 @pytest.mark.usefixtures("s3_desy_env")
-@patch("hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflow")
+@patch(
+    "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
+)
 class TestDesyHarvestDag:
     dag = get_bagged_dag(None, dag_id="desy_harvest_dag")
     process_subdirectories_task = dag.get_task(task_id="process_subdirectories")
@@ -28,11 +30,19 @@ class TestDesyHarvestDag:
             run_id="desy_test_success"
         )
 
-        assert mock_post_workflow.call_count == 20
+        assert mock_post_workflow.call_count == 2
+        assert (
+            sum(
+                len(call.kwargs["workflows_data"])
+                for call in mock_post_workflow.call_args_list
+            )
+            == 20
+        )
 
         at_least_one_document_updated = False
         for call in mock_post_workflow.call_args_list:
-            for _, wf in call.kwargs["workflow_data"].items():
+            for workflow_data in call.kwargs["workflows_data"]:
+                wf = workflow_data["data"]
                 if "documents" in wf:
                     assert self.output_bucket in wf["documents"][0]["url"]
                     at_least_one_document_updated = True
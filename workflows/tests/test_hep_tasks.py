@@ -1794,6 +1794,12 @@ class Test_HEPCreateDAG:
                             "$ref": "https://localhost:8080/api/literature/1674998"
                         },
                     },
+                    {
+                        "record": {"$ref": "https://localhost:8080/api/data/1906174"},
+                    },
+                    {
+                        "record": {"$ref": "https://localhost:8080/api/literature/foo"},
+                    },
                 ]
             },
         }
@@ -1803,7 +1809,7 @@ class Test_HEPCreateDAG:
 
         result = self.s3_store.read_workflow(self.workflow_id)
         assert result["reference_count"]["core"] == 2
-        assert result["reference_count"]["non_core"] == 1
+        assert result["reference_count"]["non_core"] == 2
 
     @pytest.mark.vcr
     def test_normalize_journal_titles_with_empty_data(self):
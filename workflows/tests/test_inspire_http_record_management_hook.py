@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+from hooks.inspirehep.inspire_http_record_management_hook import (
+    InspireHTTPRecordManagementHook,
+)
+from include.utils.constants import LITERATURE_PID_TYPE
+
+
+class TestGetRecord:
+    record = {"metadata": {"control_number": 1}, "revision_id": 3, "uuid": "uuid"}
+
+    def _mock_response(self, status_code, json_data=None):
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = json_data
+        return response
+
+    def test_get_record_revalidates_cached_record(self, tmp_path):
+        hook = InspireHTTPRecordManagementHook()
+        with patch.object(hook, "run_with_advanced_retry") as mock_run:
+            mock_run.return_value = self._mock_response(200, self.record)
+            assert (
+                hook.get_record(LITERATURE_PID_TYPE, 1, cache_path=tmp_path)
+                == self.record
+            )
+            assert mock_run.call_args.kwargs["headers"] is None
+
+            mock_run.return_value = self._mock_response(304)
+            assert (
+                hook.get_record(LITERATURE_PID_TYPE, 1, cache_path=tmp_path)
+                == self.record
+            )
+            assert mock_run.call_args.kwargs["headers"] == {"If-None-Match": '"3"'}
+
+    def test_get_record_replaces_outdated_cache(self, tmp_path):
+        hook = InspireHTTPRecordManagementHook()
+        updated_record = {**self.record, "revision_id": 4}
+        with patch.object(hook, "run_with_advanced_retry") as mock_run:
+            mock_run.return_value = self._mock_response(200, self.record)
+            hook.get_record(LITERATURE_PID_TYPE, 1, cache_path=tmp_path)
+
+            mock_run.return_value = self._mock_response(200, updated_record)
+            assert (
+                hook.get_record(LITERATURE_PID_TYPE, 1, cache_path=tmp_path)
+                == updated_record
+            )
+
+            mock_run.return_value = self._mock_response(304)
+            assert (
+                hook.get_record(LITERATURE_PID_TYPE, 1, cache_path=tmp_path)
+                == updated_record
+            )
+            assert mock_run.call_args.kwargs["headers"] == {"If-None-Match": '"4"'}
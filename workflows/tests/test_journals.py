@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock
+
+from include.inspire.journals import get_journal_kb
+
+
+class TestGetJournalKb:
+    journal_kb_data = {"PHYS REV LETT": "Phys.Rev.Lett."}
+
+    def _mock_response(self, status_code, json_data=None, etag=None):
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = json_data
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_get_journal_kb_caches_kb_on_disk(self, tmp_path):
+        cache_path = tmp_path / "journal_kb.json"
+        hook = MagicMock()
+        hook.call_api.return_value = self._mock_response(
+            200, {"journal_kb_data": self.journal_kb_data}, etag='"1-2025"'
+        )
+
+        assert get_journal_kb(hook, cache_path=cache_path) == self.journal_kb_data
+        assert hook.call_api.call_args.kwargs["headers"] is None
+        assert cache_path.exists()
+
+        hook.call_api.return_value = self._mock_response(304)
+
+        assert get_journal_kb(hook, cache_path=cache_path) == self.journal_kb_data
+        assert hook.call_api.call_args.kwargs["headers"] == {
+            "If-None-Match": '"1-2025"'
+        }
+
+    def test_get_journal_kb_replaces_outdated_cache(self, tmp_path):
+        cache_path = tmp_path / "journal_kb.json"
+        hook = MagicMock()
+        hook.call_api.return_value = self._mock_response(
+            200, {"journal_kb_data": {"OLD": "Old"}}, etag='"1-2025"'
+        )
+        get_journal_kb(hook, cache_path=cache_path)
+
+        hook.call_api.return_value = self._mock_response(
+            200, {"journal_kb_data": self.journal_kb_data}, etag='"2-2025"'
+        )
+
+        assert get_journal_kb(hook, cache_path=cache_path) == self.journal_kb_data
+        hook.call_api.return_value = self._mock_response(304)
+        assert get_journal_kb(hook, cache_path=cache_path) == self.journal_kb_data
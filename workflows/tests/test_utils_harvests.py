@@ -6,14 +6,30 @@ from airflow.models import DagBag
 from airflow.sdk.exceptions import AirflowException
 from hooks.backoffice.workflow_management_hook import HEP, WorkflowManagementHook
 from include.utils.constants import HEP_CREATE, HEP_PUBLISHER_CREATE
-from include.utils.harvests import fetch_records_oaipmh, load_records
-from sickle.oaiexceptions import NoRecordsMatch
+from include.utils.harvests import harvest_records_oaipmh, load_records
+from include.utils.s3 import LocalJsonStore
+from sickle.oaiexceptions import BadResumptionToken, NoRecordsMatch
 
 from tests.test_utils import task_test
 
 dagbag = DagBag()
 
 
+def collect_records(xml_records):
+    def process_records(records):
+        xml_records.extend(records)
+        return [], []
+
+    return process_records
+
+
+def mock_oai_record(identifier):
+    record = Mock()
+    record.header.identifier = identifier
+    record.raw = f"<record>{identifier}</record>"
+    return record
+
+
 @pytest.mark.usefixtures("hep_env")
 class TestUtilsHarvests:
     dag = dagbag.get_dag("arxiv_harvest_dag")
@@ -42,9 +58,9 @@ class TestUtilsHarvests:
         assert len(failed_load_records) == 1
 
     @patch(
-        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflow"
+        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
     )
-    def test_load_records_multiple(self, mock_post_workflow):
+    def test_load_records_multiple(self, mock_post_workflows):
         parsed_records = [
             {
                 "document_type": ["article"],
@@ -58,18 +74,53 @@ class TestUtilsHarvests:
             },
         ]
 
+        mock_post_workflows.return_value = {"workflows": [], "errors": []}
+
         failed_load_records = load_records(
             parsed_records,
             self.workflow_management_hook,
             workflow_type=HEP_CREATE,
         )
-        assert mock_post_workflow.call_count == 2
+        assert mock_post_workflows.call_count == 1
+        assert len(mock_post_workflows.call_args.kwargs["workflows_data"]) == 2
         assert len(failed_load_records) == 0
 
     @patch(
-        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflow"
+        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
+    )
+    def test_load_records_in_chunks(self, mock_post_workflows):
+        parsed_records = [
+            {
+                "document_type": ["article"],
+                "_collections": ["Literature"],
+                "titles": [{"title": f"Record {index}"}],
+            }
+            for index in range(5)
+        ]
+        mock_post_workflows.side_effect = [
+            {"workflows": [], "errors": [{"index": 1, "errors": {"data": []}}]},
+            requests.exceptions.ConnectionError("backoffice is down"),
+            {"workflows": [], "errors": []},
+        ]
+
+        failed_load_records = load_records(
+            parsed_records,
+            self.workflow_management_hook,
+            workflow_type=HEP_CREATE,
+            chunk_size=2,
+        )
+
+        assert mock_post_workflows.call_count == 3
+        assert failed_load_records == [
+            parsed_records[1],
+            parsed_records[2],
+            parsed_records[3],
+        ]
+
+    @patch(
+        "hooks.backoffice.workflow_management_hook.WorkflowManagementHook.post_workflows"
     )
-    def test_load_records_uses_custom_workflow_type(self, mock_post_workflow):
+    def test_load_records_uses_custom_workflow_type(self, mock_post_workflows):
         parsed_records = [
             {
                 "document_type": ["article"],
@@ -78,17 +129,21 @@ class TestUtilsHarvests:
             },
         ]
 
+        mock_post_workflows.return_value = {"workflows": [], "errors": []}
+
         failed_load_records = load_records(
             parsed_records,
             self.workflow_management_hook,
             workflow_type=HEP_PUBLISHER_CREATE,
         )
 
-        mock_post_workflow.assert_called_once_with(
-            workflow_data={
-                "data": parsed_records[0],
-                "workflow_type": HEP_PUBLISHER_CREATE,
-            }
+        mock_post_workflows.assert_called_once_with(
+            workflows_data=[
+                {
+                    "data": parsed_records[0],
+                    "workflow_type": HEP_PUBLISHER_CREATE,
+                }
+            ]
         )
         assert len(failed_load_records) == 0
 
@@ -126,87 +181,277 @@ class TestUtilsHarvests:
         )
 
     @pytest.mark.vcr
-    def test_fetch_records_oaipmh(self):
-        xml_records, failed_sets = fetch_records_oaipmh(
+    def test_harvest_records_oaipmh(self):
+        xml_records = []
+        failures = harvest_records_oaipmh(
             self.cds_connection_id,
             "marcxml",
             ["cerncds:atlas-pub"],
             "2026-02-24",
+            collect_records(xml_records),
             "2026-04-14",
         )
 
         assert len(xml_records)
         assert "oai:cds.cern.ch:2956726" in xml_records[0]
         assert "oai:cds.cern.ch:2957067" in xml_records[1]
-        assert failed_sets == []
+        assert failures == {
+            "failed_sets": [],
+            "failed_build_records": [],
+            "failed_load_records": [],
+        }
 
     @pytest.mark.vcr
-    def test_fetch_records_logical_date(self):
-        xml_records, failed_sets = fetch_records_oaipmh(
-            self.arxiv_connection_id, "arXiv", ["physics:hep-th"], "2025-07-01"
+    def test_harvest_records_logical_date(self):
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th"],
+            "2025-07-01",
+            collect_records(xml_records),
         )
 
         assert len(xml_records)
         assert "oai:arXiv.org:2101.11905" in xml_records[0]
         assert "oai:arXiv.org:2207.10712" in xml_records[1]
-        assert failed_sets == []
+        assert failures["failed_sets"] == []
 
     @pytest.mark.vcr
-    def test_fetch_records_with_from_until(self):
-        xml_records, failed_sets = fetch_records_oaipmh(
+    def test_harvest_records_with_from_until(self):
+        xml_records = []
+        failures = harvest_records_oaipmh(
             self.arxiv_connection_id,
             "arXiv",
             ["physics:hep-th"],
             "2025-07-01",
+            collect_records(xml_records),
             "2025-07-01",
         )
 
         assert len(xml_records)
         assert "oai:arXiv.org:2101.11905" in xml_records[0]
         assert "oai:arXiv.org:2207.10712" in xml_records[1]
-        assert failed_sets == []
+        assert failures["failed_sets"] == []
 
-    @patch("include.utils.harvests.Sickle.ListRecords", side_effect=NoRecordsMatch)
-    def test_fetch_no_records(self, mock_list_records):
-        xml_records, failed_sets = fetch_records_oaipmh(
-            self.arxiv_connection_id, "arXiv", ["physics:hep-th"], "2025-07-01"
+    @patch("include.utils.harvests.iter_oaipmh_pages", side_effect=NoRecordsMatch)
+    def test_harvest_no_records(self, mock_iter_pages):
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th"],
+            "2025-07-01",
+            collect_records(xml_records),
         )
 
         assert xml_records == []
-        assert failed_sets == []
+        assert failures["failed_sets"] == []
 
-    @patch("include.utils.harvests.Sickle.ListRecords")
-    def test_fetch_records_no_duplicates(self, mock_list_records):
-        mock_record = Mock()
-        mock_record.header.identifier = "oai:arXiv.org:2101.11905"
-        mock_record.raw = "<record>Test Record</record>"
-        mock_list_records.return_value = [mock_record, mock_record]
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_no_duplicates(self, mock_iter_pages):
+        mock_iter_pages.side_effect = lambda sickle, params: iter(
+            [([mock_oai_record("oai:arXiv.org:2101.11905")], None)]
+        )
 
-        xml_records, failed_sets = fetch_records_oaipmh(
+        xml_records = []
+        failures = harvest_records_oaipmh(
             self.arxiv_connection_id,
             "arXiv",
             ["physics:hep-th", "physics:astro-ph"],
             "2025-07-01",
+            collect_records(xml_records),
         )
         assert len(xml_records) == 1
-        assert failed_sets == []
-
-    @patch("include.utils.harvests.Sickle.ListRecords")
-    def test_fetch_records_failed_set(self, mock_list_records):
-        mock_record = Mock()
-        mock_record.header.identifier = "oai:arXiv.org:2101.11905"
-        mock_record.raw = "<record>Test Record</record>"
-        mock_list_records.side_effect = [
-            requests.exceptions.ConnectionError("arXiv is down"),
-            [mock_record],
-        ]
+        assert failures["failed_sets"] == []
+
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_failed_set(self, mock_iter_pages):
+        def iter_pages(sickle, params):
+            if params["set"] == "physics:hep-th":
+                raise requests.exceptions.ConnectionError("arXiv is down")
+            return iter([([mock_oai_record("oai:arXiv.org:2101.11905")], None)])
+
+        mock_iter_pages.side_effect = iter_pages
+
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th", "physics:astro-ph"],
+            "2025-07-01",
+            collect_records(xml_records),
+        )
+
+        assert xml_records == ["<record>oai:arXiv.org:2101.11905</record>"]
+        assert failures["failed_sets"] == ["physics:hep-th"]
+
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_checkpoints_every_page(self, mock_iter_pages, tmp_path):
+        checkpoint_store = LocalJsonStore(tmp_path)
+        checkpoint_key = "arxiv_harvest_dag/run/oaipmh/physics:hep-th.json"
+
+        def iter_pages(sickle, params):
+            yield [mock_oai_record("oai:arXiv.org:2101.11905")], "token-2"
+            checkpoint = checkpoint_store.read_object(checkpoint_key)
+            assert checkpoint["resumption_token"] == "token-2"
+            assert checkpoint["harvested"] == 1
+            yield [mock_oai_record("oai:arXiv.org:2207.10712")], None
+
+        mock_iter_pages.side_effect = iter_pages
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th"],
+            "2025-07-01",
+            collect_records(xml_records),
+            checkpoint_store=checkpoint_store,
+            checkpoint_prefix="arxiv_harvest_dag/run",
+        )
+
+        assert len(xml_records) == 2
+        assert failures["failed_sets"] == []
+        assert not checkpoint_store.object_exists(checkpoint_key)
+
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_resumes_from_checkpoint(self, mock_iter_pages, tmp_path):
+        checkpoint_store = LocalJsonStore(tmp_path)
+        checkpoint_store.write_object(
+            {
+                "resumption_token": "token-2",
+                "complete": False,
+                "harvested": 1,
+                "identifiers": ["oai:arXiv.org:2101.11905"],
+                "page_in_progress": [],
+                "failed_build_records": ["<record>bad</record>"],
+                "failed_load_records": [],
+            },
+            key="arxiv_harvest_dag/run/oaipmh/physics:hep-th.json",
+        )
+        mock_iter_pages.return_value = iter(
+            [([mock_oai_record("oai:arXiv.org:2207.10712")], None)]
+        )
+
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th"],
+            "2025-07-01",
+            collect_records(xml_records),
+            checkpoint_store=checkpoint_store,
+            checkpoint_prefix="arxiv_harvest_dag/run",
+        )
+
+        mock_iter_pages.assert_called_once()
+        assert mock_iter_pages.call_args.args[1] == {"resumptionToken": "token-2"}
+        assert xml_records == ["<record>oai:arXiv.org:2207.10712</record>"]
+        assert failures == {
+            "failed_sets": [],
+            "failed_build_records": ["<record>bad</record>"],
+            "failed_load_records": [],
+        }
+
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_resume_does_not_load_page_in_progress_twice(
+        self, mock_iter_pages, tmp_path
+    ):
+        checkpoint_store = LocalJsonStore(tmp_path)
+        checkpoint_store.write_object(
+            {
+                "resumption_token": "token-2",
+                "complete": False,
+                "harvested": 1,
+                "identifiers": [
+                    "oai:arXiv.org:2101.11905",
+                    "oai:arXiv.org:2207.10712",
+                ],
+                "page_in_progress": ["<record>oai:arXiv.org:2207.10712</record>"],
+                "failed_build_records": [],
+                "failed_load_records": [],
+            },
+            key="arxiv_harvest_dag/run/oaipmh/physics:hep-th.json",
+        )
 
-        xml_records, failed_sets = fetch_records_oaipmh(
+        def iter_pages(sickle, params):
+            if params.get("set") == "physics:astro-ph":
+                return iter([([mock_oai_record("oai:arXiv.org:2101.11905")], None)])
+            return iter(
+                [
+                    (
+                        [
+                            mock_oai_record("oai:arXiv.org:2207.10712"),
+                            mock_oai_record("oai:arXiv.org:2301.00001"),
+                        ],
+                        None,
+                    )
+                ]
+            )
+
+        mock_iter_pages.side_effect = iter_pages
+
+        xml_records = []
+        failures = harvest_records_oaipmh(
             self.arxiv_connection_id,
             "arXiv",
             ["physics:hep-th", "physics:astro-ph"],
             "2025-07-01",
+            collect_records(xml_records),
+            checkpoint_store=checkpoint_store,
+            checkpoint_prefix="arxiv_harvest_dag/run",
+        )
+
+        assert xml_records == ["<record>oai:arXiv.org:2301.00001</record>"]
+        assert failures == {
+            "failed_sets": [],
+            "failed_build_records": [],
+            "failed_load_records": ["<record>oai:arXiv.org:2207.10712</record>"],
+        }
+
+    @patch("include.utils.harvests.iter_oaipmh_pages")
+    def test_harvest_records_restarts_set_on_bad_resumption_token(
+        self, mock_iter_pages, tmp_path
+    ):
+        checkpoint_store = LocalJsonStore(tmp_path)
+        checkpoint_key = "arxiv_harvest_dag/run/oaipmh/physics:hep-th.json"
+        checkpoint_store.write_object(
+            {
+                "resumption_token": "expired-token",
+                "complete": False,
+                "harvested": 1,
+                "identifiers": ["oai:arXiv.org:2101.11905"],
+                "page_in_progress": [],
+                "failed_build_records": ["<record>oai:arXiv.org:2101.11905</record>"],
+                "failed_load_records": [],
+            },
+            key=checkpoint_key,
+        )
+
+        def iter_pages(sickle, params):
+            if "resumptionToken" in params:
+                raise BadResumptionToken()
+            yield [mock_oai_record("oai:arXiv.org:2101.11905")], "token-2"
+            checkpoint = checkpoint_store.read_object(checkpoint_key)
+            assert checkpoint["harvested"] == 1
+            yield [mock_oai_record("oai:arXiv.org:2207.10712")], None
+
+        mock_iter_pages.side_effect = iter_pages
+
+        xml_records = []
+        failures = harvest_records_oaipmh(
+            self.arxiv_connection_id,
+            "arXiv",
+            ["physics:hep-th"],
+            "2025-07-01",
+            collect_records(xml_records),
+            checkpoint_store=checkpoint_store,
+            checkpoint_prefix="arxiv_harvest_dag/run",
         )
 
-        assert xml_records == ["<record>Test Record</record>"]
-        assert failed_sets == ["physics:hep-th"]
+        assert xml_records == ["<record>oai:arXiv.org:2207.10712</record>"]
+        assert failures == {
+            "failed_sets": [],
+            "failed_build_records": ["<record>oai:arXiv.org:2101.11905</record>"],
+            "failed_load_records": [],
+        }
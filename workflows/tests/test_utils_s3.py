@@ -2,7 +2,12 @@ import uuid
 
 import pytest
 from airflow.sdk import Variable
-from include.utils.s3 import S3JsonStore
+from include.utils.s3 import (
+    LocalJsonStore,
+    S3JsonStore,
+    apply_json_patch,
+    make_json_patch,
+)
 
 
 @pytest.mark.usefixtures("s3_desy_env")
@@ -76,3 +81,144 @@ class TestS3Hook:
             prefix=subdir, bucket_name=src_bucket
         )
         assert src_objects == []
+
+
+class TestLocalJsonStore:
+    @pytest.fixture(autouse=True)
+    def _store(self, tmp_path):
+        self.store = LocalJsonStore(tmp_path)
+        self.patches_prefix = "test_workflow_id/workflow.json.patches/"
+        self.references = [
+            {"reference": {"title": {"title": f"Reference {index}"}}}
+            for index in range(100)
+        ]
+
+    def _get_patches_keys(self):
+        return list(self.store._list_objects(self.patches_prefix, "workflows"))
+
+    def test_write_workflow_writes_patch_for_cached_workflow(self):
+        workflow_data = {
+            "id": "test_workflow_id",
+            "data": {"titles": ["title"], "references": self.references},
+        }
+        self.store.write_workflow(workflow_data)
+
+        workflow_data["data"]["titles"] = ["new title"]
+        workflow_data["data"]["core"] = True
+        self.store.write_workflow(workflow_data)
+
+        assert len(self._get_patches_keys()) == 1
+        assert self.store.read_object("test_workflow_id/workflow.json") == {
+            "id": "test_workflow_id",
+            "data": {"titles": ["title"], "references": self.references},
+        }
+        assert (
+            LocalJsonStore(self.store.base_path).read_workflow("test_workflow_id")
+            == workflow_data
+        )
+
+    def test_write_workflow_skips_unchanged_workflow(self):
+        workflow_data = {"id": "test_workflow_id", "data": {"titles": ["title"]}}
+        self.store.write_workflow(workflow_data)
+        version = self.store._get_object_version(
+            "test_workflow_id/workflow.json", "workflows"
+        )
+
+        self.store.write_workflow(self.store.read_workflow("test_workflow_id"))
+
+        assert self._get_patches_keys() == []
+        assert version == self.store._get_object_version(
+            "test_workflow_id/workflow.json", "workflows"
+        )
+
+    def test_write_workflow_writes_full_workflow_if_changed_by_other_store(self):
+        workflow_data = {"id": "test_workflow_id", "data": {"titles": ["title"]}}
+        self.store.write_workflow(workflow_data)
+        other_workflow_data = {"id": "test_workflow_id", "data": {"core": True}}
+        LocalJsonStore(self.store.base_path).write_workflow(other_workflow_data)
+
+        workflow_data["data"]["titles"] = ["new title"]
+        self.store.write_workflow(workflow_data)
+
+        assert self._get_patches_keys() == []
+        assert self.store.read_object("test_workflow_id/workflow.json") == (
+            workflow_data
+        )
+
+    def test_checkpoint_workflow_compacts_patches(self):
+        workflow_data = {
+            "id": "test_workflow_id",
+            "data": {"titles": ["title"], "references": self.references},
+        }
+        self.store.write_workflow(workflow_data)
+        for index in range(3):
+            workflow_data["data"][f"key{index}"] = index
+            self.store.write_workflow(workflow_data)
+        assert len(self._get_patches_keys()) == 3
+
+        result = self.store.checkpoint_workflow("test_workflow_id")
+
+        assert result == workflow_data
+        assert self._get_patches_keys() == []
+        assert self.store.read_object("test_workflow_id/workflow.json") == (
+            workflow_data
+        )
+
+    def test_read_workflow_ignores_patches_of_previous_version(self):
+        workflow_data = {
+            "id": "test_workflow_id",
+            "data": {"titles": ["title"], "references": self.references},
+        }
+        self.store.write_workflow(workflow_data)
+        workflow_data["data"]["titles"] = ["new title"]
+        self.store.write_workflow(workflow_data)
+        (stale_patch_key,) = self._get_patches_keys()
+        stale_patch = self.store._get_object(stale_patch_key, "workflows")[0]
+
+        # a reader listed the patch before it was compacted by the checkpoint
+        other_store = LocalJsonStore(self.store.base_path)
+        workflow_data["data"]["titles"] = ["checkpointed title"]
+        other_store.write_workflow(workflow_data, checkpoint=True)
+        self.store._put_object(stale_patch, stale_patch_key, "workflows", False)
+
+        assert (
+            LocalJsonStore(self.store.base_path).read_workflow("test_workflow_id")
+            == workflow_data
+        )
+
+        workflow_data["data"]["core"] = True
+        other_store.write_workflow(workflow_data)
+
+        assert len(self._get_patches_keys()) == 2
+        assert (
+            LocalJsonStore(self.store.base_path).read_workflow("test_workflow_id")
+            == workflow_data
+        )
+
+    def test_set_flag_does_not_rewrite_unchanged_flags(self):
+        self.store.set_flag("approved", True, "test_workflow_id")
+        version = self.store._get_object_version(
+            "test_workflow_id/flags.json", "workflows"
+        )
+
+        self.store.set_flag("approved", True, "test_workflow_id")
+
+        assert version == self.store._get_object_version(
+            "test_workflow_id/flags.json", "workflows"
+        )
+        assert self.store.get_flag("approved", "test_workflow_id") is True
+
+
+def test_make_and_apply_json_patch():
+    source = {"data": {"titles": ["title"], "a/b": 1, "removed": 2}, "id": 1}
+    target = {"data": {"titles": ["new title"], "a/b": 2, "added": 3}, "id": 1}
+
+    patch = make_json_patch(source, target)
+
+    assert patch == [
+        {"op": "remove", "path": "/data/removed"},
+        {"op": "replace", "path": "/data/titles", "value": ["new title"]},
+        {"op": "replace", "path": "/data/a~1b", "value": 2},
+        {"op": "add", "path": "/data/added", "value": 3},
+    ]
+    assert apply_json_patch(source, patch) == target